@@ -1,7 +1,9 @@
 import streamlit as st
 import json
 from video_judge import VideoGenArena, VideoGenModelConfig, OpenAIJudge, OpenAIDecomposer, ClaudeDecomposer, ClaudeJudge, GeminiDecomposer, GeminiJudge, BaseDecomposer, BaseJudge
+from video_judge.models import ArenaReport, ArenaRun, ArenaRunFailure, ProgressEvent
 from video_judge.config.logger import setup_default_logging
+from video_judge.decomposer import DecompositionCache
 JUDGES = {
     "OpenAI": OpenAIJudge,
     "Gemini": GeminiJudge,
@@ -32,19 +34,39 @@ decomposer_selection = st.selectbox(label="Prompt Decomposer Model (model used t
     "OpenAI", "Claude", "Gemini"])
 prompt = st.text_area(label="Video Generation Prompt", value="A sleek sci-fi rocketship launching vertically from the center of a vast lavender field at sunset. Endless rows of blooming purple lavender stretch toward the horizon, gently swaying from the rocket’s exhaust. The sky is filled with soft purple and pink clouds, glowing with warm golden sunset light. The rocket emits a bright white-violet flame and glowing thrusters, creating swirling dust and petals near the ground. Cinematic wide shot, epic scale, fantasy sci-fi atmosphere, soft volumetric lighting, shallow haze near the horizon, high detail, smooth motion, dramatic yet serene mood.")
 if st.button("Fight!"):
-    with st.spinner("Generating videos and running evals..."):
-        judge: BaseJudge = JUDGES[judge_selection]()
-        decomposer: BaseDecomposer = DECOMPOSERS[decomposer_selection]()
-        decomposition = decomposer.decompose(user_prompt=prompt)
-        # orchestrator = VideoEvaluationOrchestrator(
-        #     video_gen_prompt=prompt, prompt_decomposition=decomposition)
-        configs = [
-            VideoGenModelConfig(provider=available_models[m]["provider"], model_id=m) for m in selected_models
-        ]
-        arena = VideoGenArena(model_configs=configs, judge=judge)
-        result = arena.fight(
-            video_gen_prompt=prompt, existing_video_path=None, prompt_decomposition=decomposition)
-        st.session_state["latest_result"] = result
+    judge: BaseJudge = JUDGES[judge_selection]()
+    decomposer: BaseDecomposer = DECOMPOSERS[decomposer_selection](cache=DecompositionCache())
+    configs = [
+        VideoGenModelConfig(provider=available_models[m]["provider"], model_id=m) for m in selected_models
+    ]
+    # The prompt is decomposed while the videos generate
+    arena = VideoGenArena(model_configs=configs, judge=judge, decomposer=decomposer)
+
+    st.subheader("Live Progress")
+    status_slots = {m: st.empty() for m in selected_models}
+    for m, slot in status_slots.items():
+        slot.info(f"**{m}**: waiting")
+    finished = st.container()
+    result = None
+    for item in arena.stream(video_gen_prompt=prompt, existing_video_path=None):
+        if isinstance(item, ProgressEvent):
+            if item.stage == "criterion_judged":
+                text = f"judged {item.criterion.replace('_', ' ')}: {item.score:.2f}"
+            elif item.progress is not None:
+                text = f"{item.stage} ({item.progress:.0f}%)"
+            else:
+                text = item.stage
+            status_slots[item.model].info(f"**{item.model}**: {text}")
+        elif isinstance(item, ArenaRun):
+            status_slots[item.model].success(
+                f"**{item.model}**: done — overall {item.report.scores['overall']:.3f}")
+            with finished:
+                st.video(item.report.video_path, width=300)
+        elif isinstance(item, ArenaRunFailure):
+            status_slots[item.model].error(f"**{item.model}**: {item.error_type}: {item.error}")
+        elif isinstance(item, ArenaReport):
+            result = item
+    st.session_state["latest_result"] = result
     st.success(f"Evaluation complete! Winner: {result.winner}")
     st.rerun()
 
@@ -0,0 +1,66 @@
+"""Compare contact-sheet packing against one image per frame.
+
+For each video, judges every criterion twice (individual frames, then packed
+contact sheets) and reports estimated image tokens and score agreement.
+
+Usage:
+    python examples/benchmark_contact_sheets.py output/videos/*.mp4 --prompt "..." --judge openai
+    python examples/benchmark_contact_sheets.py clip.mp4 --prompt "..." --estimate-only
+"""
+import argparse
+import statistics
+
+from video_judge import ClaudeJudge, GeminiJudge, OpenAIJudge, VideoEvaluationOrchestrator
+from video_judge.config.logger import setup_default_logging
+from video_judge.models import FramePacking
+from video_judge.cost import FALLBACK_IMAGE_SIZE, image_size, image_tokens
+JUDGES = {"openai": OpenAIJudge, "gemini": GeminiJudge, "claude": ClaudeJudge}
+
+
+def payload_image_tokens(provider, images):
+    return sum(image_tokens(provider, *(image_size(img) or FALLBACK_IMAGE_SIZE)) for img in images)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("videos", nargs="+")
+    parser.add_argument("--prompt", required=True, help="Prompt the videos were generated from")
+    parser.add_argument("--judge", choices=JUDGES, default="openai")
+    parser.add_argument("--columns", type=int, default=3)
+    parser.add_argument("--rows", type=int, default=3)
+    parser.add_argument("--tile-width", type=int, default=512)
+    parser.add_argument("--estimate-only", action="store_true", help="Skip judge calls")
+    args = parser.parse_args()
+    setup_default_logging(level=30)
+
+    packing = FramePacking(columns=args.columns, rows=args.rows, tile_width=args.tile_width)
+    judge = JUDGES[args.judge]()
+    deltas = []
+    for video in args.videos:
+        single = VideoEvaluationOrchestrator(video_gen_prompt=args.prompt, existing_video_path=video)
+        packed = VideoEvaluationOrchestrator(
+            video_gen_prompt=args.prompt, existing_video_path=video, frame_packing=packing)
+        single_images, single_prompts = single.create_judge_input_from_video()
+        packed_images, packed_prompts = packed.create_judge_input_from_video()
+        single_tokens = payload_image_tokens(judge.provider, single_images)
+        packed_tokens = payload_image_tokens(judge.provider, packed_images)
+        print(f"{video}: {len(single_images)} frames ~{single_tokens} tokens | "
+              f"{len(packed_images)} sheets ~{packed_tokens} tokens "
+              f"({packed_tokens / single_tokens:.0%})")
+        if args.estimate_only:
+            continue
+
+        single_report = single.run_nodes(images=single_images, user_prompts=single_prompts, judge=judge)
+        packed_report = packed.run_nodes(images=packed_images, user_prompts=packed_prompts, judge=judge)
+        for criterion, score in single_report.scores.items():
+            delta = packed_report.scores[criterion] - score
+            deltas.append(abs(delta))
+            print(f"  {criterion:22s} frames={score:.2f} sheets={packed_report.scores[criterion]:.2f} "
+                  f"delta={delta:+.2f}")
+
+    if deltas:
+        print(f"Mean absolute score delta: {statistics.mean(deltas):.3f} over {len(deltas)} scores")
+
+
+if __name__ == "__main__":
+    main()
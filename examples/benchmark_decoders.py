@@ -0,0 +1,62 @@
+"""Compare the OpenCV and ffmpeg-pipe frame decoders.
+
+For each video, samples the same frame specs with both decoders and reports
+wall time per decoder plus the mean pixel difference between their frames.
+
+Usage:
+    python examples/benchmark_decoders.py output/videos/*.mp4
+    python examples/benchmark_decoders.py clip.mp4 --num-frames 16 --max-width 512 --repeat 5
+"""
+import argparse
+import statistics
+import time
+
+import cv2
+import numpy as np
+
+from video_judge.config.logger import setup_default_logging
+from video_judge.models import FrameSampling
+from video_judge.process import sample_frame_views
+
+DECODERS = ("opencv", "ffmpeg")
+
+
+def pixel_difference(a, b):
+    diffs = []
+    for fa, fb in zip(a, b):
+        da = cv2.imdecode(np.frombuffer(fa.image, dtype=np.uint8), cv2.IMREAD_COLOR)
+        db = cv2.imdecode(np.frombuffer(fb.image, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if da.shape == db.shape:
+            diffs.append(np.abs(da.astype(np.int16) - db).mean())
+    return statistics.mean(diffs) if diffs else float("nan")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("videos", nargs="+")
+    parser.add_argument("--num-frames", type=int, default=8)
+    parser.add_argument("--max-width", type=int, default=None, help="Scale frames (in the decoder for ffmpeg)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    setup_default_logging()
+
+    specs = {"frames": FrameSampling(num_frames=args.num_frames, max_width=args.max_width)}
+    totals = {decoder: [] for decoder in DECODERS}
+    for video in args.videos:
+        times, views = {}, {}
+        for decoder in DECODERS:
+            runs = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                views[decoder] = sample_frame_views(video, specs, decoder=decoder)["frames"]
+                runs.append(time.perf_counter() - start)
+            times[decoder] = statistics.median(runs)
+            totals[decoder].append(times[decoder])
+        print(f"{video}: opencv {times['opencv'] * 1000:.0f}ms, ffmpeg {times['ffmpeg'] * 1000:.0f}ms, "
+              f"mean pixel diff {pixel_difference(views['opencv'], views['ffmpeg']):.2f}")
+
+    print(f"total: opencv {sum(totals['opencv']):.2f}s, ffmpeg {sum(totals['ffmpeg']):.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Compare the offline heuristic decomposer with an LLM decomposer.
+
+For every prompt in the suite, both decomposers run and the script reports
+per-prompt latency and per-field agreement: list fields score the F1 of
+phrases matched by word overlap (Jaccard >= --match), time_of_day scores an
+exact match. Use --offline-only to time the heuristic without API keys.
+
+Usage:
+    python examples/benchmark_offline_decomposer.py --reference openai
+    python examples/benchmark_offline_decomposer.py prompts/video_gen_prompts.txt --offline-only
+"""
+import argparse
+import statistics
+import time
+
+from video_judge import ClaudeDecomposer, GeminiDecomposer, OpenAIDecomposer
+from video_judge.offline_decomposer import OfflineDecomposer
+
+REFERENCES = {"openai": OpenAIDecomposer, "gemini": GeminiDecomposer, "claude": ClaudeDecomposer}
+LIST_FIELDS = ["entities", "actions", "locations", "style_attributes"]
+
+
+def _words(phrase):
+    return set(phrase.lower().replace("-", " ").split())
+
+
+def _matches(items, others, threshold):
+    return sum(
+        any(len(_words(a) & _words(b)) / len(_words(a) | _words(b)) >= threshold for b in others)
+        for a in items
+    )
+
+
+def field_f1(offline, reference, threshold):
+    if not offline and not reference:
+        return 1.0
+    precision = _matches(offline, reference, threshold) / len(offline) if offline else 0.0
+    recall = _matches(reference, offline, threshold) / len(reference) if reference else 0.0
+    return 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+
+
+def timed(decomposer, prompt):
+    start = time.perf_counter()
+    result = decomposer.decompose(prompt)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("prompts", nargs="?", default="prompts/video_gen_prompts.txt",
+                        help="Prompt suite, prompts separated by '---' lines")
+    parser.add_argument("--reference", choices=REFERENCES, default="openai")
+    parser.add_argument("--match", type=float, default=0.5, help="Word-overlap threshold for matching phrases")
+    parser.add_argument("--offline-only", action="store_true")
+    args = parser.parse_args()
+
+    with open(args.prompts) as f:
+        prompts = [p.strip() for p in f.read().split("---") if p.strip()]
+    offline = OfflineDecomposer()
+    reference = None if args.offline_only else REFERENCES[args.reference]()
+
+    offline_times, reference_times = [], []
+    agreement = {field: [] for field in LIST_FIELDS + ["time_of_day"]}
+    for i, prompt in enumerate(prompts):
+        ours, offline_s = timed(offline, prompt)
+        offline_times.append(offline_s)
+        line = f"[{i}] offline {offline_s * 1000:.2f}ms"
+        if reference:
+            theirs, reference_s = timed(reference, prompt)
+            reference_times.append(reference_s)
+            for field in LIST_FIELDS:
+                agreement[field].append(field_f1(getattr(ours, field), getattr(theirs, field), args.match))
+            agreement["time_of_day"].append(float(ours.time_of_day == theirs.time_of_day))
+            line += f", {args.reference} {reference_s * 1000:.0f}ms, " + ", ".join(
+                f"{field} {scores[-1]:.2f}" for field, scores in agreement.items())
+        print(line)
+        if args.offline_only:
+            print(f"    {ours.model_dump()}")
+
+    print(f"\nOffline: median {statistics.median(offline_times) * 1000:.2f}ms per prompt")
+    if reference:
+        print(f"{args.reference}: median {statistics.median(reference_times) * 1000:.0f}ms per prompt")
+        for field, scores in agreement.items():
+            print(f"  {field:<18} agreement {statistics.mean(scores):.2f}")
+
+
+if __name__ == "__main__":
+    main()
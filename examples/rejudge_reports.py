@@ -0,0 +1,54 @@
+"""Re-judge only the stale criteria of stored arena reports.
+
+A criterion is stale when its prompt template changed since it was judged or
+when it was judged by a different model. Updated reports (with re-ranked
+fights) are written next to the originals with a suffix, or in place.
+
+Usage:
+    python examples/rejudge_reports.py "output/arena_report_*.json" --judge openai
+    python examples/rejudge_reports.py "output/arena_report_*.json" --judge claude --in-place --dry-run
+"""
+import argparse
+import glob
+
+from video_judge import ClaudeJudge, GeminiJudge, OpenAIJudge
+from video_judge.config.logger import setup_default_logging
+from video_judge.rejudge import Rejudger, stale_criteria
+from video_judge.rescoring import load_arena_reports
+
+JUDGES = {"openai": OpenAIJudge, "gemini": GeminiJudge, "claude": ClaudeJudge}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("reports", help="Glob of ArenaReport JSON files")
+    parser.add_argument("--judge", choices=JUDGES, default="openai")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--in-place", action="store_true", help="Overwrite the report files")
+    parser.add_argument("--dry-run", action="store_true", help="Only list stale (video, criterion) pairs")
+    args = parser.parse_args()
+    setup_default_logging()
+
+    paths = sorted(glob.glob(args.reports))
+    reports = load_arena_reports(paths)
+    judge = JUDGES[args.judge]()
+
+    for report in reports:
+        for run in report.results:
+            stale = stale_criteria(run.report, judge)
+            if stale:
+                print(f"{run.report.video_path}: {', '.join(stale)}")
+    if args.dry_run:
+        return
+
+    updated = Rejudger(judge, max_workers=args.workers).rejudge_arena_reports(reports)
+    for path, before, after in zip(paths, reports, updated):
+        out = path if args.in_place else path.replace(".json", ".rejudged.json")
+        with open(out, "w") as f:
+            f.write(after.model_dump_json(indent=2))
+        note = "" if before.winner == after.winner else f" (winner {before.winner} -> {after.winner})"
+        print(f"Wrote {out}{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ from video_judge import (
     OpenAIDecomposer
 )
 from video_judge.config.logger import setup_default_logging
+from video_judge.decomposer import DecompositionCache
 from datetime import datetime
 
 setup_default_logging(level=20)
@@ -15,8 +16,8 @@ prompt = "A sleek sci-fi rocketship launching vertically from the center of a va
 with open("model_config.json", "r") as f:
     model_config_data = json.load(f)
 
-decomposer = OpenAIDecomposer()
-prompt_decomposition = decomposer.decompose(user_prompt=prompt)
+# Cached on disk; runs alongside video generation inside the arena
+decomposer = OpenAIDecomposer(cache=DecompositionCache())
 judge = OpenAIJudge()
 
 # configs = [VideoGenModelConfig(provider="openai", model_id="sora-2"), VideoGenModelConfig(
@@ -24,9 +25,8 @@ judge = OpenAIJudge()
 configs = [
     VideoGenModelConfig(provider=model_config["provider"], model_id=model_config["model_id"]) for model_config in model_config_data["models"]
 ]
-arena = VideoGenArena(model_configs=configs, judge=judge)
+arena = VideoGenArena(model_configs=configs, judge=judge, decomposer=decomposer)
 result = arena.fight(video_gen_prompt=prompt,
-                     prompt_decomposition=prompt_decomposition,
                      existing_video_path=None
                      )
 with open(f"output/arena_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json", "w") as f:
@@ -1,7 +1,9 @@
+import threading
+import time
 import pytest
 from unittest.mock import MagicMock, patch
 from video_judge.arena import VideoGenArena
-from video_judge.models import VideoGenModelConfig, Report, ArenaReport
+from video_judge.models import VideoGenModelConfig, Report, ArenaReport, ArenaRun
 
 
 def _make_report(overall: float) -> Report:
@@ -138,3 +140,312 @@ class TestArenaFight:
 
             with pytest.raises(RuntimeError, match="All models failed"):
                 arena.fight(orchestrator)
+
+    def test_retries_failed_model(self):
+        """With retries, a transient failure should be retried instead of recorded."""
+        configs = [VideoGenModelConfig(provider="fal", model_id="flaky")]
+        arena = VideoGenArena(model_configs=configs, judge=MagicMock())
+
+        with patch.object(arena, "_video_generator_factory") as factory, \
+             patch("video_judge.arena.VideoEvaluationOrchestrator") as MockOrch:
+            gen = MagicMock()
+            gen.model = "flaky"
+            gen.cancel_event = threading.Event()
+            factory.return_value = [gen]
+
+            mock_orch_instance = MagicMock()
+            mock_orch_instance.run.side_effect = [RuntimeError("blip"), _make_report(0.5)]
+            MockOrch.return_value = mock_orch_instance
+
+            result = arena.fight("test", run_id="abc", retries=1)
+
+        assert result.winner == "flaky"
+        assert result.run_id == "abc"
+        assert MockOrch.call_args.kwargs["run_id"] == "abc-flaky"
+
+
+class TestArenaDeadlines:
+    def test_straggler_is_cancelled_and_reported(self):
+        """A model past its provider deadline is cancelled; the finished model still wins."""
+        configs = [
+            VideoGenModelConfig(provider="openai", model_id="slow"),
+            VideoGenModelConfig(provider="fal", model_id="fast"),
+        ]
+        arena = VideoGenArena(model_configs=configs, judge=MagicMock())
+
+        def run(self_gen):
+            if self_gen.model == "slow":
+                self_gen.cancel_event.wait(5)
+                raise TimeoutError("cancelled")
+            return _make_report(0.4)
+
+        with patch.object(arena, "_video_generator_factory") as factory, \
+             patch("video_judge.arena.VideoEvaluationOrchestrator") as MockOrch:
+            gens = []
+            for model, provider in (("slow", "openai"), ("fast", "fal")):
+                gen = MagicMock()
+                gen.model = model
+                gen.provider = provider
+                gen.cancel_event = threading.Event()
+                gen.cancel.side_effect = gen.cancel_event.set
+                gens.append(gen)
+            factory.return_value = gens
+            MockOrch.side_effect = lambda **kw: MagicMock(
+                run=lambda judge, video_generator: run(video_generator))
+
+            start = time.monotonic()
+            result = arena.fight("test", provider_deadlines_s={"openai": 0.2})
+
+        assert time.monotonic() - start < 2
+        assert result.winner == "fast"
+        assert result.failures[0].model == "slow"
+        assert result.failures[0].error_type == "TimeoutError"
+        gens[0].cancel.assert_called_once()
+
+    def test_hanging_provider_cancel_does_not_block_the_loop(self):
+        configs = [VideoGenModelConfig(provider="openai", model_id="slow"),
+                   VideoGenModelConfig(provider="fal", model_id="fast")]
+        arena = VideoGenArena(model_configs=configs, judge=MagicMock())
+        release = threading.Event()
+
+        def run(gen):
+            if gen.model == "slow":
+                gen.cancel_event.wait(5)
+                raise TimeoutError("cancelled")
+            time.sleep(0.5)
+            return _make_report(0.4)
+
+        with patch.object(arena, "_video_generator_factory") as factory, \
+             patch("video_judge.arena.VideoEvaluationOrchestrator") as MockOrch:
+            gens = []
+            for model in ("slow", "fast"):
+                gen = MagicMock(model=model, provider="openai" if model == "slow" else "fal")
+                gen.cancel_event = threading.Event()
+                # Provider-side cancel request hangs
+                gen.cancel.side_effect = lambda: release.wait(5)
+                gens.append(gen)
+            factory.return_value = gens
+            MockOrch.side_effect = lambda **kw: MagicMock(
+                run=lambda judge, video_generator: run(video_generator))
+
+            start = time.monotonic()
+            items = [type(item).__name__ for item in arena.stream("test", provider_deadlines_s={"openai": 0.1})]
+            elapsed = time.monotonic() - start
+            release.set()
+
+        assert items == ["ArenaRunFailure", "ArenaRun", "ArenaReport"]
+        assert elapsed < 2
+        gens[0].cancel.assert_called_once()
+
+
+class TestArenaStream:
+    def test_yields_progress_runs_then_report(self):
+        from video_judge.models import ArenaRun, ProgressEvent
+
+        configs = [VideoGenModelConfig(provider="fal", model_id="model-a")]
+        arena = VideoGenArena(model_configs=configs, judge=MagicMock())
+
+        def make_orch(**kwargs):
+            def run(judge, video_generator):
+                kwargs["progress_callback"]("criterion_judged", criterion="prompt_alignment", score=0.7)
+                return _make_report(0.7)
+            return MagicMock(run=run)
+
+        with patch.object(arena, "_video_generator_factory") as factory, \
+             patch("video_judge.arena.VideoEvaluationOrchestrator", side_effect=make_orch):
+            gen = MagicMock()
+            gen.model = "model-a"
+            gen.cancel_event = threading.Event()
+            factory.return_value = [gen]
+
+            items = list(arena.stream("test prompt"))
+
+        assert isinstance(items[0], ProgressEvent)
+        assert items[0].criterion == "prompt_alignment"
+        assert isinstance(items[1], ArenaRun)
+        assert isinstance(items[-1], ArenaReport)
+        assert items[-1].winner == "model-a"
+
+    def test_breaking_out_cancels_the_arena(self):
+        configs = [VideoGenModelConfig(provider="fal", model_id=m) for m in ("fast", "slow")]
+        arena = VideoGenArena(model_configs=configs, judge=MagicMock())
+
+        def run(gen):
+            if gen.model == "slow":
+                if gen.cancel_event.wait(5):
+                    raise TimeoutError("cancelled")
+                raise AssertionError("slow model kept running after the consumer left")
+            return _make_report(0.5)
+
+        with patch.object(arena, "_video_generator_factory") as factory, \
+             patch("video_judge.arena.VideoEvaluationOrchestrator") as MockOrch:
+            gens = []
+            for model in ("fast", "slow"):
+                gen = MagicMock(model=model)
+                gen.cancel_event = threading.Event()
+                gens.append(gen)
+            factory.return_value = gens
+            MockOrch.side_effect = lambda **kw: MagicMock(
+                run=lambda judge, video_generator: run(video_generator))
+
+            stream = arena.stream("test prompt")
+            first = next(item for item in stream if isinstance(item, ArenaRun))
+            stream.close()
+
+            assert first.model == "fast"
+            assert gens[1].cancel_event.wait(2)
+
+
+class TestArenaRejudge:
+    def _arena(self, models):
+        configs = [VideoGenModelConfig(provider="fal", model_id=m) for m in models]
+        return VideoGenArena(model_configs=configs, judge=MagicMock())
+
+    def _generators(self, models):
+        gens = []
+        for m in models:
+            gen = MagicMock()
+            gen.model = m
+            gen.cancel_event = threading.Event()
+            gens.append(gen)
+        return gens
+
+    def test_rejudges_each_model_from_its_own_video(self, tmp_path):
+        arena = self._arena(["a", "b"])
+        paths = {}
+        videos = {m: str(tmp_path / f"{m}.mp4") for m in ("a", "b")}
+        for path in videos.values():
+            open(path, "wb").close()
+
+        def make_orch(**kwargs):
+            def run(judge, video_generator):
+                paths[video_generator.model] = kwargs["existing_video_path"]
+                return _make_report(0.9 if video_generator.model == "b" else 0.4)
+            return MagicMock(run=run)
+
+        with patch.object(arena, "_video_generator_factory", return_value=self._generators(["a", "b"])), \
+             patch("video_judge.arena.VideoEvaluationOrchestrator", side_effect=make_orch):
+            result = arena.fight("test", existing_video_path=videos)
+
+        assert paths == videos
+        assert result.winner == "b"
+
+    def test_earlier_report_without_a_video_fails_that_model(self, tmp_path):
+        arena = self._arena(["a", "b"])
+        video = tmp_path / "a.mp4"
+        video.touch()
+        report = _make_report(0.5)
+        report.video_path = str(video)
+        earlier = ArenaReport(prompt="test", results=[ArenaRun(model="a", report=report)],
+                              winner="a", rankings=["a"])
+
+        with patch.object(arena, "_video_generator_factory", return_value=self._generators(["a", "b"])), \
+             patch("video_judge.arena.VideoEvaluationOrchestrator") as MockOrch:
+            MockOrch.return_value.run.return_value = _make_report(0.6)
+            result = arena.fight("test", existing_video_path=earlier)
+
+        assert MockOrch.call_count == 1
+        assert MockOrch.call_args.kwargs["existing_video_path"] == str(video)
+        assert [f.model for f in result.failures] == ["b"]
+        assert result.failures[0].error_type == "FileNotFoundError"
+
+    def test_video_missing_on_disk_fails_that_model(self, tmp_path):
+        # e.g. a report from a fight run with download="skip": video_path was never written
+        arena = self._arena(["a", "b"])
+        video = tmp_path / "a.mp4"
+        video.touch()
+        videos = {"a": str(video), "b": str(tmp_path / "never-written.mp4")}
+
+        with patch.object(arena, "_video_generator_factory", return_value=self._generators(["a", "b"])), \
+             patch("video_judge.arena.VideoEvaluationOrchestrator") as MockOrch:
+            MockOrch.return_value.run.return_value = _make_report(0.6)
+            result = arena.fight("test", existing_video_path=videos)
+
+        assert MockOrch.call_count == 1
+        assert [(f.model, f.error_type) for f in result.failures] == [("b", "FileNotFoundError")]
+
+
+class TestArenaAsyncPipeline:
+    def test_async_generators_run_as_coroutines(self):
+        import asyncio
+        from video_judge.models import VideoInfo
+        from video_judge.orchestrator import VideoEvaluationOrchestrator
+        from video_judge.video_gen import BaseVideoGenerator
+
+        threads, judge_threads = [], []
+
+        class AsyncGenerator(BaseVideoGenerator):
+            provider = "fake"
+
+            def run_video_gen(self, prompt, download_path=None):
+                raise AssertionError("arena should await arun_video_gen")
+
+            async def arun_video_gen(self, prompt, download_path=None):
+                threads.append(threading.current_thread())
+                await asyncio.sleep(0.05)
+                return VideoInfo(saved_path=f"/v/{self.model}.mp4",
+                                 metadata={"generated_at": "2025-01-01T00:00:00", "prompt": prompt, "file_size": 1})
+
+        arena = VideoGenArena(model_configs=[], judge=MagicMock())
+        gens = [AsyncGenerator("a"), AsyncGenerator("b")]
+
+        def run_nodes(images, user_prompts, judge):
+            judge_threads.append(threading.current_thread())
+            return _make_report(0.5)
+
+        with patch.object(arena, "_video_generator_factory", return_value=gens), \
+             patch.object(VideoEvaluationOrchestrator, "create_judge_input_from_generator",
+                          return_value=([b"img"], ["Frame 0"])) as judge_input, \
+             patch.object(VideoEvaluationOrchestrator, "run_nodes", side_effect=run_nodes):
+            result = arena.fight("test")
+
+        # Generation ran on the event loop (main) thread; judging on the arena's pool
+        assert threads == [threading.main_thread()] * 2
+        assert threading.main_thread() not in judge_threads
+        assert len(result.results) == 2
+        assert judge_input.call_args.args[1].saved_path in ("/v/a.mp4", "/v/b.mp4")
+
+
+class TestArenaCircuitBreakers:
+    def test_open_provider_fails_fast_across_fights(self):
+        import asyncio
+        from video_judge.circuit import CircuitBreakers
+        from video_judge.models import VideoInfo
+        from video_judge.orchestrator import VideoEvaluationOrchestrator
+        from video_judge.video_gen import BaseVideoGenerator
+
+        calls = []
+
+        class Generator(BaseVideoGenerator):
+            def run_video_gen(self, prompt, download_path=None):
+                raise AssertionError("arena should await arun_video_gen")
+
+            async def arun_video_gen(self, prompt, download_path=None):
+                calls.append(self.model)
+                if self.provider == "down":
+                    raise RuntimeError("503 Service Unavailable")
+                await asyncio.sleep(0)
+                return VideoInfo(saved_path=f"/v/{self.model}.mp4",
+                                 metadata={"generated_at": "2025-01-01T00:00:00", "prompt": prompt, "file_size": 1})
+
+        def generators():
+            gens = [Generator("up-1"), Generator("down-1")]
+            gens[0].provider, gens[1].provider = "up", "down"
+            return gens
+
+        arena = VideoGenArena(model_configs=[], judge=MagicMock(),
+                              breakers=CircuitBreakers(min_calls=1, open_s=600))
+        with patch.object(arena, "_video_generator_factory", side_effect=generators), \
+             patch.object(VideoEvaluationOrchestrator, "create_judge_input_from_generator",
+                          return_value=([b"img"], ["Frame 0"])), \
+             patch.object(VideoEvaluationOrchestrator, "run_nodes", return_value=_make_report(0.5)):
+            first = arena.fight("first", retries=2)
+            second = arena.fight("second", retries=2)
+
+        # The failing provider trips on its first error and is neither retried nor called again
+        assert calls.count("down-1") == 1
+        assert first.failures[0].error_type == "CircuitOpenError"
+        assert second.failures[0].error_type == "CircuitOpenError"
+        assert second.health["down"].state == "open"
+        assert second.health["down"].rejected == 2
+        assert second.health["up"].calls == 2
@@ -0,0 +1,85 @@
+import json
+from unittest.mock import MagicMock
+
+import cv2
+import numpy as np
+
+from video_judge.batch import (
+    BatchEvaluator, completed_videos, decode_to_shared_memory, load_manifest, read_shared_frames, scan_directory,
+)
+from video_judge.models import BatchItem, Evidence, FrameSampling, JudgeEval
+
+
+def _write_clip(path, n=24):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), 24, (64, 48))
+    for i in range(n):
+        writer.write(np.full((48, 64, 3), i * 10, dtype=np.uint8))
+    writer.release()
+    return str(path)
+
+
+def _judge():
+    judge = MagicMock()
+    judge.evaluate.return_value = JudgeEval(
+        score=0.5, reason="ok", evidence=[Evidence(frame=0, timestamp=0.0, finding="ok")])
+    return judge
+
+
+class TestInputs:
+    def test_manifest_formats_resolve_relative_paths(self, tmp_path):
+        (tmp_path / "m.jsonl").write_text(json.dumps({"video_path": "a.mp4", "prompt": "a cat"}) + "\n")
+        (tmp_path / "m.csv").write_text("video_path,prompt\n/abs/b.mp4,a dog\n")
+
+        assert load_manifest(str(tmp_path / "m.jsonl")) == [
+            BatchItem(video_path=str(tmp_path / "a.mp4"), prompt="a cat")]
+        assert load_manifest(str(tmp_path / "m.csv")) == [BatchItem(video_path="/abs/b.mp4", prompt="a dog")]
+
+    def test_directory_uses_sidecar_prompts(self, tmp_path):
+        (tmp_path / "a.mp4").write_bytes(b"")
+        (tmp_path / "a.txt").write_text("a cat\n")
+        (tmp_path / "b.mp4").write_bytes(b"")
+
+        assert [i.prompt for i in scan_directory(str(tmp_path))] == ["a cat"]
+        assert [i.prompt for i in scan_directory(str(tmp_path), prompt="default")] == ["a cat", "default"]
+
+
+class TestSharedMemoryFrames:
+    def test_round_trips_every_view(self, tmp_path):
+        path = _write_clip(tmp_path / "clip.mp4")
+        specs = {"_default": FrameSampling(num_frames=4), "small": FrameSampling(num_frames=2, max_width=32)}
+
+        block, slots = decode_to_shared_memory(path, specs)
+        views = read_shared_frames(block, slots)
+
+        assert [f.idx for f in views["_default"]] == [0, 1, 22, 23]
+        assert len(views["small"]) == 2
+        assert views["_default"][0].image[:4] == b"\x89PNG"
+
+
+class TestBatchEvaluator:
+    def test_streams_reports_and_resumes(self, tmp_path):
+        items = [BatchItem(video_path=_write_clip(tmp_path / f"v{i}.mp4"), prompt=f"clip {i}") for i in range(3)]
+        output = str(tmp_path / "reports.jsonl")
+        judge = _judge()
+
+        first = BatchEvaluator(judge, output, decode_workers=2, max_concurrent_judges=2).run(items[:2])
+        # A torn line from an interrupted run is ignored on resume
+        with open(output, "a") as f:
+            f.write('{"input": {')
+        second = BatchEvaluator(judge, output, decode_workers=2, max_concurrent_judges=2).run(items)
+
+        assert first == {"completed": 2, "skipped": 0, "failed": 0}
+        assert second == {"completed": 1, "skipped": 2, "failed": 0}
+        assert completed_videos(output) == {item.video_path for item in items}
+        assert judge.evaluate.call_count == 3 * 4
+
+    def test_unreadable_video_is_counted_and_retried_later(self, tmp_path):
+        bad = tmp_path / "bad.mp4"
+        bad.write_bytes(b"not a video")
+        output = str(tmp_path / "reports.jsonl")
+
+        counts = BatchEvaluator(_judge(), output, decode_workers=1).run(
+            [BatchItem(video_path=str(bad), prompt="x")])
+
+        assert counts == {"completed": 0, "skipped": 0, "failed": 1}
+        assert completed_videos(output) == set()
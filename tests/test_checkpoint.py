@@ -0,0 +1,62 @@
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from video_judge.checkpoint import CheckpointStore
+from video_judge.models import JudgeEval, Evidence, VideoFrame, VideoInfo
+from video_judge.orchestrator import VideoEvaluationOrchestrator
+
+
+def _eval(score: float) -> JudgeEval:
+    return JudgeEval(score=score, reason="r", evidence=[Evidence(frame=0, timestamp=0.0, finding="f")])
+
+
+class TestCheckpointStore:
+    def test_frames_roundtrip(self, tmp_path):
+        store = CheckpointStore(str(tmp_path))
+        frames = [VideoFrame(idx=0, image=b"\x89PNG0", timestamp_s=0.0),
+                  VideoFrame(idx=12, image=b"\x89PNG1", timestamp_s=0.5)]
+        store.save_frames("run-1", frames)
+        assert store.load_frames("run-1") == frames
+
+    def test_video_checkpoint_requires_file(self, tmp_path):
+        store = CheckpointStore(str(tmp_path))
+        info = VideoInfo(saved_path=str(tmp_path / "missing.mp4"), metadata={
+            "generated_at": datetime.now(), "prompt": "p", "file_size": 1})
+        store.save_video("run-1", info)
+        assert store.load_video("run-1") is None
+
+    def test_stages_lists_completed(self, tmp_path):
+        store = CheckpointStore(str(tmp_path))
+        store.save_frames("run-1", [VideoFrame(idx=0, image=b"x", timestamp_s=0.0)])
+        store.save_criterion("run-1", "prompt_alignment", _eval(0.5))
+        assert store.stages("run-1") == ["frames", "prompt_alignment"]
+
+
+class TestOrchestratorResume:
+    def test_retry_resumes_missing_stages_only(self, tmp_path):
+        store = CheckpointStore(str(tmp_path))
+        frames = [VideoFrame(idx=0, image=b"img0", timestamp_s=0.0)]
+        judge = MagicMock()
+        judge.evaluate.side_effect = [_eval(0.9), _eval(0.8), RuntimeError("transient")]
+
+        def make_orch():
+            return VideoEvaluationOrchestrator(
+                video_gen_prompt="a cat", existing_video_path="/fake.mp4",
+                run_id="run-1", checkpoints=store)
+
+        with patch("video_judge.orchestrator.format_prompt", return_value="sys"), \
+             patch("video_judge.orchestrator.sample_frames", return_value=frames) as mock_sample:
+            with pytest.raises(RuntimeError):
+                make_orch().run(judge=judge, video_generator=MagicMock())
+
+            judge.evaluate.side_effect = [_eval(0.7), _eval(0.6)]
+            report = make_orch().run(judge=judge, video_generator=MagicMock())
+
+        assert mock_sample.call_count == 1
+        assert judge.evaluate.call_count == 5
+        assert report.scores["prompt_alignment"] == 0.9
+        assert report.scores["technical_quality"] == 0.6
+
+    def test_no_run_id_disables_checkpoints(self, tmp_path):
+        orch = VideoEvaluationOrchestrator(video_gen_prompt="p", checkpoints=CheckpointStore(str(tmp_path)))
+        assert orch.checkpoints is None
@@ -0,0 +1,110 @@
+import asyncio
+import pytest
+from video_judge.circuit import CircuitBreaker, CircuitBreakers, CircuitOpenError
+from video_judge.video_gen import GenerationCancelledError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _fail(breaker):
+    with pytest.raises(RuntimeError):
+        with breaker.guard():
+            raise RuntimeError("provider down")
+
+
+class TestCircuitBreaker:
+    def test_opens_after_error_rate_and_fails_fast(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("fal", failure_rate=0.5, min_calls=3, open_s=60, clock=clock)
+        with breaker.guard():
+            pass
+        _fail(breaker)
+        assert breaker.state == "closed"
+        _fail(breaker)
+        assert breaker.state == "open"
+
+        calls = []
+        with pytest.raises(CircuitOpenError):
+            with breaker.guard():
+                calls.append(1)
+        assert calls == []
+        health = breaker.health()
+        assert (health.calls, health.failures, health.rejected, health.trips) == (3, 2, 1, 1)
+
+    def test_half_open_allows_a_single_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("openai", min_calls=1, open_s=10, clock=clock)
+        _fail(breaker)
+        clock.now = 10
+        assert breaker.state == "half_open"
+
+        assert breaker.allow()
+        assert not breaker.allow()  # probe in flight
+        breaker.record(True, 1.0)
+        assert breaker.state == "closed"
+        assert breaker.health().calls == 1
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("openai", min_calls=1, open_s=10, clock=clock)
+        _fail(breaker)
+        clock.now = 10
+        _fail(breaker)
+        assert breaker.state == "open"
+        assert breaker.health().trips == 2
+
+    def test_slow_calls_count_as_failures(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("google", min_calls=2, slow_call_s=100, clock=clock)
+        for _ in range(2):
+            with breaker.guard():
+                clock.now += 200
+        assert breaker.state == "open"
+        assert breaker.health().mean_latency_s == 200
+
+    def test_neutral_errors_are_not_recorded(self):
+        breaker = CircuitBreaker("fal", min_calls=1)
+        with pytest.raises(GenerationCancelledError):
+            with breaker.guard(neutral=(GenerationCancelledError,)):
+                raise GenerationCancelledError("cancelled")
+        assert breaker.state == "closed"
+        assert breaker.health().calls == 0
+
+    def test_cancelled_async_generation_is_not_recorded(self):
+        from video_judge.orchestrator import VideoEvaluationOrchestrator
+
+        class Generator:
+            provider = "fal"
+
+            async def arun_video_gen(self, prompt):
+                await asyncio.sleep(10)
+
+        breakers = CircuitBreakers(min_calls=1)
+        orch = VideoEvaluationOrchestrator(video_gen_prompt="test", breakers=breakers)
+
+        async def cancel_generation():
+            task = asyncio.ensure_future(orch._agenerate_video(Generator()))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_generation())
+        health = breakers.health()["fal"]
+        assert (health.state, health.calls, health.trips) == ("closed", 0, 0)
+        assert breakers.get("fal").allow()
+
+
+class TestCircuitBreakers:
+    def test_per_name_overrides_and_health(self):
+        breakers = CircuitBreakers(per_name={"openai": {"open_s": 900}}, open_s=30)
+        assert breakers.get("openai").open_s == 900
+        assert breakers.get("fal").open_s == 30
+        assert breakers.get("fal") is breakers.get("fal")
+        assert list(breakers.health()) == ["fal", "openai"]
@@ -0,0 +1,80 @@
+import cv2
+import numpy as np
+from types import SimpleNamespace
+from unittest.mock import patch
+from video_judge.cost import (
+    UsageTracker, estimate_payload, fit_payload, image_size, image_tokens, usage_tracker,
+)
+from video_judge.judge import OpenAIJudge
+from video_judge.models import JudgeEval
+
+
+def _image(width, height, ext=".png"):
+    ok, buf = cv2.imencode(ext, np.zeros((height, width, 3), dtype=np.uint8))
+    return buf.tobytes()
+
+
+class TestEstimates:
+    def test_image_size_reads_png_and_jpeg_headers(self):
+        assert image_size(_image(320, 180)) == (320, 180)
+        assert image_size(_image(640, 360, ".jpg")) == (640, 360)
+        assert image_size(b"not an image") is None
+
+    def test_provider_image_formulas(self):
+        # 1024x1024 -> 768x768 -> 2x2 tiles
+        assert image_tokens("openai", 1024, 1024) == 85 + 170 * 4
+        assert image_tokens("claude", 1000, 750) == 1000
+        assert image_tokens("gemini", 384, 384) == 258
+        assert image_tokens("gemini", 1280, 720) == 258 * 2
+
+    def test_estimate_includes_text_and_cost(self):
+        est = estimate_payload("claude", "claude-sonnet-3-5", [_image(1000, 750)], ["x" * 40], "y" * 40)
+        assert (est.image_tokens, est.text_tokens, est.total_tokens) == (1000, 20, 1020)
+        assert abs(est.cost_usd - 1020 * 3.00 / 1_000_000) < 1e-12
+
+
+class TestFitPayload:
+    def test_within_budget_is_untouched(self):
+        images = [_image(320, 180)] * 3
+        fitted, prompts, _ = fit_payload("claude", "m", images, ["a", "b", "c"], max_input_tokens=10_000)
+        assert fitted is images
+
+    def test_downscales_before_dropping(self):
+        images = [_image(1280, 720)] * 4
+        fitted, prompts, est = fit_payload("claude", "m", images, ["f0", "f1", "f2", "f3", "prompt"],
+                                           max_input_tokens=2000)
+        assert len(fitted) == 4
+        assert image_size(fitted[0])[0] < 1280
+        assert est.total_tokens <= 2000
+
+    def test_drops_interior_frames_with_their_labels(self):
+        images = [_image(384, 216)] * 8
+        labels = [f"f{i}" for i in range(8)]
+        fitted, prompts, est = fit_payload("gemini", "m", images, labels + ["Original prompt"],
+                                           max_input_tokens=258 * 3 + 20)
+        assert len(fitted) == 3
+        assert prompts == ["f0", "f4", "f7", "Original prompt"]
+
+
+class TestUsageTracking:
+    def test_calibration_is_median_ratio(self):
+        tracker = UsageTracker()
+        for predicted, actual in [(100, 110), (100, 130), (100, 120)]:
+            tracker.record("openai", "gpt-4o", predicted, SimpleNamespace(usage=SimpleNamespace(input_tokens=actual)))
+        tracker.record("gemini", "g", 100, SimpleNamespace(usage=None, usage_metadata=SimpleNamespace(
+            prompt_token_count=90)))
+        assert abs(tracker.calibration("openai", "gpt-4o") - 1.2) < 1e-9
+        assert abs(tracker.calibration("gemini", "g") - 0.9) < 1e-9
+        assert tracker.calibration("claude", "c") == 1.0
+
+    @patch("video_judge.judge.build_openai_input_with_image_list")
+    def test_judge_fits_budget_and_passes_prediction(self, mock_builder):
+        mock_builder.return_value = JudgeEval(score=1.0, reason="r", evidence=[])
+        usage_tracker.reset()
+        judge = OpenAIJudge(max_input_tokens=1000)
+        judge.evaluate(images=[_image(1024, 1024)] * 4, user_prompts=["a", "b", "c", "d"], system_prompt="s")
+
+        kwargs = mock_builder.call_args.kwargs
+        assert kwargs["model"] == "gpt-4o"
+        assert len(kwargs["image_bytes_list"]) < 4
+        assert kwargs["predicted_input_tokens"] <= 1000
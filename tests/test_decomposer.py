@@ -0,0 +1,136 @@
+import threading
+import time
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+
+from video_judge.arena import VideoGenArena
+from video_judge.decomposer import DecompositionCache, OpenAIDecomposer
+from video_judge.models import PromptDecomposition, VideoGenModelConfig
+from video_judge.offline_decomposer import OfflineDecomposer
+from video_judge.orchestrator import VideoEvaluationOrchestrator
+
+
+def _decomposition(entity="rocket"):
+    return PromptDecomposition(entities=[entity], actions=["launching"], locations=["field"],
+                               time_of_day="sunset", style_attributes=["cinematic"])
+
+
+class TestDecompositionCache:
+    def test_second_decompose_is_served_from_disk(self, tmp_path):
+        decomposer = OpenAIDecomposer(cache=DecompositionCache(str(tmp_path)))
+        with patch.object(decomposer, "_call_api", return_value=_decomposition()) as call:
+            first = decomposer.decompose("a rocket")
+            second = OpenAIDecomposer(cache=DecompositionCache(str(tmp_path))).decompose("a rocket")
+
+        assert call.call_count == 1
+        assert first == second
+
+    def test_key_includes_model_and_template(self, tmp_path):
+        cache = DecompositionCache(str(tmp_path))
+        cache.put("openai", "gpt-4o", "a rocket", "hash-1", _decomposition())
+
+        assert cache.get("openai", "gpt-4o", "a rocket", "hash-1") == _decomposition()
+        assert cache.get("openai", "gpt-5", "a rocket", "hash-1") is None
+        assert cache.get("openai", "gpt-4o", "a rocket", "hash-2") is None
+
+
+class TestDecomposeMany:
+    def test_runs_concurrently_and_dedups(self):
+        decomposer = OpenAIDecomposer()
+        in_flight, peak, lock = [0], [0], threading.Lock()
+
+        def call(user_prompt, system_instruction, model):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+            if "bad" in user_prompt:
+                raise RuntimeError("boom")
+            return _decomposition(user_prompt[-1])
+
+        with patch.object(decomposer, "_call_api", side_effect=call) as mock_call:
+            results = decomposer.decompose_many(["p1", "p2", "p3", "p1", "bad"], max_workers=3)
+
+        assert set(results) == {"p1", "p2", "p3"}
+        assert results["p2"].entities == ["2"]
+        assert mock_call.call_count == 4
+        assert peak[0] == 3
+
+
+class TestParallelDecomposition:
+    def test_orchestrator_awaits_future_when_building_prompts(self):
+        future = Future()
+        orch = VideoEvaluationOrchestrator(video_gen_prompt="p", prompt_decomposition=future)
+        future.set_result(_decomposition())
+        assert "rocket" in orch._build_user_prompts([])[-1]
+
+        failed = Future()
+        failed.set_exception(RuntimeError("down"))
+        orch = VideoEvaluationOrchestrator(video_gen_prompt="p", prompt_decomposition=failed)
+        assert orch._build_user_prompts([]) == ["Original prompt: p"]
+
+    def test_arena_starts_decomposition_alongside_generation(self):
+        decomposer = MagicMock()
+        decomposer.decompose.return_value = _decomposition()
+        arena = VideoGenArena(model_configs=[VideoGenModelConfig(provider="fal", model_id="m")],
+                              judge=MagicMock(), decomposer=decomposer)
+        gen = MagicMock()
+        gen.model = "m"
+        gen.cancel_event = threading.Event()
+
+        with patch.object(arena, "_video_generator_factory", return_value=[gen]), \
+             patch("video_judge.arena.VideoEvaluationOrchestrator") as MockOrch:
+            MockOrch.return_value.run.side_effect = RuntimeError("stop")
+            try:
+                arena.fight("a rocket")
+            except RuntimeError:
+                pass
+
+        decomposer.decompose.assert_called_once_with("a rocket")
+        assert isinstance(MockOrch.call_args.kwargs["prompt_decomposition"], Future)
+
+
+class TestOfflineDecomposer:
+    def test_matches_decompose_template_examples(self):
+        decomposer = OfflineDecomposer()
+
+        result = decomposer.decompose("A sleek sci-fi rocketship launching from a lavender field at sunset")
+        assert result == PromptDecomposition(entities=["sleek sci-fi rocketship"], actions=["launching from field"],
+                                             locations=["lavender field"], time_of_day="sunset",
+                                             style_attributes=[])
+
+        result = decomposer.decompose("Cinematic wide shot of a golden retriever running through a misty forest, "
+                                      "dramatic lighting, slow motion")
+        assert result.entities == ["golden retriever"]
+        assert result.actions == ["running through forest"]
+        assert result.locations == ["misty forest"]
+        assert result.time_of_day is None
+        assert result.style_attributes == ["cinematic wide shot", "dramatic lighting", "slow motion"]
+
+    def test_multi_sentence_prompt(self):
+        result = OfflineDecomposer().decompose(
+            "An ancient stone city floating above a calm turquoise ocean at dawn. "
+            "Soft pastel clouds drift slowly through the structures as birds glide between columns. "
+            "Cinematic wide shot, serene fantasy atmosphere.")
+
+        assert result.time_of_day == "dawn"
+        assert {"ancient stone city", "calm turquoise ocean"} <= set(result.locations)
+        assert {"soft pastel clouds", "birds"} <= set(result.entities)
+        assert {"floating above ocean", "drift slowly through structures", "glide between columns"} \
+            <= set(result.actions)
+        assert result.style_attributes == ["cinematic wide shot", "serene fantasy atmosphere"]
+
+    def test_clause_ending_in_auxiliary(self):
+        assert OfflineDecomposer().decompose("A man seen being").actions == ["being"]
+        result = OfflineDecomposer().decompose("A knight, shining in armor, being")
+        assert result.entities == ["knight"]
+        assert result.actions == ["shining in armor", "being"]
+
+    def test_never_calls_an_api(self):
+        decomposer = OfflineDecomposer()
+        with patch("video_judge.decomposer.prompt_templates") as templates:
+            results = decomposer.decompose_many(["a dog running", "a cat sleeping"])
+        templates.get.assert_not_called()
+        assert results["a dog running"].entities == ["dog"]
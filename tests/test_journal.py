@@ -0,0 +1,102 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from video_judge.journal import JobJournal, judgement_key
+from video_judge.models import JudgeEval, Evidence, VideoInfo
+from video_judge.orchestrator import VideoEvaluationOrchestrator
+from video_judge.video_gen import FalVideoGenerator
+
+
+def _video_info(path: str) -> VideoInfo:
+    return VideoInfo(saved_path=path, metadata={
+        "generated_at": datetime.now(), "prompt": "a cat", "file_size": 3})
+
+
+class TestJobJournal:
+    def test_records_state_transitions(self, tmp_path):
+        journal = JobJournal(str(tmp_path / "journal.sqlite"))
+        journal.record_submission("fal", "seedance", "a cat", "req-1")
+        journal.mark("req-1", "completed")
+        journal.mark("req-1", "downloaded", video_info=_video_info("/v.mp4"))
+
+        job = journal.find_job("fal", "seedance", "a cat")
+        assert job.state == "downloaded"
+        assert job.video_info.saved_path == "/v.mp4"
+        assert journal.events("req-1") == ["submitted", "completed", "downloaded"]
+
+    def test_failed_jobs_are_not_resumed(self, tmp_path):
+        journal = JobJournal(str(tmp_path / "journal.sqlite"))
+        journal.record_submission("openai", "sora-2", "a cat", "vid-1")
+        journal.mark("vid-1", "failed", error="moderation")
+        assert journal.find_job("openai", "sora-2", "a cat") is None
+
+    def test_survives_reopen(self, tmp_path):
+        path = str(tmp_path / "journal.sqlite")
+        JobJournal(path).record_submission("fal", "seedance", "a cat", "req-1")
+        assert JobJournal(path).find_job("fal", "seedance", "a cat").request_id == "req-1"
+
+
+class TestGeneratorResume:
+    @patch("video_judge.video_gen.fal_api_client")
+    def test_reattaches_to_submitted_job(self, mock_fal, tmp_path):
+        journal = JobJournal(str(tmp_path / "journal.sqlite"))
+        journal.record_submission("fal", "seedance", "a cat", "req-1")
+        gen = FalVideoGenerator(model="seedance", journal=journal)
+
+        with patch.object(gen, "get_result", return_value={
+                "video": {"url": "http://x/v.mp4", "file_size": 3}, "seed": 1}), \
+             patch("video_judge.video_gen.get_video", return_value=b"abc"):
+            info = gen.run_video_gen("a cat", download_path=str(tmp_path / "v.mp4"))
+
+        mock_fal.client.submit.assert_not_called()
+        assert gen._request_id == "req-1"
+        assert journal.find_job("fal", "seedance", "a cat").state == "downloaded"
+        assert info.saved_path == str(tmp_path / "v.mp4")
+
+    @patch("video_judge.video_gen.fal_api_client")
+    def test_reuses_downloaded_video(self, mock_fal, tmp_path):
+        video = tmp_path / "v.mp4"
+        video.write_bytes(b"abc")
+        journal = JobJournal(str(tmp_path / "journal.sqlite"))
+        journal.record_submission("fal", "seedance", "a cat", "req-1")
+        journal.mark("req-1", "downloaded", video_info=_video_info(str(video)))
+
+        info = FalVideoGenerator(model="seedance", journal=journal).run_video_gen("a cat")
+
+        assert info.saved_path == str(video)
+        mock_fal.client.submit.assert_not_called()
+        mock_fal.client.status.assert_not_called()
+
+
+class TestJudgementReuse:
+    def test_orchestrator_skips_judged_criterion(self, tmp_path):
+        journal = JobJournal(str(tmp_path / "journal.sqlite"))
+        orch = VideoEvaluationOrchestrator(
+            video_gen_prompt="a cat", existing_video_path="/v.mp4", journal=journal)
+        judge = MagicMock()
+        judge.evaluate.return_value = JudgeEval(
+            score=0.7, reason="ok", evidence=[Evidence(frame=0, timestamp=0.0, finding="cat")])
+
+        with patch("video_judge.orchestrator.format_prompt", return_value="sys"):
+            first = orch.alignment_node(images=[b"x"], user_prompts=["f0"], judge=judge)
+            second = orch.alignment_node(images=[b"x"], user_prompts=["f0"], judge=judge)
+
+        assert judge.evaluate.call_count == 1
+        assert second.score == first.score
+
+    def test_judgement_cache_is_keyed_by_judge_model_and_frames(self, tmp_path):
+        journal = JobJournal(str(tmp_path / "journal.sqlite"))
+        orch = VideoEvaluationOrchestrator(video_gen_prompt="a cat", existing_video_path="/v.mp4", journal=journal)
+        judge = MagicMock(provider="openai", default_model="gpt-4o")
+        judge.evaluate.return_value = JudgeEval(
+            score=0.7, reason="ok", evidence=[Evidence(frame=0, timestamp=0.0, finding="cat")])
+
+        with patch("video_judge.orchestrator.format_prompt", return_value="sys"):
+            orch.alignment_node(images=[b"x"], user_prompts=["f0"], judge=judge)
+            orch.alignment_node(images=[b"resized x"], user_prompts=["f0"], judge=judge)
+            judge.default_model = "gpt-4.1"
+            orch.alignment_node(images=[b"x"], user_prompts=["f0"], judge=judge)
+
+        assert judge.evaluate.call_count == 3
+
+    def test_key_depends_on_every_part(self):
+        assert judgement_key("a", "b") != judgement_key("ab", "")
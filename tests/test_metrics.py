@@ -0,0 +1,73 @@
+import cv2
+import numpy as np
+from unittest.mock import MagicMock, patch
+from video_judge.metrics import (
+    blockiness, clipped_fraction, compute_technical_metrics, frames_to_array,
+    laplacian_variance, luminance_flicker,
+)
+from video_judge.models import JudgeEval, Evidence, VideoFrame
+from video_judge.orchestrator import VideoEvaluationOrchestrator
+
+
+def _noise_stack(n=4, size=64, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(40, 210, size=(n, size, size)).astype(np.float32)
+
+
+class TestMetrics:
+    def test_blur_lowers_laplacian_variance(self):
+        sharp = _noise_stack()
+        blurred = np.stack([cv2.GaussianBlur(f, (9, 9), 3) for f in sharp])
+        assert (laplacian_variance(blurred) < laplacian_variance(sharp) / 10).all()
+
+    def test_clipped_fraction_of_white_frame(self):
+        frames = np.full((2, 10, 10), 255, dtype=np.float32)
+        assert np.allclose(clipped_fraction(frames), 1.0)
+
+    def test_flicker_detects_alternating_brightness(self):
+        steady = np.full((4, 8, 8), 128, dtype=np.float32)
+        flicker = steady.copy()
+        flicker[1::2] = 20
+        assert luminance_flicker(steady) == 0.0
+        assert luminance_flicker(flicker) > 0.3
+
+    def test_blockiness_detects_8px_blocks(self):
+        rng = np.random.default_rng(1)
+        blocks = np.kron(rng.uniform(0, 255, (1, 8, 8)), np.ones((1, 8, 8))).astype(np.float32)
+        assert blockiness(blocks)[0] > blockiness(_noise_stack(1))[0] + 1
+
+    def test_broken_video_scores_low(self):
+        clean = compute_technical_metrics(_noise_stack())
+        broken = compute_technical_metrics(np.full((4, 64, 64), 255, dtype=np.float32), [0, 8, 16, 24])
+        assert clean.score > 0.8
+        assert broken.score < 0.35
+        assert any("frames [0, 8, 16, 24]" in issue for issue in broken.issues)
+
+    def test_frames_to_array_decodes_png(self):
+        ok, buf = cv2.imencode(".png", np.zeros((6, 5, 3), dtype=np.uint8))
+        assert frames_to_array([buf.tobytes()] * 3).shape == (3, 6, 5)
+
+
+class TestTechnicalPrescreenGate:
+    def _run(self, mode, frame_value):
+        ok, buf = cv2.imencode(".png", np.full((32, 32, 3), frame_value, dtype=np.uint8))
+        orch = VideoEvaluationOrchestrator(
+            video_gen_prompt="p", existing_video_path="/fake.mp4", technical_prescreen=mode)
+        orch.frames = [VideoFrame(idx=i, image=buf.tobytes(), timestamp_s=i / 24) for i in range(2)]
+        judge = MagicMock()
+        judge.evaluate.return_value = JudgeEval(
+            score=0.9, reason="r", evidence=[Evidence(frame=0, timestamp=0.0, finding="f")])
+        with patch("video_judge.orchestrator.format_prompt", return_value="sys"):
+            report = orch.run_nodes(images=[buf.tobytes()] * 2, user_prompts=["f0", "f1"], judge=judge)
+        return report, judge
+
+    def test_gate_skips_judge_for_broken_video(self):
+        report, judge = self._run("gate", 255)
+        assert judge.evaluate.call_count == 3
+        assert report.details[-1]["source"] == "prescreen"
+        assert report.technical_metrics.score < 0.35
+
+    def test_report_mode_still_calls_judge(self):
+        report, judge = self._run("report", 255)
+        assert judge.evaluate.call_count == 4
+        assert report.technical_metrics is not None
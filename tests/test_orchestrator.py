@@ -1,3 +1,4 @@
+import pytest
 from unittest.mock import MagicMock, patch
 from video_judge.orchestrator import VideoEvaluationOrchestrator
 from video_judge.models import JudgeEval, Evidence, PromptDecomposition
@@ -147,8 +148,68 @@ class TestNodeRouting:
 
         with patch("video_judge.orchestrator.format_prompt", return_value="sys") as mock_fmt:
             orch.alignment_node(images=[b"x"], user_prompts=["f0"], judge=mock_judge)
-            mock_fmt.assert_called_with("./prompts/prompt_alignment.txt")
+            mock_fmt.assert_called_with("prompt_alignment")
 
         with patch("video_judge.orchestrator.format_prompt", return_value="sys") as mock_fmt:
             orch.temporal_consistency_node(images=[b"x"], user_prompts=["f0"], judge=mock_judge)
-            mock_fmt.assert_called_with("./prompts/temporal_consistency.txt")
+            mock_fmt.assert_called_with("temporal_consistency")
+
+    def test_open_judge_circuit_skips_judge_calls(self):
+        from video_judge.circuit import CircuitBreakers, CircuitOpenError
+        breakers = CircuitBreakers(min_calls=1)
+        orch = VideoEvaluationOrchestrator(video_gen_prompt="test", breakers=breakers)
+        mock_judge = MagicMock(provider="openai", default_model="gpt-4o")
+        mock_judge.evaluate.side_effect = RuntimeError("rate limited")
+
+        with patch("video_judge.orchestrator.format_prompt", return_value="sys"):
+            with pytest.raises(RuntimeError, match="rate limited"):
+                orch.alignment_node(images=[b"x"], user_prompts=["f0"], judge=mock_judge)
+            with pytest.raises(CircuitOpenError):
+                orch.aesthetic_quality_node(images=[b"x"], user_prompts=["f0"], judge=mock_judge)
+
+        assert mock_judge.evaluate.call_count == 1
+        assert breakers.health()["judge:openai/gpt-4o"].state == "open"
+
+
+class TestCriterionSampling:
+    def test_criterion_override_uses_its_own_view(self):
+        from video_judge.models import FrameSampling, VideoFrame
+
+        dense = FrameSampling(num_frames=16, strategy="adaptive")
+        orch = VideoEvaluationOrchestrator(
+            video_gen_prompt="p", existing_video_path="/fake/video.mp4",
+            criterion_sampling={"temporal_consistency": dense})
+        orch.input_data = {"prompt": "p", "video_id": "v1"}
+        dense_frames = [VideoFrame(idx=i, image=b"dense", timestamp_s=i / 24) for i in range(16)]
+        mock_judge = MagicMock()
+        mock_judge.evaluate.return_value = _mock_judge_eval(0.5)
+
+        with patch("video_judge.orchestrator.format_prompt", return_value="sys"), \
+                patch("video_judge.orchestrator.sample_frame_views",
+                      return_value={"temporal_consistency": dense_frames}) as mock_views:
+            orch.run_nodes(images=[b"default"], user_prompts=["f0"], judge=mock_judge)
+
+        mock_views.assert_called_once_with("/fake/video.mp4", {"temporal_consistency": dense}, decoder="opencv")
+        calls = mock_judge.evaluate.call_args_list
+        assert calls[0].kwargs["images"] == [b"default"]
+        assert calls[1].kwargs["images"] == [b"dense"] * 16
+        assert calls[1].kwargs["user_prompts"][-1] == "Original prompt: p"
+
+    def test_default_and_criterion_views_share_one_sampling_pass(self):
+        from video_judge.models import FrameSampling, VideoFrame
+
+        keyframes = FrameSampling(num_frames=3, max_width=1280)
+        orch = VideoEvaluationOrchestrator(
+            video_gen_prompt="p", existing_video_path="/fake/video.mp4",
+            criterion_sampling={"aesthetic_quality": keyframes})
+        views = {
+            "_default": [VideoFrame(idx=i, image=b"d", timestamp_s=0.0) for i in range(8)],
+            "aesthetic_quality": [VideoFrame(idx=i, image=b"a", timestamp_s=0.0) for i in range(3)],
+        }
+        with patch("video_judge.orchestrator.sample_frame_views", return_value=views) as mock_views:
+            images, _ = orch.create_judge_input_from_video()
+            aesthetic_images, _ = orch._criterion_input("aesthetic_quality", images, [])
+
+        assert mock_views.call_count == 1
+        assert images == [b"d"] * 8
+        assert aesthetic_images == [b"a"] * 3
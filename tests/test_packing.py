@@ -0,0 +1,51 @@
+import cv2
+import numpy as np
+from unittest.mock import patch
+from video_judge.models import FramePacking, VideoFrame
+from video_judge.orchestrator import VideoEvaluationOrchestrator
+from video_judge.packing import pack_contact_sheets, sheet_caption
+
+
+def _frames(n, size=(90, 160)):
+    frames = []
+    for i in range(n):
+        ok, buf = cv2.imencode(".png", np.full((*size, 3), (i * 40) % 256, dtype=np.uint8))
+        frames.append(VideoFrame(idx=i * 12, image=buf.tobytes(), timestamp_s=i * 0.5))
+    return frames
+
+
+class TestPackContactSheets:
+    def test_splits_frames_into_row_major_sheets(self):
+        sheets = pack_contact_sheets(_frames(5), FramePacking(columns=2, rows=2, tile_width=64))
+
+        assert len(sheets) == 2
+        assert sheets[0].frame_indices == [0, 12, 24, 36]
+        assert sheets[1].frame_indices == [48]
+        first = cv2.imdecode(np.frombuffer(sheets[0].image, dtype=np.uint8), cv2.IMREAD_COLOR)
+        last = cv2.imdecode(np.frombuffer(sheets[1].image, dtype=np.uint8), cv2.IMREAD_COLOR)
+        # 64px tiles keep the 16:9 aspect ratio; a partial sheet shrinks to its filled cells
+        assert first.shape[:2] == (72, 128)
+        assert last.shape[:2] == (36, 64)
+        # Bottom-right tile holds frame 36 (grey level 120), away from the burned label
+        assert abs(int(first[-2, -2].mean()) - 120) < 10
+
+    def test_caption_maps_cells_to_frames(self):
+        sheet = pack_contact_sheets(_frames(3), FramePacking(columns=3, rows=1, tile_width=64))[0]
+        caption = sheet_caption(sheet, 1, 1)
+        assert "cell 2 = Frame 12 at 0.50s" in caption
+        assert "3x1 grid" in caption
+
+
+class TestOrchestratorPacking:
+    def test_judge_input_uses_sheets_and_captions(self):
+        orch = VideoEvaluationOrchestrator(
+            video_gen_prompt="a rocket", existing_video_path="/fake/video.mp4",
+            frame_packing=FramePacking(columns=2, rows=2, tile_width=64))
+        with patch("video_judge.orchestrator.sample_frames", return_value=_frames(8)):
+            images, user_prompts = orch.create_judge_input_from_video()
+
+        assert len(images) == 2
+        assert user_prompts[0].startswith("Contact sheet 1 of 2")
+        assert user_prompts[-1] == "Original prompt: a rocket"
+        # Raw frames are kept for local metrics and evidence mapping
+        assert [f.idx for f in orch.frames] == [i * 12 for i in range(8)]
@@ -1,6 +1,13 @@
+import shutil
 from unittest.mock import patch, MagicMock
+import cv2
 import numpy as np
-from video_judge.process import sample_frames, get_video_metadata
+import pytest
+from video_judge.models import FrameSampling, VideoFrame
+from video_judge.process import (
+    dedup_frames, get_video_metadata, sample_frame_views, sample_frames, select_keyframes,
+    uniform_indices,
+)
 
 
 class TestGetVideoMetadata:
@@ -70,3 +77,133 @@ class TestSampleFrames:
 
         assert len(frames) == 1
         assert frames[0].idx == 0
+
+
+class TestAdaptiveSampling:
+    def test_select_keyframes_prefers_peaks_and_keeps_ends(self):
+        scores = np.zeros(100)
+        scores[[30, 31, 70]] = [1.0, 0.9, 0.8]
+        picks = select_keyframes(scores, num_frames=4)
+        # 31 is suppressed as too close to 30
+        assert picks == [0, 30, 70, 99]
+
+    def test_select_keyframes_falls_back_to_uniform_for_static_clip(self):
+        assert select_keyframes(np.zeros(100), num_frames=4) == uniform_indices(100, 4)
+
+    def test_adaptive_sampling_lands_on_scene_cut(self, tmp_path):
+        path = str(tmp_path / "cut.mp4")
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), 24, (64, 48))
+        for i in range(48):
+            writer.write(np.full((48, 64, 3), 40 if i < 29 else 200, dtype=np.uint8))
+        writer.release()
+
+        frames = sample_frames(path, num_frames=3, strategy="adaptive")
+        assert [f.idx for f in frames] == [0, 29, 47]
+
+    def test_cost_cap_reduces_frame_count(self):
+        mock_cap = MagicMock()
+        # 750x100 frames -> 100 image tokens each
+        mock_cap.get.side_effect = lambda prop: {3: 750, 4: 100, 5: 24.0, 7: 240}.get(prop, 0)
+        mock_cap.read.return_value = (True, np.zeros((10, 10, 3), dtype=np.uint8))
+
+        with patch("video_judge.process.cv2.VideoCapture", return_value=mock_cap):
+            frames = sample_frames("/fake/video.mp4", num_frames=8, max_image_tokens=450)
+
+        assert len(frames) == 4
+
+    def test_cost_cap_uses_the_judge_pricing(self):
+        from video_judge.models import FrameSampling
+        from video_judge.process import spec_frame_count
+        meta = {"width": 1024, "height": 1024}
+        # openai: 4 tiles * 170 + 85 = 765 tokens; gemini: 4 tiles * 258 = 1032 tokens
+        assert spec_frame_count(FrameSampling(max_image_tokens=3000, token_provider="openai"), meta) == 3
+        assert spec_frame_count(FrameSampling(max_image_tokens=3000, token_provider="gemini"), meta) == 2
+
+
+class TestDedupFrames:
+    def _frame(self, idx, image):
+        ok, buf = cv2.imencode(".png", image)
+        return VideoFrame(idx=idx, image=buf.tobytes(), timestamp_s=idx / 24)
+
+    def test_drops_near_duplicates_and_keeps_original_indices(self):
+        rng = np.random.default_rng(0)
+        a = rng.integers(0, 255, (64, 64, 3), dtype=np.uint8)
+        b = rng.integers(0, 255, (64, 64, 3), dtype=np.uint8)
+        frames = [self._frame(0, a), self._frame(10, a), self._frame(20, b),
+                  self._frame(30, b), self._frame(40, b)]
+
+        kept = dedup_frames(frames, similarity=0.95)
+
+        # Last frame replaces its near-identical predecessor
+        assert [(f.idx, f.timestamp_s) for f in kept] == [(0, 0.0), (40, 40 / 24)]
+
+    def test_distinct_frames_are_kept(self):
+        rng = np.random.default_rng(1)
+        frames = [self._frame(i, rng.integers(0, 255, (64, 64, 3), dtype=np.uint8)) for i in range(4)]
+        assert dedup_frames(frames, similarity=0.95) == frames
+
+
+class TestSampleFrameViews:
+    def test_views_come_from_one_decode_at_their_own_resolution(self, tmp_path):
+        path = str(tmp_path / "clip.mp4")
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), 24, (320, 240))
+        for i in range(48):
+            writer.write(np.full((240, 320, 3), i * 5, dtype=np.uint8))
+        writer.release()
+        specs = {
+            "temporal": FrameSampling(num_frames=12, max_width=80),
+            "aesthetic": FrameSampling(num_frames=3),
+        }
+
+        with patch("video_judge.process.cv2.VideoCapture", wraps=cv2.VideoCapture) as mock_capture:
+            views = sample_frame_views(path, specs)
+
+        # One metadata probe plus one decode pass
+        assert mock_capture.call_count == 2
+        assert len(views["temporal"]) == 12
+        assert [f.idx for f in views["aesthetic"]] == uniform_indices(48, 3)
+        small = cv2.imdecode(np.frombuffer(views["temporal"][0].image, dtype=np.uint8), cv2.IMREAD_COLOR)
+        full = cv2.imdecode(np.frombuffer(views["aesthetic"][0].image, dtype=np.uint8), cv2.IMREAD_COLOR)
+        assert small.shape[:2] == (60, 80)
+        assert full.shape[:2] == (240, 320)
+
+
+class TestDecoders:
+    def _clip(self, tmp_path):
+        path = str(tmp_path / "clip.mp4")
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), 24, (320, 240))
+        for i in range(48):
+            frame = np.zeros((240, 320, 3), dtype=np.uint8)
+            frame[:, :, 2] = 255  # pure red in BGR
+            cv2.rectangle(frame, (i * 4, 100), (i * 4 + 40, 140), (255, 0, 0), -1)
+            writer.write(frame)
+        writer.release()
+        return path
+
+    def test_frames_keep_their_colours(self, tmp_path):
+        frame = sample_frames(self._clip(tmp_path), num_frames=2)[0]
+        b, g, r = cv2.imdecode(np.frombuffer(frame.image, dtype=np.uint8), cv2.IMREAD_COLOR)[10, 10]
+        assert r > 200 and b < 50
+
+    def test_ffmpeg_decoder_matches_opencv(self, tmp_path):
+        if shutil.which("ffmpeg") is None:
+            pytest.skip("ffmpeg not on PATH")
+        path = self._clip(tmp_path)
+        specs = {"small": FrameSampling(num_frames=5, max_width=160),
+                 "tiny": FrameSampling(num_frames=3, max_width=80)}
+        reference = sample_frame_views(path, specs)
+        piped = sample_frame_views(path, specs, decoder="ffmpeg")
+
+        for name in specs:
+            assert [f.idx for f in piped[name]] == [f.idx for f in reference[name]]
+            for a, b in zip(piped[name], reference[name]):
+                a = cv2.imdecode(np.frombuffer(a.image, dtype=np.uint8), cv2.IMREAD_COLOR)
+                b = cv2.imdecode(np.frombuffer(b.image, dtype=np.uint8), cv2.IMREAD_COLOR)
+                assert a.shape == b.shape
+                assert np.abs(a.astype(int) - b).mean() < 4
+
+    def test_ffmpeg_decoder_falls_back_without_ffmpeg(self, tmp_path):
+        path = self._clip(tmp_path)
+        with patch("video_judge.process.shutil.which", return_value=None):
+            frames = sample_frames(path, num_frames=4, decoder="ffmpeg")
+        assert [f.idx for f in frames] == uniform_indices(48, 4)
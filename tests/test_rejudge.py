@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+from video_judge.judge import OpenAIJudge
+from video_judge.models import ArenaReport, ArenaRun, Evidence, JudgeEval, Report
+from video_judge.orchestrator import provenance
+from video_judge.rejudge import Rejudger, stale_criteria
+
+CRITERIA = ["prompt_alignment", "temporal_consistency", "aesthetic_quality", "technical_quality"]
+
+
+def _eval(score):
+    return JudgeEval(score=score, reason="new", evidence=[Evidence(frame=0, timestamp=0.0, finding="x")])
+
+
+def _report(model, score, judge, video_path):
+    details = [{"criteria": c, "score": score, "reasoning": "old", "evidence": [], **provenance(c, judge)}
+               for c in CRITERIA]
+    scores = {c: score for c in CRITERIA}
+    scores["overall"] = score
+    return ArenaRun(model=model, report=Report(input={"prompt": "p"}, scores=scores, details=details,
+                                               video_path=video_path))
+
+
+class TestStaleCriteria:
+    def test_only_changed_template_is_stale(self):
+        judge = OpenAIJudge()
+        report = _report("a", 0.5, judge, "/a.mp4").report
+        report.details[2]["template_hash"] = "edited-since"
+
+        assert stale_criteria(report, judge) == ["aesthetic_quality"]
+
+    def test_other_judge_model_makes_everything_stale(self):
+        report = _report("a", 0.5, OpenAIJudge(), "/a.mp4").report
+        judge = OpenAIJudge()
+        judge.default_model = "gpt-5"
+
+        assert stale_criteria(report, judge) == CRITERIA
+
+    def test_prescreen_entries_are_never_stale(self):
+        judge = OpenAIJudge()
+        report = _report("a", 0.5, judge, "/a.mp4").report
+        report.details[3].update(source="prescreen", template_hash=None, judge_model="prescreen")
+        judge.default_model = "gpt-5"
+
+        assert "technical_quality" not in stale_criteria(report, judge)
+
+
+class TestRejudger:
+    def test_rejudges_stale_pairs_and_reranks(self):
+        judge = OpenAIJudge()
+        fight = ArenaReport(prompt="p", results=[_report("a", 0.6, judge, "/a.mp4"),
+                                                 _report("b", 0.5, judge, "/b.mp4")],
+                            winner="a", rankings=["a", "b"])
+        # Video b's alignment rubric was judged with an older template
+        fight.results[1].report.details[0]["template_hash"] = "old"
+
+        with patch("video_judge.rejudge.VideoEvaluationOrchestrator") as MockOrch:
+            orch = MockOrch.return_value
+            orch.create_judge_input_from_video.return_value = ([b"img"], ["f0"])
+            orch.node.return_value = _eval(1.0)
+            [updated] = Rejudger(judge).rejudge_arena_reports([fight])
+
+        MockOrch.assert_called_once_with(video_gen_prompt="p", existing_video_path="/b.mp4")
+        assert orch.node.call_args.kwargs["prompt_criterion"] == "prompt_alignment"
+        b = next(run.report for run in updated.results if run.model == "b")
+        assert b.scores["prompt_alignment"] == 1.0
+        assert b.scores["overall"] == 0.5 * 1.0 + 0.5 * 0.5
+        assert b.details[0]["template_hash"] == provenance("prompt_alignment", judge)["template_hash"]
+        assert updated.winner == "b"
+        assert stale_criteria(b, judge) == []
+
+    def test_failed_video_keeps_its_report(self):
+        judge = OpenAIJudge()
+        run = _report("a", 0.5, judge, "/missing.mp4")
+        run.report.details[1]["judge_model"] = "claude/claude-sonnet-3-5"
+
+        with patch("video_judge.rejudge.VideoEvaluationOrchestrator") as MockOrch:
+            MockOrch.return_value.create_judge_input_from_video.side_effect = ValueError("no frames")
+            [report] = Rejudger(judge).rejudge_reports([run.report])
+
+        assert report is run.report
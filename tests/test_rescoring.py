@@ -0,0 +1,65 @@
+import pytest
+
+from video_judge.models import ArenaReport, ArenaRun, Report
+from video_judge.rescoring import RescoringEngine, dirichlet_weights, load_arena_reports, weight_matrix
+
+
+def _run(model, alignment, temporal, aesthetic=0.5, technical=0.5):
+    scores = {"prompt_alignment": alignment, "temporal_consistency": temporal,
+              "aesthetic_quality": aesthetic, "technical_quality": technical}
+    scores["overall"] = 0.5 * alignment + 0.3 * temporal + 0.1 * aesthetic + 0.1 * technical
+    return ArenaRun(model=model, report=Report(input={}, scores=scores, details=[], video_path=f"/{model}.mp4"))
+
+
+def _fight(prompt, runs):
+    ranked = sorted(runs, key=lambda r: r.report.scores["overall"], reverse=True)
+    return ArenaReport(prompt=prompt, results=ranked, winner=ranked[0].model, rankings=[r.model for r in ranked])
+
+
+@pytest.fixture
+def reports():
+    return [
+        # a wins on alignment, b on temporal consistency
+        _fight("p1", [_run("a", 1.0, 0.2), _run("b", 0.5, 0.9)]),
+        _fight("p2", [_run("a", 0.5, 0.5), _run("b", 0.4, 0.4), _run("c", 0.3, 0.3)]),
+    ]
+
+
+class TestRescoringEngine:
+    def test_default_weights_reproduce_stored_rankings(self, reports):
+        engine = RescoringEngine(reports)
+        assert engine.rankings() == [r.rankings for r in reports]
+
+    def test_new_weights_change_winner(self, reports):
+        engine = RescoringEngine(reports)
+        temporal_heavy = {"prompt_alignment": 0.2, "temporal_consistency": 0.8}
+
+        assert engine.winners(temporal_heavy) == ["b", "a"]
+        rescored = engine.rescore(temporal_heavy)[0]
+        assert rescored.winner == "b"
+        assert rescored.results[0].report.scores["overall"] == pytest.approx(0.2 * 0.5 + 0.8 * 0.9)
+        # Stored reports are untouched
+        assert reports[0].winner == "a"
+
+    def test_sweep_measures_stability(self, reports):
+        engine = RescoringEngine(reports)
+        stability = engine.sweep([[0.5, 0.3, 0.1, 0.1], [0.2, 0.8, 0.0, 0.0]])
+
+        assert stability.baseline_winners == ["a", "a"]
+        assert stability.winners == [["a", "a"], ["b", "a"]]
+        assert stability.winner_agreement == [0.5, 1.0]
+        assert stability.pairwise_agreement == [0.5, 1.0]
+
+    def test_dirichlet_weights_are_valid(self):
+        samples = dirichlet_weights(100, seed=0)
+        assert weight_matrix(samples).shape == (100, 4)
+
+    def test_rejects_weights_not_summing_to_one(self, reports):
+        with pytest.raises(ValueError, match="sum to 1.0"):
+            RescoringEngine(reports).rankings([0.5, 0.5, 0.5, 0.5])
+
+
+def test_load_arena_reports_from_glob(tmp_path, reports):
+    for i, report in enumerate(reports):
+        (tmp_path / f"arena_report_{i}.json").write_text(report.model_dump_json())
+    assert load_arena_reports(str(tmp_path / "arena_report_*.json")) == reports
@@ -0,0 +1,159 @@
+import shutil
+import subprocess
+
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import pytest
+import requests
+
+from video_judge.ai_api_client import set_base_url
+from video_judge.models import FrameSampling
+from video_judge.orchestrator import VideoEvaluationOrchestrator
+from video_judge.process import sample_frames
+from video_judge.streaming import parse_moov, stream_frame_views, _boxes
+from video_judge.stub_server import StubProviderServer
+from video_judge.utils.file_utils import archive_video
+from video_judge.video_gen import FalVideoGenerator
+
+
+def _write_clip(path, n=48, size=(160, 120)):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), 24, size)
+    for i in range(n):
+        frame = np.zeros((size[1], size[0], 3), dtype=np.uint8)
+        cv2.rectangle(frame, (i * 2, 30), (i * 2 + 30, 60), (0, 128, 255), -1)
+        writer.write(frame)
+    writer.release()
+    return path
+
+
+@pytest.fixture
+def faststart_clip(tmp_path):
+    if shutil.which("ffmpeg") is None:
+        pytest.skip("ffmpeg not on PATH")
+    src = _write_clip(tmp_path / "src.mp4")
+    dst = tmp_path / "faststart.mp4"
+    subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-i", str(src), "-c", "copy",
+                    "-movflags", "+faststart", str(dst)], check=True)
+    return dst
+
+
+class _BrokenResponse:
+    """Streams the first half of data, then drops the connection."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        half = self.data[:len(self.data) // 2]
+        for start in range(0, len(half), 4096):
+            yield half[start:start + 4096]
+        raise requests.ConnectionError("connection reset")
+
+
+def _serve(data, monkeypatch):
+    monkeypatch.setenv("FAL_KEY", "stub-key")
+    server = StubProviderServer(video_bytes=data, seed=0).start()
+    set_base_url(server.url)
+    return server
+
+
+class TestParseMoov:
+    def test_reads_video_track(self, faststart_clip):
+        data = faststart_clip.read_bytes()
+        moov = next((payload, end) for kind, payload, end in _boxes(data) if kind == b"moov")
+        meta = parse_moov(data[moov[0]:moov[1]])
+        assert meta["total_frames"] == 48
+        assert meta["fps"] == pytest.approx(24)
+        assert (meta["width"], meta["height"]) == (160, 120)
+
+
+class TestStreamFrameViews:
+    def test_matches_sampling_the_downloaded_file(self, faststart_clip, tmp_path, monkeypatch):
+        data = faststart_clip.read_bytes()
+        server = _serve(data, monkeypatch)
+        try:
+            out = tmp_path / "out.mp4"
+            views = stream_frame_views(f"{server.url}/files/clip.mp4", str(out),
+                                       {"a": FrameSampling(num_frames=5), "b": FrameSampling(num_frames=3)})
+        finally:
+            set_base_url(None)
+            server.stop()
+
+        assert out.read_bytes() == data
+        expected = sample_frames(str(out), num_frames=5)
+        assert [f.idx for f in views["a"]] == [f.idx for f in expected]
+        assert len(views["b"]) == 3
+        # Same pixels as cv2 decoding the local file
+        streamed = cv2.imdecode(np.frombuffer(views["a"][2].image, np.uint8), cv2.IMREAD_COLOR)
+        local = cv2.imdecode(np.frombuffer(expected[2].image, np.uint8), cv2.IMREAD_COLOR)
+        assert np.abs(streamed.astype(int) - local).mean() < 2
+
+    def test_moov_at_end_falls_back_to_file(self, tmp_path, monkeypatch):
+        data = _write_clip(tmp_path / "src.mp4").read_bytes()
+        server = _serve(data, monkeypatch)
+        try:
+            out = tmp_path / "out.mp4"
+            views = stream_frame_views(f"{server.url}/files/clip.mp4", str(out), {"a": FrameSampling(num_frames=4)})
+        finally:
+            set_base_url(None)
+            server.stop()
+
+        assert out.read_bytes() == data
+        assert [f.idx for f in views["a"]] == [f.idx for f in sample_frames(str(out), num_frames=4)]
+
+    def test_failed_download_cleans_up(self, faststart_clip, tmp_path):
+        from video_judge import streaming
+        pipes = []
+
+        class RecordingPipe(streaming._FramePipe):
+            def __init__(self, *args):
+                super().__init__(*args)
+                pipes.append(self)
+
+        out = tmp_path / "out.mp4"
+        with patch.object(streaming.requests, "get", return_value=_BrokenResponse(faststart_clip.read_bytes())), \
+             patch.object(streaming, "_FramePipe", RecordingPipe):
+            with pytest.raises(requests.ConnectionError):
+                stream_frame_views("http://stub/clip.mp4", str(out), {"a": FrameSampling(num_frames=4)})
+
+        assert list(tmp_path.glob("out.mp4*")) == []
+        assert pipes[0].proc.poll() is not None
+        assert not pipes[0].reader.is_alive()
+
+    def test_failed_archive_leaves_no_part_file(self, tmp_path):
+        out = tmp_path / "out.mp4"
+        with patch("video_judge.utils.file_utils.requests.get", return_value=_BrokenResponse(b"x" * 10000)):
+            with pytest.raises(requests.ConnectionError):
+                archive_video("http://stub/clip.mp4", str(out))
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestStreamDownloadMode:
+    def test_orchestrator_streams_and_marks_downloaded(self, tmp_path, monkeypatch):
+        server = _serve(_write_clip(tmp_path / "src.mp4").read_bytes(), monkeypatch)
+        monkeypatch.chdir(tmp_path)
+        stages = []
+        try:
+            gen = FalVideoGenerator(download="stream")
+            gen.progress_callback = lambda stage, **_: stages.append(stage)
+            orch = VideoEvaluationOrchestrator(video_gen_prompt="a cat")
+            images, _ = orch.create_judge_input_from_generator(gen)
+        finally:
+            set_base_url(None)
+            server.stop()
+
+        assert len(images) == 8
+        assert orch.video_source is None
+        assert stages[-1] == "downloaded"
+        assert (tmp_path / orch.saved_video_path).read_bytes() == (tmp_path / "src.mp4").read_bytes()
@@ -0,0 +1,194 @@
+import asyncio
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from video_judge.ai_api_client import set_base_url
+from video_judge.input_builders import (
+    build_openai_input_with_image_list,
+    build_claude_input_with_text,
+    build_gemini_input_with_text,
+)
+from video_judge.models import JudgeEval, PromptDecomposition
+from video_judge.orchestrator import VideoEvaluationOrchestrator
+from video_judge.process import sample_frames
+from video_judge.stub_server import StubProviderServer, fake_from_schema
+from video_judge.video_gen import FalVideoGenerator, OpenAIVideoGenerator
+from video_judge.webhooks import WebhookReceiver
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    for key in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GEMINI_API_KEY", "FAL_KEY"):
+        monkeypatch.setenv(key, "stub-key")
+    server = StubProviderServer(video_bytes=b"fake-mp4", seed=0).start()
+    set_base_url(server.url)
+    yield server
+    set_base_url(None)
+    server.stop()
+
+
+class TestFakeFromSchema:
+    def test_builds_valid_judge_eval(self):
+        value = fake_from_schema(JudgeEval.model_json_schema())
+        assert JudgeEval.model_validate(value).evidence[0].finding == "stub"
+
+    def test_handles_optional_fields(self):
+        value = fake_from_schema(PromptDecomposition.model_json_schema())
+        assert PromptDecomposition.model_validate(value).time_of_day == "stub"
+
+
+class TestStubServerEndToEnd:
+    def test_judge_builders_parse_structured_output(self, stub_server):
+        result = build_openai_input_with_image_list(
+            image_bytes_list=[b"img"], user_prompt_list=["Frame 0"],
+            system_instruction="judge", response_schema=JudgeEval)
+        assert isinstance(result, JudgeEval)
+
+    def test_decomposer_builders_hit_each_provider(self, stub_server):
+        for builder, model in ((build_claude_input_with_text, "claude"),
+                               (build_gemini_input_with_text, "gemini-2.5-pro")):
+            result = builder(user_prompt="a cat", system_instruction="decompose",
+                             model=model, response_schema=PromptDecomposition)
+            assert isinstance(result, PromptDecomposition)
+        assert stub_server.request_counts["anthropic.messages"] == 1
+        assert stub_server.request_counts["gemini.generate_content"] == 1
+
+    def test_generators_poll_and_download(self, stub_server, tmp_path):
+        fal_info = FalVideoGenerator().run_video_gen("a cat", download_path=str(tmp_path / "fal.mp4"))
+        openai_info = OpenAIVideoGenerator().run_video_gen("a cat", download_path=str(tmp_path / "oai.mp4"))
+        assert fal_info.metadata.seed == 42
+        assert (tmp_path / "fal.mp4").read_bytes() == b"fake-mp4"
+        assert (tmp_path / "oai.mp4").read_bytes() == b"fake-mp4"
+        assert stub_server.request_counts["fal.status"] >= 1
+        assert stub_server.request_counts["openai.videos.retrieve"] >= 1
+
+    def test_async_generators_poll_and_download(self, stub_server, tmp_path):
+        async def generate():
+            return await asyncio.gather(
+                FalVideoGenerator().arun_video_gen("a cat", download_path=str(tmp_path / "fal.mp4")),
+                OpenAIVideoGenerator().arun_video_gen("a cat", download_path=str(tmp_path / "oai.mp4")))
+
+        fal_info, _ = asyncio.run(generate())
+        # A second event loop gets its own async clients
+        asyncio.run(generate())
+        assert fal_info.metadata.seed == 42
+        assert (tmp_path / "fal.mp4").read_bytes() == b"fake-mp4"
+        assert (tmp_path / "oai.mp4").read_bytes() == b"fake-mp4"
+        assert stub_server.request_counts["fal.status"] >= 2
+        assert stub_server.request_counts["openai.videos.retrieve"] >= 2
+
+    def test_fal_key_id_and_secret_reach_the_stub(self, stub_server, monkeypatch, tmp_path):
+        from video_judge.ai_api_client import fal_api_client
+        monkeypatch.delenv("FAL_KEY")
+        monkeypatch.setenv("FAL_KEY_ID", "key-id")
+        monkeypatch.setenv("FAL_KEY_SECRET", "key-secret")
+        set_base_url(stub_server.url)
+
+        FalVideoGenerator().run_video_gen("a cat", download_path=str(tmp_path / "sync.mp4"))
+        asyncio.run(FalVideoGenerator().arun_video_gen("a cat", download_path=str(tmp_path / "async.mp4")))
+
+        assert fal_api_client.client._client.headers["Authorization"] == "Key key-id:key-secret"
+        assert stub_server.request_counts["fal.submit"] == 2
+
+    def test_concurrent_calls_share_pooled_client(self, stub_server):
+        def call(_):
+            return build_openai_input_with_image_list(
+                image_bytes_list=[b"img"], user_prompt_list=["Frame 0"],
+                system_instruction="judge", response_schema=JudgeEval)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(call, range(16)))
+        assert len(results) == 16
+        assert stub_server.request_counts["openai.responses"] == 16
+
+    def test_sdk_retries_absorb_injected_rate_limits(self, stub_server):
+        stub_server.rate_limit_rate = 0.3
+        for _ in range(5):
+            build_openai_input_with_image_list(
+                image_bytes_list=[b"img"], user_prompt_list=["Frame 0"],
+                system_instruction="judge", response_schema=JudgeEval)
+        assert stub_server.faults_served[429] > 0
+        assert stub_server.request_counts["openai.responses"] == 5
+
+
+class TestWebhookCompletion:
+    @pytest.fixture
+    def webhooks(self):
+        with WebhookReceiver() as receiver:
+            yield receiver
+
+    def test_fal_result_arrives_by_webhook(self, stub_server, webhooks, tmp_path):
+        gen = FalVideoGenerator(webhooks=webhooks)
+        info = gen.run_video_gen("a cat", download_path=str(tmp_path / "fal.mp4"))
+
+        assert info.metadata.seed == 42
+        assert (tmp_path / "fal.mp4").read_bytes() == b"fake-mp4"
+        # One status check before the callback; the result itself came with the webhook
+        assert stub_server.request_counts["fal.status"] == 1
+        assert "fal.result" not in stub_server.request_counts
+        assert stub_server.request_counts["webhooks.sent"] == 1
+        assert webhooks._futures == {}
+
+    def test_fal_status_stream_wakes_on_webhook(self, stub_server, webhooks, tmp_path):
+        gen = FalVideoGenerator(webhooks=webhooks)
+        start = time.monotonic()
+        info = asyncio.run(gen.arun_video_gen("a cat", download_path=str(tmp_path / "fal.mp4")))
+
+        # The status stream waits webhook_fallback_s (30s) between events; the callback cut that short
+        assert time.monotonic() - start < 3
+        assert info.metadata.seed == 42
+        assert stub_server.request_counts["fal.status"] == 1
+        assert "fal.result" not in stub_server.request_counts
+
+    def test_openai_event_wakes_polling_early(self, stub_server, webhooks, tmp_path):
+        stub_server.openai_webhook_url = f"{webhooks.url}/webhooks/openai"
+        gen = OpenAIVideoGenerator(webhooks=webhooks)
+        start = time.monotonic()
+        asyncio.run(gen.arun_video_gen("a cat", download_path=str(tmp_path / "oai.mp4")))
+
+        # Without the event the second status check would wait out the 5s poll interval
+        assert time.monotonic() - start < 3
+        assert stub_server.request_counts["openai.videos.retrieve"] == 2
+        assert webhooks._futures == {}
+
+    def test_polling_fallback_without_callback(self, stub_server, tmp_path):
+        # Callbacks go to an address nothing listens on, so only the fallback poll can finish the job
+        unreachable = WebhookReceiver(public_url="http://127.0.0.1:9")
+        gen = FalVideoGenerator(webhooks=unreachable)
+        gen.webhook_fallback_s = 1.5
+        start = time.monotonic()
+        gen.run_video_gen("a cat", download_path=str(tmp_path / "fal.mp4"))
+        unreachable.stop()
+
+        assert time.monotonic() - start >= 1.4
+        assert "webhooks.sent" not in stub_server.request_counts
+        assert stub_server.request_counts["fal.result"] == 1
+
+
+class TestRemoteSampling:
+    @pytest.fixture
+    def video_server(self, monkeypatch):
+        monkeypatch.setenv("FAL_KEY", "stub-key")
+        # Default synthetic clip is a real mp4 with the moov atom at the end
+        server = StubProviderServer(seed=0).start()
+        set_base_url(server.url)
+        yield server
+        set_base_url(None)
+        server.stop()
+
+    def test_samples_url_with_range_requests(self, video_server):
+        frames = sample_frames(f"{video_server.url}/files/clip.mp4", num_frames=4)
+        assert len(frames) == 4
+        assert video_server.request_counts["files.range"] >= 1
+
+    def test_background_download_judges_from_url_first(self, video_server, tmp_path):
+        gen = FalVideoGenerator(download="background")
+        with patch("video_judge.video_gen.archive_video") as mock_archive:
+            orch = VideoEvaluationOrchestrator(video_gen_prompt="a cat")
+            images, _ = orch.create_judge_input_from_generator(gen)
+            gen.archive_thread.join(timeout=5)
+
+        assert len(images) == 8
+        assert orch.video_source.startswith(video_server.url)
+        mock_archive.assert_called_once_with(orch.video_source, orch.saved_video_path)
@@ -0,0 +1,65 @@
+import importlib
+import os
+from pathlib import Path
+
+import pytest
+
+import video_judge
+from video_judge import templates
+from video_judge.templates import PromptTemplate, TemplateRegistry
+
+PACKAGED_TEMPLATES = ["prompt_alignment", "temporal_consistency", "aesthetic_quality", "technical_quality",
+                      "decompose"]
+
+
+@pytest.fixture
+def default_templates(monkeypatch):
+    """video_judge.templates as imported without the VIDEO_JUDGE_PROMPTS_DIR override."""
+    monkeypatch.delenv("VIDEO_JUDGE_PROMPTS_DIR", raising=False)
+    yield importlib.reload(templates)
+    monkeypatch.undo()
+    importlib.reload(templates)
+
+
+class TestPromptTemplate:
+    def test_renders_known_and_keeps_unknown_placeholders(self):
+        template = PromptTemplate("t", "Judge {{criterion}} of {{model}} using {{rubric}}")
+        assert template.variables == ["criterion", "model", "rubric"]
+        assert template.render(criterion="motion", model="sora") == "Judge motion of sora using {{rubric}}"
+
+    def test_hash_tracks_content(self):
+        assert PromptTemplate("a", "same").hash == PromptTemplate("b", "same").hash
+        assert PromptTemplate("a", "same").hash != PromptTemplate("a", "changed").hash
+
+
+class TestTemplateRegistry:
+    def test_caches_until_mtime_changes(self, tmp_path):
+        path = tmp_path / "criterion.txt"
+        path.write_text("v1 {{x}}")
+        registry = TemplateRegistry(tmp_path)
+
+        first = registry.get("criterion")
+        assert registry.get("criterion") is first
+        assert registry.render("criterion", x=1) == "v1 1"
+
+        path.write_text("v2 {{x}}")
+        os.utime(path, ns=(first.mtime_ns + 10**9, first.mtime_ns + 10**9))
+        reloaded = registry.get("criterion")
+        assert reloaded.render(x=2) == "v2 2"
+        assert reloaded.hash != first.hash
+        assert registry.hashes() == {"criterion": reloaded.hash}
+
+    def test_default_root_is_independent_of_cwd(self, default_templates, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        registry = default_templates.TemplateRegistry()
+        assert registry.path("prompt_alignment") == default_templates.PROMPTS_DIR / "prompt_alignment.txt"
+        assert registry.get("prompt_alignment").text
+
+    def test_templates_ship_inside_the_package(self):
+        package_prompts = Path(video_judge.__file__).resolve().parent / "prompts"
+        for name in PACKAGED_TEMPLATES:
+            assert (package_prompts / f"{name}.txt").is_file()
+
+    def test_missing_template_names_the_override(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="VIDEO_JUDGE_PROMPTS_DIR"):
+            TemplateRegistry(tmp_path).get("prompt_alignment")
@@ -0,0 +1,84 @@
+import cv2
+import numpy as np
+from unittest.mock import MagicMock, patch
+from video_judge.models import JudgeEval, Evidence
+from video_judge.orchestrator import VideoEvaluationOrchestrator
+from video_judge.temporal import analyze_temporal, decode_low_res, format_temporal_hints, histogram_deltas
+
+
+def _panning_clip(n=48, seed=0):
+    """Smooth texture panning 2px per frame."""
+    rng = np.random.default_rng(seed)
+    texture = cv2.GaussianBlur(rng.uniform(0, 255, (120, 400)).astype(np.float32), (0, 0), 3)
+    texture = cv2.normalize(texture, None, 0, 255, cv2.NORM_MINMAX)
+    return np.stack([np.roll(texture, i * 2, axis=1)[:, :160] for i in range(n)]).astype(np.uint8)
+
+
+class TestAnalyzeTemporal:
+    def test_smooth_clip_is_clean(self):
+        analysis = analyze_temporal(_panning_clip(), fps=24)
+        assert analysis.score == 1.0
+        assert analysis.suspicious_timestamps == []
+
+    def test_jumbled_clip_is_broken(self):
+        clip = _panning_clip()
+        shuffled = clip[np.random.default_rng(1).permutation(len(clip))]
+        assert analyze_temporal(shuffled, fps=24).score <= 0.2
+
+    def test_jump_and_cut_are_located(self):
+        jump = _panning_clip()
+        jump[30:] = np.roll(jump[30:], 40, axis=2)
+        assert analyze_temporal(jump, fps=24).discontinuities == [1.25]
+
+        cut = _panning_clip()
+        cut[30:] = 255 - cut[30:] // 2
+        analysis = analyze_temporal(cut, fps=24)
+        assert analysis.scene_cuts == [1.25]
+        assert "Scene cut at 1.25s" in format_temporal_hints(analysis)
+
+    def test_histogram_deltas_match_per_frame_histograms(self):
+        clip = _panning_clip(n=3)
+        hists = [np.histogram(f, bins=32, range=(0, 256))[0] / f.size for f in clip]
+        expected = [np.abs(hists[1] - hists[0]).sum(), np.abs(hists[2] - hists[1]).sum()]
+        assert np.allclose(histogram_deltas(clip), expected)
+
+    def test_decode_low_res_strides_long_clips(self, tmp_path):
+        path = str(tmp_path / "clip.mp4")
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), 24, (320, 240))
+        for i in range(20):
+            writer.write(np.full((240, 320, 3), i * 10, dtype=np.uint8))
+        writer.release()
+        gray, fps, indices = decode_low_res(path, width=80, max_frames=10)
+        assert gray.shape == (10, 60, 80)
+        assert fps == 24
+        assert indices == list(range(0, 20, 2))
+
+
+class TestTemporalGate:
+    def _run(self, mode, score):
+        analysis = analyze_temporal(_panning_clip(n=4), fps=24).model_copy(
+            update={"score": score, "discontinuities": [0.5]})
+        orch = VideoEvaluationOrchestrator(
+            video_gen_prompt="p", existing_video_path="/fake.mp4", temporal_analysis=mode)
+        judge = MagicMock()
+        judge.evaluate.return_value = JudgeEval(
+            score=0.9, reason="r", evidence=[Evidence(frame=0, timestamp=0.0, finding="f")])
+        with patch("video_judge.orchestrator.format_prompt", return_value="sys"), \
+                patch("video_judge.orchestrator.analyze_video", return_value=analysis):
+            report = orch.run_nodes(images=[b"img"], user_prompts=["f0"], judge=judge)
+        return report, judge
+
+    def test_gate_skips_judge_for_broken_clip(self):
+        report, judge = self._run("gate", 0.0)
+        assert judge.evaluate.call_count == 3
+        assert report.scores["temporal_consistency"] == 0.0
+        assert report.details[1]["source"] == "prescreen"
+
+    def test_gate_judges_ambiguous_clip_with_hints(self):
+        report, judge = self._run("gate", 0.85)
+        assert judge.evaluate.call_count == 4
+        temporal_prompts = judge.evaluate.call_args_list[1].kwargs["user_prompts"]
+        assert "Discontinuity" in temporal_prompts[-1]
+        # Hints are only added for the temporal judge
+        assert judge.evaluate.call_args_list[0].kwargs["user_prompts"] == ["f0"]
+        assert report.temporal_analysis.score == 0.85
@@ -12,17 +12,17 @@ class TestFalVideoGenerator:
         gen = FalVideoGenerator(model="fal-ai/custom-model")
         assert gen.model == "fal-ai/custom-model"
 
-    @patch("video_judge.video_gen.fal_client")
+    @patch("video_judge.video_gen.fal_api_client")
     def test_submit_request_stores_request_id(self, mock_fal):
         mock_handler = MagicMock()
         mock_handler.request_id = "req-123"
-        mock_fal.submit.return_value = mock_handler
+        mock_fal.client.submit.return_value = mock_handler
 
         gen = FalVideoGenerator()
         gen.submit_request("a cat")
 
         assert gen._request_id == "req-123"
-        mock_fal.submit.assert_called_once()
+        mock_fal.client.submit.assert_called_once()
 
 
 class TestOpenAIVideoGenerator:
@@ -84,7 +84,7 @@ class TestGoogleVideoGenerator:
             initial_operation)
 
     @patch("video_judge.video_gen.google_client")
-    @patch("video_judge.video_gen.time.sleep")
+    @patch("video_judge.video_gen.BaseVideoGenerator._wait")
     def test_get_result_success(self, mock_sleep, mock_google):
         mock_video_content = b"fake_video_content"
 
@@ -110,7 +110,7 @@ class TestGoogleVideoGenerator:
         mock_google.client.files.download.assert_called_once_with(file=mock_video.video)
 
     @patch("video_judge.video_gen.google_client")
-    @patch("video_judge.video_gen.time.sleep")
+    @patch("video_judge.video_gen.BaseVideoGenerator._wait")
     def test_get_result_with_error(self, mock_sleep, mock_google):
         # Mock the operation to have an error
         mock_operation = MagicMock()
@@ -126,7 +126,7 @@ class TestGoogleVideoGenerator:
             gen.get_result()
 
     @patch("video_judge.video_gen.google_client")
-    @patch("video_judge.video_gen.time.sleep")
+    @patch("video_judge.video_gen.BaseVideoGenerator._wait")
     @patch("video_judge.video_gen.time.time")
     def test_get_result_timeout(self, mock_time, mock_sleep, mock_google):
         # Mock time to exceed timeout
@@ -142,3 +142,51 @@ class TestGoogleVideoGenerator:
 
         with pytest.raises(TimeoutError, match="Video generation failed after"):
             gen.get_result(timeout=900)
+
+
+class TestCancellation:
+    @patch("video_judge.video_gen.fal_api_client")
+    def test_cancel_interrupts_polling_and_cancels_fal_job(self, mock_fal):
+        from video_judge.video_gen import GenerationCancelledError
+        mock_fal.client.status.return_value = "IN_PROGRESS"
+        gen = FalVideoGenerator(model="fal-ai/x")
+        gen._request_id = "req-1"
+        gen.cancel()
+
+        with pytest.raises(GenerationCancelledError):
+            gen.get_result()
+        mock_fal.client.cancel.assert_called_once_with("fal-ai/x", "req-1")
+
+
+class TestAsyncGenerators:
+    @patch("video_judge.video_gen.openai_async_client")
+    def test_async_polling_stops_on_cancel(self, mock_openai):
+        import asyncio
+        import threading
+        from unittest.mock import AsyncMock
+        from video_judge.video_gen import GenerationCancelledError
+        job = MagicMock(status="in_progress", progress=10)
+        mock_openai.client.videos.retrieve = AsyncMock(return_value=job)
+        gen = OpenAIVideoGenerator()
+        gen._request_id = "vid-1"
+        threading.Timer(0.1, gen.cancel_event.set).start()
+
+        with pytest.raises(GenerationCancelledError):
+            asyncio.run(asyncio.wait_for(gen.aget_result(), 2))
+
+    @patch("video_judge.video_gen.google_async_client")
+    def test_google_async_result(self, mock_google):
+        import asyncio
+        from unittest.mock import AsyncMock
+        operation = MagicMock(done=True, error=None)
+        mock_google.client.operations.get = AsyncMock(return_value=operation)
+        mock_google.client.files.download = AsyncMock(return_value=b"video")
+        gen = GoogleVideoGenerator()
+        gen._operation = MagicMock()
+
+        with patch.object(gen, "_async_wait", AsyncMock()):
+            result = asyncio.run(gen.aget_result())
+
+        assert result["video"]["content"] == b"video"
+        mock_google.client.files.download.assert_awaited_once_with(
+            file=operation.response.generated_videos[0].video)
@@ -0,0 +1,64 @@
+import json
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from video_judge.webhooks import WebhookReceiver
+
+
+def _post(url, payload):
+    request = urllib.request.Request(url, data=json.dumps(payload).encode(),
+                                     headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return response.status
+
+
+@pytest.fixture
+def receiver():
+    with WebhookReceiver() as receiver:
+        yield receiver
+
+
+class TestWebhookReceiver:
+    def test_resolves_expected_callback(self, receiver):
+        token = receiver.new_token()
+        future = receiver.expect(token)
+        assert not future.done()
+
+        assert _post(receiver.callback_url(token), {"status": "OK", "payload": {"x": 1}}) == 200
+        assert future.result(timeout=1)["payload"] == {"x": 1}
+
+    def test_keeps_callbacks_that_arrive_first(self, receiver):
+        _post(f"{receiver.url}/webhooks/openai", {"type": "video.completed", "data": {"id": "video_1"}})
+        assert receiver.expect("video_1").result(timeout=0)["type"] == "video.completed"
+
+    def test_unexpected_callbacks_are_capped_and_expire(self):
+        with WebhookReceiver(max_early=2, early_ttl_s=60) as receiver:
+            for i in range(5):
+                _post(receiver.callback_url(f"junk{i}"), {})
+            assert list(receiver._early) == ["junk3", "junk4"]
+
+            receiver.early_ttl_s = 0.05
+            _post(receiver.callback_url("stale"), {})
+            time.sleep(0.1)
+            assert not receiver.expect("stale").done()
+            assert receiver.received == 6
+
+    def test_discard_forgets_the_job(self, receiver):
+        receiver.expect("job")
+        _post(receiver.callback_url("job"), {"status": "OK"})
+        receiver.discard("job")
+        assert receiver._futures == {} and len(receiver._early) == 0
+
+    def test_rejects_unknown_routes_and_bad_bodies(self, receiver):
+        with pytest.raises(urllib.error.HTTPError, match="404"):
+            _post(f"{receiver.url}/elsewhere", {})
+        with pytest.raises(urllib.error.HTTPError, match="400"):
+            _post(f"{receiver.url}/webhooks/openai", {"type": "video.completed"})
+
+    def test_public_url_is_used_for_callbacks(self):
+        receiver = WebhookReceiver(public_url="https://tunnel.example/")
+        assert receiver.callback_url("abc") == "https://tunnel.example/webhooks/abc"
+        receiver.stop()
@@ -3,13 +3,19 @@
 from video_judge.arena import VideoGenArena
 from video_judge.judge import BaseJudge, GeminiJudge, OpenAIJudge, ClaudeJudge
 from video_judge.decomposer import GeminiDecomposer, ClaudeDecomposer, OpenAIDecomposer, BaseDecomposer
+from video_judge.offline_decomposer import OfflineDecomposer
 from video_judge.orchestrator import VideoEvaluationOrchestrator
+from video_judge.journal import JobJournal
+from video_judge.batch import BatchEvaluator
+from video_judge.webhooks import WebhookReceiver
+from video_judge.circuit import CircuitBreakers
 from video_judge.models import (
     VideoGenModelConfig,
     ArenaReport,
     ArenaRun,
     Report,
     JudgeEval,
+    ProgressEvent,
 )
 
 __version__ = "0.1.0"
@@ -25,9 +31,15 @@ __all__ = [
     "ArenaRun",
     "Report",
     "JudgeEval",
+    "ProgressEvent",
     "BaseDecomposer",
     "GeminiDecomposer",
     "ClaudeDecomposer",
     "OpenAIDecomposer",
+    "OfflineDecomposer",
     "ClaudeJudge",
+    "JobJournal",
+    "BatchEvaluator",
+    "WebhookReceiver",
+    "CircuitBreakers",
 ]
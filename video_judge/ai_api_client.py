@@ -1,13 +1,21 @@
 """AI SDK client wrappers with lazy initialization."""
 
+import asyncio
+import functools
+import importlib.metadata
+import inspect
 import os
+import weakref
 from abc import ABC, abstractmethod
-from typing import Optional, TypeVar, Generic
+from typing import Optional, TypeVar, Generic, Union
 from dotenv import load_dotenv
 
+import httpx
 from google import genai
-from openai import OpenAI
+from google.genai import types
+from openai import AsyncOpenAI, OpenAI
 import anthropic
+import fal_client
 
 T = TypeVar('T')
 
@@ -19,6 +27,7 @@ class AIAPIClientBase(ABC, Generic[T]):
     - Lazy initialization (dotenv only loads when first accessed)
     - Type safety via Generic[T]
     - Reset capability for testing/mocking
+    - Optional base URL override (e.g. to point at ``video_judge.stub_server``)
 
     Usage:
         class MyClient(AIAPIClientBase[SomeSDKClient]):
@@ -29,9 +38,13 @@ class AIAPIClientBase(ABC, Generic[T]):
         my_client.client.do_something()  # Initializes on first access
     """
 
-    def __init__(self):
+    base_url_env: Optional[str] = None
+    base_url_suffix: str = ""
+
+    def __init__(self, base_url: Optional[str] = None):
         self._client: Optional[T] = None
         self._initialized = False
+        self._base_url = base_url
 
     @abstractmethod
     def _initialize(self) -> T:
@@ -59,6 +72,29 @@ class AIAPIClientBase(ABC, Generic[T]):
             self._initialized = True
         return self._client
 
+    @property
+    def base_url(self) -> Optional[str]:
+        """Base URL override, if any.
+
+        Resolution order: explicit set_base_url(), the provider-specific
+        env var (e.g. OPENAI_BASE_URL), then VIDEO_JUDGE_API_BASE_URL.
+        The shared setting is a server root, so ``base_url_suffix`` is
+        appended for SDKs that expect a versioned path.
+        """
+        if self._base_url:
+            return self._base_url
+        if self.base_url_env and os.getenv(self.base_url_env):
+            return os.getenv(self.base_url_env)
+        root = os.getenv("VIDEO_JUDGE_API_BASE_URL")
+        if root:
+            return root.rstrip("/") + self.base_url_suffix
+        return None
+
+    def set_base_url(self, base_url: Optional[str]):
+        """Point the client at another endpoint and force re-initialization."""
+        self._base_url = base_url
+        self.reset()
+
     def reset(self):
         """Reset client state.
 
@@ -69,16 +105,44 @@ class AIAPIClientBase(ABC, Generic[T]):
         self._initialized = False
 
 
+class AsyncAIAPIClientBase(AIAPIClientBase[T]):
+    """Lazy-loaded async SDK client, one per event loop.
+
+    Async SDK clients hold connection pools bound to the loop that created
+    them, and every asyncio.run() starts a new loop, so the client is cached
+    per running loop rather than once. Must be accessed from a coroutine.
+    """
+
+    def __init__(self, base_url: Optional[str] = None):
+        super().__init__(base_url)
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, T]" = weakref.WeakKeyDictionary()
+
+    @property
+    def client(self) -> T:
+        loop = asyncio.get_running_loop()
+        if loop not in self._clients:
+            load_dotenv()
+            self._clients[loop] = self._initialize()
+        return self._clients[loop]
+
+    def reset(self):
+        super().reset()
+        self._clients.clear()
+
+
 class GeminiAPIClient(AIAPIClientBase[genai.Client]):
     """Lazy-loaded Google Gemini API client.
 
     Requires GEMINI_API_KEY in environment.
     """
+    base_url_env = "GEMINI_BASE_URL"
 
     def _initialize(self) -> genai.Client:
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             raise ValueError("GEMINI_API_KEY not found in environment")
+        if self.base_url:
+            return genai.Client(api_key=api_key, http_options=types.HttpOptions(base_url=self.base_url))
         return genai.Client(api_key=api_key)
 
 
@@ -87,12 +151,36 @@ class OpenAIAPIClient(AIAPIClientBase[OpenAI]):
 
     Requires OPENAI_API_KEY in environment.
     """
+    base_url_env = "OPENAI_BASE_URL"
+    base_url_suffix = "/v1"
 
     def _initialize(self) -> OpenAI:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY not found in environment")
-        return OpenAI(api_key=api_key)
+        return OpenAI(api_key=api_key, base_url=self.base_url)
+
+
+class AsyncGeminiAPIClient(AsyncAIAPIClientBase, GeminiAPIClient):
+    """Per-loop async Gemini client (``genai.Client(...).aio``)."""
+
+    def _initialize(self):
+        return super()._initialize().aio
+
+
+class AsyncOpenAIAPIClient(AsyncAIAPIClientBase[AsyncOpenAI]):
+    """Per-loop async OpenAI client.
+
+    Requires OPENAI_API_KEY in environment.
+    """
+    base_url_env = "OPENAI_BASE_URL"
+    base_url_suffix = "/v1"
+
+    def _initialize(self) -> AsyncOpenAI:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY not found in environment")
+        return AsyncOpenAI(api_key=api_key, base_url=self.base_url)
 
 
 class AnthropicAPIClient(AIAPIClientBase[anthropic.Anthropic]):
@@ -100,11 +188,82 @@ class AnthropicAPIClient(AIAPIClientBase[anthropic.Anthropic]):
 
     Anthropic SDK automatically reads ANTHROPIC_API_KEY from environment.
     """
+    base_url_env = "ANTHROPIC_BASE_URL"
 
     def _initialize(self) -> anthropic.Anthropic:
-        return anthropic.Anthropic()
+        return anthropic.Anthropic(base_url=self.base_url)
+
+
+def _rebase(request: httpx.Request, base: httpx.URL):
+    request.url = request.url.copy_with(scheme=base.scheme, host=base.host, port=base.port)
+    request.headers["host"] = request.url.netloc.decode("ascii")
+
+
+def _rebase_fal_client(client: Union[fal_client.SyncClient, fal_client.AsyncClient], base_url: str):
+    """Send every request of a fal client to base_url, keeping the original path and query.
+
+    fal_client hardcodes ``https://queue.fal.run`` when building queue URLs and
+    has no base URL option. Its httpx client (built by fal_client itself, with
+    the Authorization header from whichever credentials it resolves) gets a
+    request event hook that rewrites the host. That client is the private
+    ``_client`` cached property, so check it still exists before relying on it.
+    """
+    if not isinstance(inspect.getattr_static(type(client), "_client", None), functools.cached_property):
+        raise RuntimeError(
+            f"fal-client {importlib.metadata.version('fal-client')} no longer exposes its httpx client; "
+            f"the FAL_BASE_URL override needs updating")
+    http = client._client
+    base = httpx.URL(base_url)
+    hooks = http.event_hooks
+    if isinstance(http, httpx.AsyncClient):
+        async def rebase(request: httpx.Request):
+            _rebase(request, base)
+        hooks["request"].append(rebase)
+    else:
+        hooks["request"].append(lambda request: _rebase(request, base))
+    http.event_hooks = hooks
+
+
+class FalAPIClient(AIAPIClientBase[fal_client.SyncClient]):
+    """Lazy-loaded fal queue client.
+
+    fal_client reads FAL_KEY (or FAL_KEY_ID/FAL_KEY_SECRET) from environment.
+    """
+    base_url_env = "FAL_BASE_URL"
+
+    def _initialize(self) -> fal_client.SyncClient:
+        client = fal_client.SyncClient()
+        if self.base_url:
+            _rebase_fal_client(client, self.base_url)
+        return client
+
+
+class AsyncFalAPIClient(AsyncAIAPIClientBase[fal_client.AsyncClient]):
+    """Per-loop async fal queue client.
+
+    fal_client reads FAL_KEY (or FAL_KEY_ID/FAL_KEY_SECRET) from environment.
+    """
+    base_url_env = "FAL_BASE_URL"
+
+    def _initialize(self) -> fal_client.AsyncClient:
+        client = fal_client.AsyncClient()
+        if self.base_url:
+            _rebase_fal_client(client, self.base_url)
+        return client
 
 
 google_client = GeminiAPIClient()
 openai_client = OpenAIAPIClient()
 anthropic_client = AnthropicAPIClient()
+fal_api_client = FalAPIClient()
+google_async_client = AsyncGeminiAPIClient()
+openai_async_client = AsyncOpenAIAPIClient()
+fal_async_client = AsyncFalAPIClient()
+
+
+def set_base_url(base_url: Optional[str]):
+    """Point every provider client at one server root (None restores defaults)."""
+    root = base_url.rstrip("/") if base_url else None
+    for api_client in (google_client, openai_client, anthropic_client, fal_api_client,
+                       google_async_client, openai_async_client, fal_async_client):
+        api_client.set_base_url(root + api_client.base_url_suffix if root else None)
@@ -1,95 +1,399 @@
 import asyncio
-from typing import List, Optional
-from concurrent.futures import ThreadPoolExecutor
+import inspect
+import queue
+import re
+import threading
+import time
+import uuid
+from pathlib import Path
+from urllib.parse import urlparse
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from video_judge.judge import BaseJudge
+from video_judge.decomposer import BaseDecomposer
+from video_judge.checkpoint import CheckpointStore
+from video_judge.circuit import CircuitBreakers, CircuitOpenError
+from video_judge.journal import JobJournal
 from video_judge.video_gen import FalVideoGenerator, BaseVideoGenerator, OpenAIVideoGenerator, GoogleVideoGenerator
 from video_judge.orchestrator import VideoEvaluationOrchestrator
+from video_judge.webhooks import WebhookReceiver
 from video_judge.config.logger import logger
-from video_judge.models import ArenaRun, ArenaReport, ArenaRunFailure, VideoGenModelConfig, PromptDecomposition
+from video_judge.models import ArenaRun, ArenaReport, ArenaRunFailure, VideoGenModelConfig, PromptDecomposition, ProgressEvent
+
+# Provider-side cancel requests; shared so asyncio.run() doesn't wait for them at the end of a fight
+_cancel_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="provider-cancel")
+
+# One path shared by all models, a path per model, or the report of an earlier fight
+ExistingVideos = Optional[Union[str, Dict[str, str], ArenaReport]]
 
 
 class VideoGenArena:
-    def __init__(self, model_configs: List[VideoGenModelConfig], judge: BaseJudge):
+    def __init__(self, model_configs: List[VideoGenModelConfig], judge: BaseJudge,
+                 journal: Optional[JobJournal] = None, checkpoints: Optional[CheckpointStore] = None,
+                 orchestrator_options: Optional[Dict[str, Any]] = None,
+                 decomposer: Optional[BaseDecomposer] = None,
+                 webhooks: Optional[WebhookReceiver] = None,
+                 breakers: Optional[CircuitBreakers] = None):
+        """
+        Args:
+            model_configs: Models competing in the arena
+            judge: LLM judge used for every criterion
+            journal: Optional job journal; when set, a restarted fight re-attaches to
+                in-flight provider jobs and reuses finished videos and judge results
+            checkpoints: Optional stage checkpoint store; when set, each model's run is
+                checkpointed under "<run_id>-<model>" and retries resume missing stages
+            orchestrator_options: Extra keyword arguments for every model's
+                VideoEvaluationOrchestrator, e.g. {"technical_prescreen": "gate"}
+            decomposer: When set and a fight gets no prompt_decomposition, the prompt is
+                decomposed in parallel with video generation; judges wait for it
+            webhooks: Optional running WebhookReceiver; fal and OpenAI jobs then complete
+                on the provider's callback, with polling only as a slow fallback
+            breakers: Optional circuit breakers per provider and judge backend, kept
+                across fights; models on an open backend fail fast with CircuitOpenError
+                and are not retried. Their state is reported in ArenaReport.health.
+        """
         self.model_config_list = model_configs
         self.judge = judge
+        self.journal = journal
+        self.checkpoints = checkpoints
+        self.orchestrator_options = orchestrator_options or {}
+        self.decomposer = decomposer
+        self.webhooks = webhooks
+        self.breakers = breakers
+
+    @staticmethod
+    def _model_run_id(run_id: str, model: str) -> str:
+        return f"{run_id}-{re.sub(r'[^A-Za-z0-9._-]+', '_', model)}"
 
     def _video_generator_factory(self) -> List[BaseVideoGenerator]:
         video_generators = []
         for config in self.model_config_list:
             if config.provider == "openai":
                 video_generators.append(
-                    OpenAIVideoGenerator(model=config.model_id))
+                    OpenAIVideoGenerator(model=config.model_id, journal=self.journal, webhooks=self.webhooks))
             elif config.provider == "fal":
                 video_generators.append(
-                    FalVideoGenerator(model=config.model_id))
+                    FalVideoGenerator(model=config.model_id, journal=self.journal, download=config.download,
+                                      webhooks=self.webhooks))
             elif config.provider == "google":
                 video_generators.append(
-                    GoogleVideoGenerator(model=config.model_id))
+                    GoogleVideoGenerator(model=config.model_id, journal=self.journal))
             else:
                 raise NotImplementedError(
                     "Providers other than openai and fal not supported yet")
         return video_generators
 
+    def _new_orchestrator(self, generator: BaseVideoGenerator, prompt: str, existing_video_path: Optional[str],
+                          prompt_decomposition: Optional[Union[PromptDecomposition, Future]],
+                          run_id: Optional[str]) -> VideoEvaluationOrchestrator:
+        return VideoEvaluationOrchestrator(
+            video_gen_prompt=prompt,
+            existing_video_path=existing_video_path,
+            prompt_decomposition=prompt_decomposition,
+            journal=self.journal,
+            run_id=run_id,
+            checkpoints=self.checkpoints,
+            cancel_event=generator.cancel_event,
+            progress_callback=generator.progress_callback,
+            breakers=self.breakers,
+            **self.orchestrator_options
+        )
+
+    def _should_retry(self, generator: BaseVideoGenerator, error: Exception, attempt: int, retries: int,
+                      run_id: Optional[str]) -> bool:
+        if attempt == retries or generator.cancel_event.is_set() or isinstance(error, CircuitOpenError):
+            return False
+        done = self.checkpoints.stages(run_id) if self.checkpoints and run_id else []
+        logger.warning(
+            f"Model {generator.model} failed on attempt {attempt + 1}: {type(error).__name__}: {error}. "
+            f"Retrying (checkpointed stages: {done})")
+        return True
+
     def _evaluate_model(self, generator: BaseVideoGenerator, judge: BaseJudge,
-                        prompt: str, existing_video_path: Optional[str] = None, prompt_decomposition: Optional[PromptDecomposition] = None) -> ArenaRun:
+                        prompt: str, existing_video_path: Optional[str] = None,
+                        prompt_decomposition: Optional[Union[PromptDecomposition, Future]] = None,
+                        run_id: Optional[str] = None, retries: int = 0) -> ArenaRun:
         """Run a single model's full pipeline (generation + evaluation).
 
-        Creates a fresh orchestrator per model to avoid shared state.
+        Creates a fresh orchestrator per model (and per attempt) to avoid shared
+        state. With checkpoints enabled, a retry resumes from the last finished stage.
         """
-        orchestrator = VideoEvaluationOrchestrator(
-            video_gen_prompt=prompt,
-            existing_video_path=existing_video_path,
-            prompt_decomposition=prompt_decomposition
-        )
-        logger.info(f"Starting evaluation run for model: {generator.model}")
-        report = orchestrator.run(judge=judge, video_generator=generator)
+        for attempt in range(retries + 1):
+            orchestrator = self._new_orchestrator(generator, prompt, existing_video_path, prompt_decomposition, run_id)
+            logger.info(f"Starting evaluation run for model: {generator.model}")
+            try:
+                report = orchestrator.run(judge=judge, video_generator=generator)
+                break
+            except Exception as e:
+                if not self._should_retry(generator, e, attempt, retries, run_id):
+                    raise
         logger.debug(f"Report for model {generator.model}: {report}")
         return ArenaRun(model=generator.model, report=report)
 
-    async def _fight_async(self, prompt: str, existing_video_path: Optional[str] = None, prompt_decomposition: Optional[PromptDecomposition] = None):
-        """Run all models in parallel using thread pool."""
-        generators = self._video_generator_factory()
-        loop = asyncio.get_event_loop()
-
-        with ThreadPoolExecutor(max_workers=len(generators)) as pool:
-            tasks = [
-                loop.run_in_executor(
-                    pool,
-                    self._evaluate_model,
-                    gen, self.judge, prompt, existing_video_path, prompt_decomposition
-                )
-                for gen in generators
-            ]
-            raw_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        results = []
-        failures = []
-        for gen, result in zip(generators, raw_results):
-            if isinstance(result, Exception):
-                logger.error(
-                    f"Model {gen.model} failed: {type(result).__name__}: {result}")
-                failures.append(ArenaRunFailure(
-                    model=gen.model, error=str(result), error_type=type(result).__name__))
-            else:
-                logger.info(f"Model {gen.model} completed successfully.")
-                results.append(result)
+    async def _aevaluate_model(self, generator: BaseVideoGenerator, judge: BaseJudge, prompt: str,
+                               existing_video_path: Optional[str], prompt_decomposition, run_id: Optional[str],
+                               retries: int, executor: Executor) -> ArenaRun:
+        """_evaluate_model as a coroutine: generation is awaited on the event loop and
+        only frame sampling and judging use a worker from executor."""
+        for attempt in range(retries + 1):
+            orchestrator = self._new_orchestrator(generator, prompt, existing_video_path, prompt_decomposition, run_id)
+            logger.info(f"Starting evaluation run for model: {generator.model}")
+            try:
+                report = await orchestrator.arun(judge=judge, video_generator=generator, executor=executor)
+                break
+            except Exception as e:
+                if not self._should_retry(generator, e, attempt, retries, run_id):
+                    raise
+        logger.debug(f"Report for model {generator.model}: {report}")
+        return ArenaRun(model=generator.model, report=report)
+
+    @staticmethod
+    def _has_async_pipeline(generator: BaseVideoGenerator) -> bool:
+        """Whether the generator implements arun_video_gen; duck-typed generators
+        without it run their whole pipeline on a worker thread."""
+        return inspect.iscoroutinefunction(getattr(type(generator), "arun_video_gen", None))
+
+    @staticmethod
+    def _deadline_for(generator: BaseVideoGenerator, deadline_s: Optional[float],
+                      provider_deadlines_s: Optional[Dict[str, float]]) -> Optional[float]:
+        """Tightest of the overall deadline and the generator's provider deadline."""
+        limits = [deadline_s, (provider_deadlines_s or {}).get(generator.provider)]
+        limits = [limit for limit in limits if limit is not None]
+        return min(limits) if limits else None
+
+    @staticmethod
+    def _existing_videos(existing_video_path: ExistingVideos) -> Optional[Dict[str, str]]:
+        """Per-model video paths, or None when every model shares one path (or generates).
+
+        Local files that don't exist (e.g. from a report generated with download="skip")
+        are dropped, so those models fail like models without a video.
+        """
+        if isinstance(existing_video_path, ArenaReport):
+            videos = {run.model: run.report.video_path for run in existing_video_path.results}
+        elif isinstance(existing_video_path, dict):
+            videos = dict(existing_video_path)
+        else:
+            return None
+        missing = {model: path for model, path in videos.items()
+                   if urlparse(path).scheme not in ("http", "https") and not Path(path).exists()}
+        if missing:
+            logger.warning(f"Existing videos not found on disk: {missing}")
+        return {model: path for model, path in videos.items() if model not in missing}
+
+    @staticmethod
+    def _cancel(generator: BaseVideoGenerator):
+        """Stop a generator without blocking the event loop.
+
+        The cancel event is set right away; the provider-side cancel request (an
+        HTTP call that may be slow or hang) runs on a shared pool and is never
+        awaited, so neither the other models nor the end of the fight wait on it.
+        """
+        generator.cancel_event.set()
+        asyncio.get_running_loop().run_in_executor(_cancel_pool, generator.cancel)
+
+    async def _await_with_deadline(self, generator: BaseVideoGenerator, future: asyncio.Future,
+                                   timeout: Optional[float]) -> ArenaRun:
+        """Await one model's run, cancelling it cooperatively once its deadline passes."""
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Model {generator.model} exceeded its {timeout:.0f}s deadline, cancelling")
+            self._cancel(generator)
+            raise TimeoutError(f"Model {generator.model} did not finish within {timeout:.0f}s")
 
+    def _build_report(self, prompt: str, results: List[ArenaRun], failures: List[ArenaRunFailure],
+                      run_id: str) -> ArenaReport:
         if not results:
             raise RuntimeError(f"All models failed. Failures: {failures}")
 
         ranked = sorted(
             results, key=lambda x: x.report.scores["overall"], reverse=True)
         model_rankings = [run.model for run in ranked]
-        return ArenaReport(prompt=prompt, results=ranked, winner=ranked[0].model, rankings=model_rankings)
+        return ArenaReport(prompt=prompt, results=ranked, winner=ranked[0].model, rankings=model_rankings,
+                           run_id=run_id, failures=failures, health=self.breakers.health() if self.breakers else {})
+
+    async def astream(self, video_gen_prompt: str, existing_video_path: ExistingVideos = None,
+                      prompt_decomposition: Optional[PromptDecomposition] = None, run_id: Optional[str] = None,
+                      retries: int = 0, deadline_s: Optional[float] = None,
+                      provider_deadlines_s: Optional[Dict[str, float]] = None
+                      ) -> AsyncIterator[Union[ProgressEvent, ArenaRun, ArenaRunFailure, ArenaReport]]:
+        """Run the competition, yielding results as they happen.
+
+        Yields ProgressEvents (submitted, generating, downloaded, criterion_judged),
+        then an ArenaRun or ArenaRunFailure as each model finishes, and finally the
+        ranked ArenaReport. Arguments are the same as fight().
+        """
+        generators = self._video_generator_factory()
+        videos = self._existing_videos(existing_video_path)
+        if videos is not None:
+            unknown = set(videos) - {gen.model for gen in generators}
+            if unknown:
+                logger.warning(f"Ignoring existing videos for models not in this arena: {sorted(unknown)}")
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+        run_id = run_id or uuid.uuid4().hex[:12]
+        run_ids = {gen.model: self._model_run_id(run_id, gen.model) for gen in generators}
+        started = time.monotonic()
+
+        def progress_callback_for(model: str):
+            def emit(stage: str, **fields):
+                event = ProgressEvent(model=model, stage=stage, **fields)
+                loop.call_soon_threadsafe(events.put_nowait, event)
+            return emit
+
+        async def run_one(gen: BaseVideoGenerator, future: asyncio.Future):
+            try:
+                result = await self._await_with_deadline(
+                    gen, future, self._deadline_for(gen, deadline_s, provider_deadlines_s))
+                logger.info(f"Model {gen.model} completed successfully.")
+            except Exception as e:
+                logger.error(
+                    f"Model {gen.model} failed: {type(e).__name__}: {e}")
+                result = ArenaRunFailure(
+                    model=gen.model, error=str(e), error_type=type(e).__name__,
+                    run_id=run_ids[gen.model])
+            events.put_nowait(result)
+
+        # One extra worker for the decomposition, so it never queues behind a model. Generators
+        # with an async client only borrow a worker for frame sampling and judging.
+        pool = ThreadPoolExecutor(max_workers=len(generators) + 1)
+        tasks = []
+        futures = []
+        try:
+            if prompt_decomposition is None and self.decomposer is not None:
+                prompt_decomposition = pool.submit(self.decomposer.decompose, video_gen_prompt)
+            for gen in generators:
+                gen.progress_callback = progress_callback_for(gen.model)
+                if videos is not None and gen.model not in videos:
+                    # Rejudging from existing files only: never fall back to generating
+                    future = loop.create_future()
+                    future.set_exception(FileNotFoundError(f"No existing video for model {gen.model}"))
+                elif self._has_async_pipeline(gen):
+                    future = asyncio.ensure_future(self._aevaluate_model(
+                        gen, self.judge, video_gen_prompt,
+                        videos[gen.model] if videos is not None else existing_video_path,
+                        prompt_decomposition, run_ids[gen.model], retries, pool))
+                else:
+                    future = loop.run_in_executor(
+                        pool,
+                        self._evaluate_model,
+                        gen, self.judge, video_gen_prompt,
+                        videos[gen.model] if videos is not None else existing_video_path,
+                        prompt_decomposition, run_ids[gen.model], retries
+                    )
+                futures.append(future)
+                tasks.append(asyncio.ensure_future(run_one(gen, future)))
+
+            results: List[ArenaRun] = []
+            failures: List[ArenaRunFailure] = []
+            while len(results) + len(failures) < len(generators):
+                item = await events.get()
+                if isinstance(item, ArenaRun):
+                    results.append(item)
+                elif isinstance(item, ArenaRunFailure):
+                    failures.append(item)
+                yield item
+        finally:
+            # Consumer stopped early: cancel whatever is still running
+            for gen, task, future in zip(generators, tasks, futures):
+                if not task.done():
+                    self._cancel(gen)
+                    task.cancel()
+                if not future.done():
+                    # Stops coroutine pipelines at their next await; worker threads exit on their next poll
+                    future.cancel()
+            # Cancelled stragglers exit on their next poll; don't block the report on them
+            pool.shutdown(wait=not any(gen.cancel_event.is_set() for gen in generators))
+
+        logger.info(
+            f"Arena finished in {time.monotonic() - started:.1f}s: {len(results)} succeeded, {len(failures)} failed")
+        yield self._build_report(video_gen_prompt, results, failures, run_id)
+
+    def stream(self, video_gen_prompt: str, **kwargs
+               ) -> Iterator[Union[ProgressEvent, ArenaRun, ArenaRunFailure, ArenaReport]]:
+        """Synchronous wrapper around astream() for callers without an event loop.
+
+        The arena runs on a background thread; items are handed over through a
+        queue so the caller (e.g. a Streamlit script) can render them as they arrive.
+        Closing the iterator early (break, or garbage collection) cancels the arena.
+        """
+        items: "queue.Queue" = queue.Queue()
+        done = object()
+        stopped = threading.Event()
+        running: Dict[str, Any] = {}
+
+        def runner():
+            async def consume():
+                running["loop"], running["task"] = asyncio.get_running_loop(), asyncio.current_task()
+                if stopped.is_set():
+                    return
+                async for item in self.astream(video_gen_prompt, **kwargs):
+                    items.put(item)
+            try:
+                asyncio.run(consume())
+            except BaseException as e:
+                items.put(e)
+            finally:
+                items.put(done)
+
+        thread = threading.Thread(target=runner, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = items.get()
+                if item is done:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # Consumer stopped early: cancel the arena so it stops generating and judging
+            stopped.set()
+            if "task" in running and thread.is_alive():
+                try:
+                    running["loop"].call_soon_threadsafe(running["task"].cancel)
+                except RuntimeError:
+                    pass  # loop already closed
 
-    def fight(self, video_gen_prompt: str, existing_video_path: Optional[str] = None, prompt_decomposition: Optional[PromptDecomposition] = None):
+    async def _fight_async(self, prompt: str, existing_video_path: ExistingVideos = None, prompt_decomposition: Optional[PromptDecomposition] = None,
+                           run_id: Optional[str] = None, retries: int = 0, deadline_s: Optional[float] = None,
+                           provider_deadlines_s: Optional[Dict[str, float]] = None):
+        """Run all models in parallel using thread pool."""
+        report = None
+        async for item in self.astream(prompt, existing_video_path, prompt_decomposition, run_id,
+                                       retries, deadline_s, provider_deadlines_s):
+            report = item
+        return report
+
+    def fight(self, video_gen_prompt: str, existing_video_path: ExistingVideos = None, prompt_decomposition: Optional[PromptDecomposition] = None,
+              run_id: Optional[str] = None, retries: int = 0, deadline_s: Optional[float] = None,
+              provider_deadlines_s: Optional[Dict[str, float]] = None):
         """Begins a video generation competition among text-to-video models.
 
         Runs all models in parallel. Each model gets its own orchestrator
         instance to avoid shared mutable state.
+
+        Args:
+            existing_video_path: Judge existing videos instead of generating: one path for
+                every model, a {model: path} mapping, or an earlier ArenaReport (its results'
+                video paths). With a mapping or report nothing is generated; models without
+                a video are reported as failures.
+            run_id: Identifier for checkpoints; pass the run_id of an earlier
+                (crashed or partially failed) fight to resume it
+            retries: Extra attempts per failed model, resuming from its last checkpoint
+            deadline_s: Overall wall-clock budget for every model
+            provider_deadlines_s: Per-provider budgets, e.g. {"openai": 600}; the tighter
+                of this and deadline_s applies. Models that run out of time are cancelled
+                (provider-side too where supported) and reported as failures, and the
+                report is built from the models that finished.
         """
         return asyncio.run(self._fight_async(
             prompt=video_gen_prompt,
             existing_video_path=existing_video_path,
-            prompt_decomposition=prompt_decomposition
+            prompt_decomposition=prompt_decomposition,
+            run_id=run_id,
+            retries=retries,
+            deadline_s=deadline_s,
+            provider_deadlines_s=provider_deadlines_s
         ))
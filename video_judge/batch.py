@@ -0,0 +1,222 @@
+"""Batch re-judging of existing videos.
+
+Frame decoding and PNG encoding are CPU-bound, so they run in a process pool
+sized to the machine's cores. Each worker packs its encoded frames into one
+shared-memory block and returns only offsets, so frames are not pickled
+back to the parent. Judge calls are I/O-bound and run on threads, at most
+``max_concurrent_judges`` at a time.
+
+Reports are appended to a JSONL file as each video finishes. Re-running with
+the same output file skips videos that already have a report there, so an
+interrupted batch resumes where it stopped.
+
+Input is a list of BatchItems, a manifest (.jsonl with {"video_path",
+"prompt"} per line, or .csv with video_path,prompt columns) or a directory
+of videos whose prompt sits in a sidecar <stem>.txt file.
+"""
+
+import asyncio
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+
+from video_judge.config.logger import logger
+from video_judge.judge import BaseJudge
+from video_judge.models import BatchItem, FrameSampling, Report, VideoFrame
+from video_judge.orchestrator import VideoEvaluationOrchestrator
+from video_judge.process import Decoder, sample_frame_views
+
+VIDEO_EXTENSIONS = {".mp4", ".mov", ".webm", ".mkv", ".avi"}
+
+# (spec name, frame idx, timestamp, offset, length) of one frame inside a shared-memory block
+FrameSlot = Tuple[str, int, float, int, int]
+
+
+def load_manifest(path: str) -> List[BatchItem]:
+    """Read (video_path, prompt) pairs from a .jsonl or .csv manifest.
+
+    Relative video paths are resolved against the manifest's directory.
+    """
+    base = Path(path).parent
+    with open(path, newline="") as f:
+        if path.endswith(".csv"):
+            rows = list(csv.DictReader(f))
+        else:
+            rows = [json.loads(line) for line in f if line.strip()]
+    items = []
+    for row in rows:
+        video = Path(row["video_path"])
+        items.append(BatchItem(video_path=str(video if video.is_absolute() else base / video),
+                               prompt=row["prompt"]))
+    return items
+
+
+def scan_directory(directory: str, prompt: Optional[str] = None) -> List[BatchItem]:
+    """Videos in a directory, each paired with the prompt in its sidecar <stem>.txt.
+
+    Args:
+        prompt: Used for videos without a sidecar file; those are skipped when None
+    """
+    items = []
+    for video in sorted(Path(directory).iterdir()):
+        if video.suffix.lower() not in VIDEO_EXTENSIONS:
+            continue
+        sidecar = video.with_suffix(".txt")
+        if sidecar.exists():
+            items.append(BatchItem(video_path=str(video), prompt=sidecar.read_text().strip()))
+        elif prompt is not None:
+            items.append(BatchItem(video_path=str(video), prompt=prompt))
+        else:
+            logger.warning(f"Skipping {video}: no prompt file {sidecar.name}")
+    return items
+
+
+def completed_videos(output_path: str) -> Set[str]:
+    """video_path of every report already written to a JSONL output file."""
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path) as f:
+        for line in f:
+            try:
+                done.add(Report.model_validate_json(line).video_path)
+            except ValidationError:
+                # A torn last line from an interrupted run; that video is redone
+                continue
+    return done
+
+
+def decode_to_shared_memory(video_path: str, specs: Dict[str, FrameSampling],
+                            decoder: Decoder = "opencv") -> Tuple[Optional[str], List[FrameSlot]]:
+    """Process-pool worker: sample every spec and pack the encoded frames into shared memory.
+
+    Returns:
+        (shared-memory block name, frame slots); the caller must unlink the block
+    """
+    views = sample_frame_views(video_path, specs, decoder=decoder)
+    frames = [(name, f) for name, view in views.items() for f in view]
+    size = sum(len(f.image) for _, f in frames)
+    if size == 0:
+        return None, []
+    block = shared_memory.SharedMemory(create=True, size=size)
+    slots, offset = [], 0
+    for name, frame in frames:
+        block.buf[offset:offset + len(frame.image)] = frame.image
+        slots.append((name, frame.idx, frame.timestamp_s, offset, len(frame.image)))
+        offset += len(frame.image)
+    block.close()
+    return block.name, slots
+
+
+def read_shared_frames(block_name: Optional[str], slots: List[FrameSlot]) -> Dict[str, List[VideoFrame]]:
+    """Copy frames out of a worker's shared-memory block and release it."""
+    views: Dict[str, List[VideoFrame]] = {}
+    if block_name is None:
+        return views
+    block = shared_memory.SharedMemory(name=block_name)
+    try:
+        for name, idx, timestamp, offset, length in slots:
+            views.setdefault(name, []).append(
+                VideoFrame(idx=idx, timestamp_s=timestamp, image=bytes(block.buf[offset:offset + length])))
+    finally:
+        block.close()
+        block.unlink()
+    return views
+
+
+class BatchEvaluator:
+    """Judge many existing videos with a process pool for decoding and a bounded judge pool.
+
+    Args:
+        judge: LLM judge used for every criterion
+        output_path: JSONL file reports are appended to (and resumed from)
+        decode_workers: Decoding processes; defaults to the number of cores
+        max_concurrent_judges: Videos being judged at once
+        orchestrator_options: Extra keyword arguments for every VideoEvaluationOrchestrator,
+            e.g. {"frame_sampling": FrameSampling(num_frames=12), "frame_decoder": "ffmpeg"}
+    """
+
+    def __init__(self, judge: BaseJudge, output_path: str = "./output/batch_reports.jsonl",
+                 decode_workers: Optional[int] = None, max_concurrent_judges: int = 8,
+                 orchestrator_options: Optional[Dict[str, Any]] = None):
+        self.judge = judge
+        self.output_path = output_path
+        self.decode_workers = decode_workers or os.cpu_count() or 1
+        self.max_concurrent_judges = max_concurrent_judges
+        self.orchestrator_options = orchestrator_options or {}
+
+    def _specs(self) -> Dict[str, FrameSampling]:
+        options = self.orchestrator_options
+        return {"_default": options.get("frame_sampling") or FrameSampling(),
+                **(options.get("criterion_sampling") or {})}
+
+    def _judge(self, item: BatchItem, views: Dict[str, List[VideoFrame]]) -> Report:
+        orchestrator = VideoEvaluationOrchestrator(
+            video_gen_prompt=item.prompt, existing_video_path=item.video_path, **self.orchestrator_options)
+        frames = views.pop("_default", [])
+        images, user_prompts = orchestrator.create_judge_input_from_frames(frames, views)
+        return orchestrator.run_nodes(images=images, user_prompts=user_prompts, judge=self.judge)
+
+    async def arun(self, items: List[BatchItem]) -> Dict[str, int]:
+        """Judge every item not already in the output file.
+
+        Returns:
+            Counts of "completed", "skipped" (already in the output) and "failed" items
+        """
+        done = completed_videos(self.output_path)
+        pending = [item for item in items if item.video_path not in done]
+        counts = {"completed": 0, "skipped": len(items) - len(pending), "failed": 0}
+        if counts["skipped"]:
+            logger.info(f"Resuming batch: {counts['skipped']} videos already in {self.output_path}")
+        Path(self.output_path).parent.mkdir(parents=True, exist_ok=True)
+
+        loop = asyncio.get_running_loop()
+        specs = self._specs()
+        decoder = self.orchestrator_options.get("frame_decoder", "opencv")
+        # Decode at most one video ahead per worker so frames don't pile up behind the judges
+        in_flight = asyncio.Semaphore(self.decode_workers + self.max_concurrent_judges)
+        judging = asyncio.Semaphore(self.max_concurrent_judges)
+        write_lock = asyncio.Lock()
+        started = time.monotonic()
+
+        async def run_one(item: BatchItem, output):
+            async with in_flight:
+                try:
+                    block, slots = await loop.run_in_executor(
+                        decode_pool, decode_to_shared_memory, item.video_path, specs, decoder)
+                    views = read_shared_frames(block, slots)
+                    async with judging:
+                        report = await loop.run_in_executor(judge_pool, self._judge, item, views)
+                except Exception as e:
+                    logger.error(f"Batch item {item.video_path} failed: {type(e).__name__}: {e}")
+                    counts["failed"] += 1
+                    return
+            async with write_lock:
+                output.write(report.model_dump_json().encode() + b"\n")
+                output.flush()
+            counts["completed"] += 1
+
+        with ProcessPoolExecutor(max_workers=self.decode_workers) as decode_pool, \
+                ThreadPoolExecutor(max_workers=self.max_concurrent_judges) as judge_pool, \
+                open(self.output_path, "a+b") as output:
+            output.seek(0, os.SEEK_END)
+            if output.tell():
+                output.seek(-1, os.SEEK_END)
+                if output.read(1) != b"\n":
+                    # Terminate a torn last line so the next report starts on its own line
+                    output.write(b"\n")
+            await asyncio.gather(*(run_one(item, output) for item in pending))
+
+        logger.info(f"Batch finished in {time.monotonic() - started:.1f}s: {counts}")
+        return counts
+
+    def run(self, items: List[BatchItem]) -> Dict[str, int]:
+        """Synchronous wrapper around arun()."""
+        return asyncio.run(self.arun(items))
@@ -0,0 +1,92 @@
+"""Stage-level checkpoints for evaluation runs.
+
+Each orchestrator run can persist its stages (video generated, frames
+sampled, each criterion judged) under a run id. Re-running with the same
+run id loads finished stages from disk and only executes the missing ones.
+
+Layout:
+    {root}/{run_id}/video.json
+    {root}/{run_id}/frames.json + frame_{idx}.png
+    {root}/{run_id}/criteria/{criterion}.json
+"""
+
+import json
+import shutil
+from pathlib import Path
+from typing import List, Optional
+
+from video_judge.models import JudgeEval, VideoFrame, VideoInfo
+from video_judge.utils.file_utils import atomic_write
+
+
+class CheckpointStore:
+    """Filesystem store of per-run stage checkpoints.
+
+    Args:
+        root: Directory holding one sub-directory per run id
+    """
+
+    def __init__(self, root: str = "./output/checkpoints"):
+        self.root = Path(root)
+
+    def _run_dir(self, run_id: str) -> Path:
+        return self.root / run_id
+
+    def load_video(self, run_id: str) -> Optional[VideoInfo]:
+        path = self._run_dir(run_id) / "video.json"
+        if not path.exists():
+            return None
+        info = VideoInfo.model_validate_json(path.read_text())
+        # A checkpoint is only useful while the video it points at still exists
+        return info if Path(info.saved_path).exists() else None
+
+    def save_video(self, run_id: str, info: VideoInfo):
+        atomic_write(self._run_dir(run_id) / "video.json",
+                      info.model_dump_json(indent=2).encode())
+
+    def load_frames(self, run_id: str) -> Optional[List[VideoFrame]]:
+        run_dir = self._run_dir(run_id)
+        manifest = run_dir / "frames.json"
+        if not manifest.exists():
+            return None
+        frames = []
+        for entry in json.loads(manifest.read_text()):
+            image = (run_dir / entry["file"]).read_bytes()
+            frames.append(VideoFrame(idx=entry["idx"], timestamp_s=entry["timestamp_s"], image=image))
+        return frames
+
+    def save_frames(self, run_id: str, frames: List[VideoFrame]):
+        run_dir = self._run_dir(run_id)
+        entries = []
+        for frame in frames:
+            filename = f"frame_{frame.idx}.png"
+            atomic_write(run_dir / filename, frame.image)
+            entries.append({"idx": frame.idx, "timestamp_s": frame.timestamp_s, "file": filename})
+        # Manifest is written last so it only exists once every frame is on disk
+        atomic_write(run_dir / "frames.json", json.dumps(entries).encode())
+
+    def load_criterion(self, run_id: str, criterion: str) -> Optional[JudgeEval]:
+        path = self._run_dir(run_id) / "criteria" / f"{criterion}.json"
+        if not path.exists():
+            return None
+        return JudgeEval.model_validate_json(path.read_text())
+
+    def save_criterion(self, run_id: str, criterion: str, result: JudgeEval):
+        atomic_write(self._run_dir(run_id) / "criteria" / f"{criterion}.json",
+                      result.model_dump_json(indent=2).encode())
+
+    def stages(self, run_id: str) -> List[str]:
+        """Names of the stages already checkpointed for a run."""
+        run_dir = self._run_dir(run_id)
+        stages = []
+        if (run_dir / "video.json").exists():
+            stages.append("video")
+        if (run_dir / "frames.json").exists():
+            stages.append("frames")
+        criteria_dir = run_dir / "criteria"
+        if criteria_dir.exists():
+            stages.extend(sorted(p.stem for p in criteria_dir.glob("*.json")))
+        return stages
+
+    def clear(self, run_id: str):
+        shutil.rmtree(self._run_dir(run_id), ignore_errors=True)
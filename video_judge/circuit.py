@@ -0,0 +1,196 @@
+"""Per-provider circuit breakers.
+
+A degraded provider otherwise costs every model on it a full timeout and
+retry cycle. Each breaker keeps a rolling window of recent call outcomes
+(errors, plus calls slower than slow_call_s) and latencies:
+
+- closed: calls pass; once the window holds min_calls outcomes and the
+  error rate reaches failure_rate, the breaker opens.
+- open: calls fail fast with CircuitOpenError for open_s seconds.
+- half_open: a single probe call is let through; its success closes the
+  breaker (with a fresh window), its failure re-opens it.
+
+Usage:
+    breakers = CircuitBreakers(failure_rate=0.5, open_s=300)
+    with breakers.get("fal").guard():
+        video_info = generator.run_video_gen(prompt)
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, Optional, Tuple
+
+from video_judge.config.logger import logger
+from video_judge.models import CircuitHealth
+
+
+# Exceptions that end a call without it having succeeded or failed
+ABANDONED = (asyncio.CancelledError, KeyboardInterrupt, GeneratorExit)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a backend whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Rolling-window breaker for one provider or judge backend.
+
+    Args:
+        name: Backend name, used in logs and errors
+        failure_rate: Error rate in the window that opens the breaker
+        window: Number of recent outcomes considered
+        min_calls: Outcomes needed before the breaker may open
+        open_s: Seconds to fail fast before letting a probe through
+        slow_call_s: Calls taking longer count as failures (None: latency is only reported)
+        clock: Monotonic time source
+    """
+
+    def __init__(self, name: str, failure_rate: float = 0.5, window: int = 10, min_calls: int = 3,
+                 open_s: float = 60.0, slow_call_s: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_s = open_s
+        self.slow_call_s = slow_call_s
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._outcomes: Deque[Tuple[bool, float]] = deque(maxlen=window)
+        self._state = "closed"
+        self._opened_at = 0.0
+        self._probing = False
+        self.rejected = 0
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == "open" and self.clock() - self._opened_at >= self.open_s:
+            self._state = "half_open"
+        return self._state
+
+    def _open(self):
+        self._state = "open"
+        self._opened_at = self.clock()
+        self.trips += 1
+
+    def allow(self) -> bool:
+        """Claim a call slot; False while open or while a half-open probe is in flight."""
+        with self._lock:
+            state = self._current_state()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._probing:
+                self._probing = True
+                logger.info(f"Circuit {self.name} half-open, probing with one request")
+                return True
+            self.rejected += 1
+            return False
+
+    def record(self, ok: bool, latency_s: float):
+        """Record the outcome of a call admitted by allow()."""
+        if self.slow_call_s is not None and latency_s > self.slow_call_s:
+            ok = False
+        with self._lock:
+            if self._probing:
+                self._probing = False
+                if ok:
+                    logger.info(f"Circuit {self.name} probe succeeded, closing")
+                    self._state = "closed"
+                    self._outcomes.clear()
+                else:
+                    logger.warning(f"Circuit {self.name} probe failed, re-opening for {self.open_s:.0f}s")
+                    self._open()
+                self._outcomes.append((ok, latency_s))
+                return
+            self._outcomes.append((ok, latency_s))
+            failures = sum(not outcome for outcome, _ in self._outcomes)
+            if (self._state == "closed" and len(self._outcomes) >= self.min_calls
+                    and failures / len(self._outcomes) >= self.failure_rate):
+                logger.warning(
+                    f"Circuit {self.name} opening for {self.open_s:.0f}s: "
+                    f"{failures}/{len(self._outcomes)} recent calls failed")
+                self._open()
+
+    def release(self):
+        """Give back a slot without recording an outcome (e.g. the call was cancelled)."""
+        with self._lock:
+            self._probing = False
+
+    @contextmanager
+    def guard(self, neutral: Tuple[type, ...] = ()) -> Iterator[None]:
+        """Run the enclosed call through the breaker.
+
+        Raises CircuitOpenError without running it while open. Task cancellation
+        is never recorded. Exceptions of the neutral types neither count as
+        failures nor successes either, unless the call was also slower than
+        slow_call_s.
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"Circuit for {self.name} is open, skipping call")
+        started = self.clock()
+        try:
+            yield
+        except ABANDONED:
+            # The caller went away (task cancelled, interpreter stopping); says nothing about the backend
+            self.release()
+            raise
+        except neutral:
+            elapsed = self.clock() - started
+            if self.slow_call_s is not None and elapsed > self.slow_call_s:
+                self.record(False, elapsed)
+            else:
+                self.release()
+            raise
+        except Exception:
+            self.record(False, self.clock() - started)
+            raise
+        self.record(True, self.clock() - started)
+
+    def health(self) -> CircuitHealth:
+        with self._lock:
+            latencies = [latency for _, latency in self._outcomes]
+            failures = sum(not ok for ok, _ in self._outcomes)
+            return CircuitHealth(
+                state=self._current_state(),
+                calls=len(self._outcomes),
+                failures=failures,
+                error_rate=failures / len(self._outcomes) if self._outcomes else 0.0,
+                mean_latency_s=sum(latencies) / len(latencies) if latencies else None,
+                max_latency_s=max(latencies) if latencies else None,
+                rejected=self.rejected,
+                trips=self.trips,
+            )
+
+
+class CircuitBreakers:
+    """Registry of breakers sharing one configuration, created on first use.
+
+    Keep one instance across fights (e.g. on the arena) so a multi-prompt run
+    remembers which backends are failing. Keyword arguments are passed to
+    every CircuitBreaker; per_name overrides them for specific names, e.g.
+    {"openai": {"slow_call_s": 900}}.
+    """
+
+    def __init__(self, per_name: Optional[Dict[str, dict]] = None, **options):
+        self.options = options
+        self.per_name = per_name or {}
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            if name not in self._breakers:
+                self._breakers[name] = CircuitBreaker(name, **{**self.options, **self.per_name.get(name, {})})
+            return self._breakers[name]
+
+    def health(self) -> Dict[str, CircuitHealth]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.health() for name, breaker in sorted(breakers.items())}
@@ -1 +1,9 @@
 EVAL_CRITERIA = ("prompt_alignment", "temporal_consistency")
+
+# Criteria weighted into Report.scores["overall"], in judging order
+CRITERION_WEIGHTS = {
+    "prompt_alignment": 0.5,
+    "temporal_consistency": 0.3,
+    "aesthetic_quality": 0.1,
+    "technical_quality": 0.1,
+}
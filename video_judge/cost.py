@@ -0,0 +1,222 @@
+"""Token and dollar cost estimates for judge payloads.
+
+Estimates image and text input tokens per provider from frame dimensions and
+prompt lengths, fits a payload into a per-call budget by downscaling and then
+dropping frames, and records predicted versus actual usage from responses so
+the estimates can be calibrated.
+
+Image formulas follow each provider's published rules:
+    openai: fit within 2048x2048, shortest side to 768, 170 tokens per 512px tile + 85
+    claude: fit within 1568px on the long edge, width * height / 750
+    gemini: 258 tokens if both sides <= 384, else 258 per 768x768 tile
+"""
+
+import math
+import statistics
+import struct
+import threading
+from collections import defaultdict
+from typing import Dict, List, Literal, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from video_judge.config.logger import logger
+from video_judge.models import PayloadEstimate
+
+Provider = Literal["openai", "claude", "gemini"]
+
+# USD per million input tokens; "default" covers models not listed
+INPUT_PRICE_PER_MTOK: Dict[str, float] = {
+    "gpt-4o": 2.50,
+    "gpt-4.1": 2.00,
+    "gpt-5": 1.25,
+    "gemini-2.5-pro": 1.25,
+    "gemini-2.5-flash": 0.30,
+    "claude-sonnet-3-5": 3.00,
+    "claude-sonnet-4-5": 3.00,
+    "claude-opus-4-1": 15.00,
+    "default": 3.00,
+}
+CHARS_PER_TEXT_TOKEN = 4
+# Size assumed for image bytes whose header can't be parsed
+FALLBACK_IMAGE_SIZE = (1024, 1024)
+# Downscale step and floor used by fit_payload before it starts dropping frames
+DOWNSCALE_STEP = 0.75
+MIN_FIT_WIDTH = 384
+
+
+def image_size(image: bytes) -> Optional[Tuple[int, int]]:
+    """(width, height) from a PNG or JPEG header without decoding pixels."""
+    if image[:8] == b"\x89PNG\r\n\x1a\n" and len(image) >= 24:
+        return struct.unpack(">II", image[16:24])
+    if image[:2] == b"\xff\xd8":
+        pos = 2
+        while pos + 9 < len(image):
+            if image[pos] != 0xFF:
+                pos += 1
+                continue
+            marker = image[pos + 1]
+            length = struct.unpack(">H", image[pos + 2:pos + 4])[0]
+            # SOF0-SOF15, excluding DHT (C4), JPG (C8) and DAC (CC)
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack(">HH", image[pos + 5:pos + 9])
+                return width, height
+            pos += 2 + length
+    return None
+
+
+def image_tokens(provider: Provider, width: int, height: int) -> int:
+    """Input tokens one image of the given size costs on a provider."""
+    if provider == "openai":
+        scale = min(1.0, 2048 / max(width, height))
+        width, height = width * scale, height * scale
+        scale = min(1.0, 768 / min(width, height))
+        width, height = width * scale, height * scale
+        return 85 + 170 * math.ceil(width / 512) * math.ceil(height / 512)
+    if provider == "claude":
+        scale = min(1.0, 1568 / max(width, height))
+        return max(1, math.ceil(width * scale * height * scale / 750))
+    if width <= 384 and height <= 384:
+        return 258
+    return 258 * math.ceil(width / 768) * math.ceil(height / 768)
+
+
+def text_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TEXT_TOKEN)
+
+
+def price_per_mtok(model: str) -> float:
+    return INPUT_PRICE_PER_MTOK.get(model, INPUT_PRICE_PER_MTOK["default"])
+
+
+def estimate_payload(provider: Provider, model: str, images: List[bytes], user_prompts: List[str],
+                     system_prompt: str = "") -> PayloadEstimate:
+    """Predicted input tokens and dollar cost of a judge call, scaled by past calibration."""
+    sizes = [image_size(img) or FALLBACK_IMAGE_SIZE for img in images]
+    img_tokens = sum(image_tokens(provider, w, h) for w, h in sizes)
+    txt_tokens = sum(text_tokens(p) for p in user_prompts) + text_tokens(system_prompt)
+    total = math.ceil((img_tokens + txt_tokens) * usage_tracker.calibration(provider, model))
+    return PayloadEstimate(
+        provider=provider,
+        model=model,
+        image_tokens=img_tokens,
+        text_tokens=txt_tokens,
+        total_tokens=total,
+        cost_usd=total * price_per_mtok(model) / 1_000_000,
+    )
+
+
+def _downscale(image: bytes, scale: float) -> bytes:
+    decoded = cv2.imdecode(np.frombuffer(image, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if decoded is None:
+        return image
+    h, w = decoded.shape[:2]
+    resized = cv2.resize(decoded, (max(1, round(w * scale)), max(1, round(h * scale))),
+                         interpolation=cv2.INTER_AREA)
+    ext = ".png" if image[:4] == b"\x89PNG" else ".jpg"
+    success, buffer = cv2.imencode(ext, resized)
+    return buffer.tobytes() if success else image
+
+
+def _select(images: List[bytes], user_prompts: List[str], keep: List[int]) -> Tuple[List[bytes], List[str]]:
+    """Keep the given frames with their paired prompts, plus all text-only prompts."""
+    n = len(images)
+    paired = [user_prompts[i] for i in keep if i < len(user_prompts)]
+    return [images[i] for i in keep], paired + user_prompts[n:]
+
+
+def fit_payload(provider: Provider, model: str, images: List[bytes], user_prompts: List[str],
+                system_prompt: str = "", max_input_tokens: Optional[int] = None,
+                max_cost_usd: Optional[float] = None) -> Tuple[List[bytes], List[str], PayloadEstimate]:
+    """Shrink a payload until it fits the token and/or dollar budget.
+
+    Frames are downscaled in DOWNSCALE_STEP steps down to MIN_FIT_WIDTH, then
+    evenly spaced subsets of fewer frames are tried (first and last are always
+    kept), each frame together with its paired prompt (prompt i labels image
+    i). Text-only prompts after the images are never dropped.
+
+    Returns:
+        (images, user_prompts, estimate of the fitted payload)
+    """
+    def fits(est: PayloadEstimate) -> bool:
+        return ((max_input_tokens is None or est.total_tokens <= max_input_tokens)
+                and (max_cost_usd is None or est.cost_usd <= max_cost_usd))
+
+    estimate = estimate_payload(provider, model, images, user_prompts, system_prompt)
+    if fits(estimate):
+        return images, user_prompts, estimate
+    original = (len(images), estimate.total_tokens)
+
+    while not fits(estimate):
+        widths = [(image_size(img) or FALLBACK_IMAGE_SIZE)[0] for img in images]
+        if not widths or max(widths) * DOWNSCALE_STEP < MIN_FIT_WIDTH:
+            break
+        downscaled = [_downscale(img, DOWNSCALE_STEP) if w * DOWNSCALE_STEP >= MIN_FIT_WIDTH else img
+                      for img, w in zip(images, widths)]
+        if downscaled == images:
+            # Nothing decodable left to shrink
+            break
+        images = downscaled
+        estimate = estimate_payload(provider, model, images, user_prompts, system_prompt)
+
+    full_images, full_prompts = images, user_prompts
+    count = len(full_images)
+    while not fits(estimate) and count > 2:
+        count -= 1
+        keep = np.round(np.linspace(0, len(full_images) - 1, count)).astype(int).tolist()
+        images, user_prompts = _select(full_images, full_prompts, keep)
+        estimate = estimate_payload(provider, model, images, user_prompts, system_prompt)
+
+    if not fits(estimate):
+        logger.warning(f"Payload for {model} still over budget at {estimate.total_tokens} tokens "
+                       f"(${estimate.cost_usd:.4f}) after fitting")
+    logger.info(f"Fitted {model} payload from {original[0]} images/{original[1]} tokens to "
+                f"{len(images)} images/{estimate.total_tokens} tokens")
+    return images, user_prompts, estimate
+
+
+def actual_input_tokens(response) -> Optional[int]:
+    """Input token count reported in an OpenAI, Anthropic or Gemini response."""
+    usage = getattr(response, "usage", None)
+    if usage is not None and isinstance(getattr(usage, "input_tokens", None), int):
+        return usage.input_tokens
+    metadata = getattr(response, "usage_metadata", None)
+    if metadata is not None and isinstance(getattr(metadata, "prompt_token_count", None), int):
+        return metadata.prompt_token_count
+    return None
+
+
+class UsageTracker:
+    """Predicted vs actual input tokens per (provider, model), for calibrating estimates."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples: Dict[Tuple[str, str], List[Tuple[int, int]]] = defaultdict(list)
+
+    def record(self, provider: str, model: str, predicted: int, response):
+        """Store one call's prediction (uncalibrated tokens) against the response's usage."""
+        actual = actual_input_tokens(response)
+        if actual is None:
+            return
+        with self._lock:
+            self._samples[(provider, model)].append((predicted, actual))
+        logger.info(f"{provider}/{model} input tokens: predicted {predicted}, actual {actual} "
+                    f"({actual / max(predicted, 1):.2f}x)")
+
+    def samples(self, provider: str, model: str) -> List[Tuple[int, int]]:
+        with self._lock:
+            return list(self._samples[(provider, model)])
+
+    def calibration(self, provider: str, model: str) -> float:
+        """Median actual/predicted ratio seen so far (1.0 without samples)."""
+        samples = self.samples(provider, model)
+        ratios = [actual / predicted for predicted, actual in samples if predicted > 0]
+        return statistics.median(ratios) if ratios else 1.0
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+
+usage_tracker = UsageTracker()
@@ -1,22 +1,62 @@
+import hashlib
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+from video_judge.utils.file_utils import atomic_write
 from video_judge.input_builders import (
     build_claude_input_with_text,
     build_gemini_input_with_text,
     build_openai_input_with_text,
 )
-from video_judge.utils.format import format_prompt
+from video_judge.templates import prompt_templates
 from video_judge.models import PromptDecomposition
 from video_judge.config.logger import logger
 
 
+class DecompositionCache:
+    """On-disk memo of decompositions keyed by (provider, model, prompt hash, template hash).
+
+    Editing video_judge/prompts/decompose.txt changes the template hash, so stale entries
+    are simply never hit again.
+
+    Args:
+        root: Directory holding one JSON file per decomposition
+    """
+
+    def __init__(self, root: str = "./output/decompositions"):
+        self.root = Path(root)
+
+    def _path(self, provider: str, model: str, prompt: str, template_hash: str) -> Path:
+        prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+        key = hashlib.sha256(f"{provider}\0{model}\0{prompt_hash}\0{template_hash}".encode()).hexdigest()[:24]
+        return self.root / f"{key}.json"
+
+    def get(self, provider: str, model: str, prompt: str, template_hash: str) -> Optional[PromptDecomposition]:
+        path = self._path(provider, model, prompt, template_hash)
+        if not path.exists():
+            return None
+        return PromptDecomposition.model_validate_json(path.read_text())
+
+    def put(self, provider: str, model: str, prompt: str, template_hash: str, decomposition: PromptDecomposition):
+        atomic_write(self._path(provider, model, prompt, template_hash),
+                      decomposition.model_dump_json(indent=2).encode())
+
+
 class BaseDecomposer(ABC):
     """Base class for prompt decomposition using LLMs.
 
     Subclasses implement _call_api() to use provider-specific APIs.
+
+    Args:
+        cache: Optional on-disk cache; repeated prompts skip the API call
     """
+    provider: str
     default_model: str
 
+    def __init__(self, cache: Optional[DecompositionCache] = None):
+        self.cache = cache
+
     def decompose(self, user_prompt: str, model: Optional[str] = None) -> PromptDecomposition:
         """Decompose a video generation prompt into structured criteria.
 
@@ -27,7 +67,14 @@ class BaseDecomposer(ABC):
         Returns:
             PromptDecomposition with entities, actions, locations, etc.
         """
-        system_prompt = format_prompt("./prompts/decompose.txt")
+        model = model or self.default_model
+        template = prompt_templates.get("decompose")
+        if self.cache:
+            cached = self.cache.get(self.provider, model, user_prompt, template.hash)
+            if cached:
+                logger.info(f"Reusing cached decomposition from {self.provider}/{model}")
+                return cached
+        system_prompt = template.render()
         formatted_prompt = (
             "Decompose the following prompt into structured, verifiable criteria "
             "that judges can check against sampled video frames:\n\n"
@@ -36,11 +83,32 @@ class BaseDecomposer(ABC):
         response = self._call_api(
             user_prompt=formatted_prompt,
             system_instruction=system_prompt,
-            model=model or self.default_model,
+            model=model,
         )
         logger.info(f"Decomposition result: {response}")
+        if self.cache:
+            self.cache.put(self.provider, model, user_prompt, template.hash, response)
         return response
 
+    def decompose_many(self, prompts: List[str], model: Optional[str] = None,
+                       max_workers: int = 8) -> Dict[str, PromptDecomposition]:
+        """Decompose a prompt suite concurrently, at most max_workers calls in flight.
+
+        Duplicate prompts are decomposed once. Prompts whose call fails are
+        logged and left out of the result.
+        """
+        unique = list(dict.fromkeys(prompts))
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {prompt: pool.submit(self.decompose, prompt, model) for prompt in unique}
+            for prompt, future in futures.items():
+                try:
+                    results[prompt] = future.result()
+                except Exception as e:
+                    logger.error(f"Decomposing prompt {prompt[:40]!r} failed: {type(e).__name__}: {e}")
+        logger.info(f"Decomposed {len(results)}/{len(unique)} prompts")
+        return results
+
     @abstractmethod
     def _call_api(
         self, user_prompt: str, system_instruction: str, model: str
@@ -51,6 +119,7 @@ class BaseDecomposer(ABC):
 
 class ClaudeDecomposer(BaseDecomposer):
     """Decompose prompts using Anthropic Claude."""
+    provider = "claude"
     default_model = "claude-sonnet-3-5"
 
     def _call_api(
@@ -66,6 +135,7 @@ class ClaudeDecomposer(BaseDecomposer):
 
 class GeminiDecomposer(BaseDecomposer):
     """Decompose prompts using Google Gemini."""
+    provider = "gemini"
     default_model = "gemini-2.5-pro"
 
     def _call_api(
@@ -81,6 +151,7 @@ class GeminiDecomposer(BaseDecomposer):
 
 class OpenAIDecomposer(BaseDecomposer):
     """Decompose prompts using OpenAI."""
+    provider = "openai"
     default_model = "gpt-4o"
 
     def _call_api(
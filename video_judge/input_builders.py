@@ -7,6 +7,7 @@ from google.auth.exceptions import GoogleAuthError
 from google.genai.errors import ServerError, ClientError
 from video_judge.ai_api_client import google_client, openai_client, anthropic_client
 from video_judge.config.logger import logger
+from video_judge.cost import usage_tracker
 from video_judge.utils.file_utils import create_image_input
 from google.genai import types
 from openai import AuthenticationError, RateLimitError, PermissionDeniedError
@@ -14,6 +15,9 @@ import base64
 
 T = TypeVar("T", bound=BaseModel)
 
+# Messages API requires an explicit output cap
+CLAUDE_MAX_TOKENS = 4096
+
 
 @retry(
     retry=retry_if_not_exception_type(
@@ -29,15 +33,18 @@ def build_gemini_input_with_image_list(
     system_instruction: str,
     response_schema: Optional[Type[T]] = None,
     model: str = "gemini-2.5-pro",
+    predicted_input_tokens: Optional[int] = None,
 ):
     """Call Gemini API with images and text prompts.
 
     Args:
         image_bytes_list: List of image bytes to send
-        user_prompt_list: List of text prompts (can exceed image count for text-only prompts)
+        user_prompt_list: List of text prompts; prompt i follows image i (a frame label or a
+            contact-sheet cell mapping) and extras beyond the image count are sent as text only
         system_instruction: System instruction for model behavior
         response_schema: Optional Pydantic model for structured output
         model: Gemini model ID (default: gemini-2.5-pro)
+        predicted_input_tokens: Estimated input tokens, logged against actual usage
 
     Returns:
         Parsed Pydantic model if response_schema provided, otherwise raw text
@@ -73,6 +80,8 @@ def build_gemini_input_with_image_list(
         config=generation_config,
     )
     logger.debug(f"Recieved response: {response}")
+    if predicted_input_tokens is not None:
+        usage_tracker.record("gemini", model, predicted_input_tokens, response)
     if response_schema:
         parsed = response.parsed
         if not parsed:
@@ -194,15 +203,18 @@ def build_openai_input_with_image_list(
     system_instruction: str,
     response_schema: Optional[Type[T]] = None,
     model: str = "gpt-4o",
+    predicted_input_tokens: Optional[int] = None,
 ):
     """Call OpenAI API with images and text prompts.
 
     Args:
         image_bytes_list: List of image bytes to send
-        user_prompt_list: List of text prompts (can exceed image count for text-only prompts)
+        user_prompt_list: List of text prompts; prompt i follows image i (a frame label or a
+            contact-sheet cell mapping) and extras beyond the image count are sent as text only
         system_instruction: System instruction for model behavior
         response_schema: Optional Pydantic model for structured output
         model: OpenAI model ID
+        predicted_input_tokens: Estimated input tokens, logged against actual usage
 
     Returns:
         Parsed Pydantic model if response_schema provided, otherwise raw text
@@ -234,6 +246,8 @@ def build_openai_input_with_image_list(
     if response_schema:
         response = openai_client.client.responses.parse(model=model, temperature=0,
                                                         text_format=response_schema, input=input_list, instructions=system_instruction)
+        if predicted_input_tokens is not None:
+            usage_tracker.record("openai", model, predicted_input_tokens, response)
         parsed = response.output_parsed
         if not parsed:
             raise ValueError(
@@ -243,6 +257,8 @@ def build_openai_input_with_image_list(
         response = openai_client.client.responses.create(
             model=model, input=input_list, instructions=system_instruction, temperature=0
         )
+        if predicted_input_tokens is not None:
+            usage_tracker.record("openai", model, predicted_input_tokens, response)
         return response.output_text
 
 
@@ -253,15 +269,18 @@ def build_claude_input_with_image_list(
     system_instruction: str,
     response_schema: Optional[Type[T]] = None,
     model: str = "claude-sonnet-3-5",
+    predicted_input_tokens: Optional[int] = None,
 ):
     """Call Anthropic Claude API with images and text prompts.
 
     Args:
         image_bytes_list: List of image bytes to send
-        user_prompt_list: List of text prompts (can exceed image count for text-only prompts)
+        user_prompt_list: List of text prompts; prompt i follows image i (a frame label or a
+            contact-sheet cell mapping) and extras beyond the image count are sent as text only
         system_instruction: System instruction for model behavior
         response_schema: Optional Pydantic model for structured output
         model: Claude model ID (default: claude-sonnet-3-5)
+        predicted_input_tokens: Estimated input tokens, logged against actual usage
 
     Returns:
         Parsed Pydantic model if response_schema provided, otherwise Message object
@@ -297,11 +316,14 @@ def build_claude_input_with_image_list(
         response = anthropic_client.client.messages.parse(
             messages=input_list,
             model=model,
+            max_tokens=CLAUDE_MAX_TOKENS,
             output_format=response_schema,
             temperature=0,
             system=system_instruction
 
         )
+        if predicted_input_tokens is not None:
+            usage_tracker.record("claude", model, predicted_input_tokens, response)
         parsed = response.parsed_output
         if not parsed:
             raise ValueError(
@@ -311,9 +333,12 @@ def build_claude_input_with_image_list(
         response = anthropic_client.client.messages.create(
             messages=input_list,
             model=model,
+            max_tokens=CLAUDE_MAX_TOKENS,
             temperature=0,
             system=system_instruction
         )
+        if predicted_input_tokens is not None:
+            usage_tracker.record("claude", model, predicted_input_tokens, response)
         return response
 
 
@@ -351,6 +376,7 @@ def build_claude_input_with_text(
         response = anthropic_client.client.messages.parse(
             messages=input_list,
             model=model,
+            max_tokens=CLAUDE_MAX_TOKENS,
             output_format=response_schema,
             temperature=0,
             system=system_instruction
@@ -364,6 +390,7 @@ def build_claude_input_with_text(
         response = anthropic_client.client.messages.create(
             messages=input_list,
             model=model,
+            max_tokens=CLAUDE_MAX_TOKENS,
             temperature=0,
             system=system_instruction
         )
@@ -0,0 +1,170 @@
+"""Crash-safe local journal of provider jobs and judge results.
+
+Every submitted generation is written to SQLite before we start polling,
+so a crashed or killed run can re-attach to the provider job by its
+request id instead of paying for a second generation. Judge results are
+stored by content key so a resumed run skips criteria already judged.
+
+A journal scopes one benchmark session: jobs are matched by
+(provider, model, prompt), so use a fresh journal path to force new
+generations for the same prompt.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from video_judge.config.logger import logger
+from video_judge.models import JournalJob, JudgeEval, VideoInfo
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    request_id TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt TEXT NOT NULL,
+    state TEXT NOT NULL,
+    video_info TEXT,
+    error TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_lookup ON jobs (provider, model, prompt);
+CREATE TABLE IF NOT EXISTS job_events (
+    request_id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS judgements (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+"""
+
+
+def judgement_key(*parts: str) -> str:
+    """Stable key for a judge call from its identifying inputs."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def images_digest(images: List[bytes]) -> str:
+    """Digest of the exact frames sent to a judge, so resampled or re-encoded frames miss the cache."""
+    digest = hashlib.sha256()
+    for image in images:
+        digest.update(hashlib.sha256(image).digest())
+    return digest.hexdigest()
+
+
+class JobJournal:
+    """SQLite-backed journal of generation jobs and judge results.
+
+    Writes are committed immediately (WAL mode), so state survives a crash
+    at any point after submission.
+
+    Args:
+        path: SQLite file location (parent directories are created)
+    """
+
+    def __init__(self, path: str = "./output/journal.sqlite"):
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            conn = sqlite3.connect(self.path)
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+
+    def record_submission(self, provider: str, model: str, prompt: str, request_id: str):
+        """Record a freshly submitted provider job."""
+        now = datetime.now().isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, 'submitted', NULL, NULL, ?, ?)",
+                (request_id, provider, model, prompt, now, now))
+            conn.execute("INSERT INTO job_events VALUES (?, 'submitted', ?)", (request_id, now))
+        logger.debug(f"Journal: submitted {provider}/{model} job {request_id}")
+
+    def mark(self, request_id: str, state: str, video_info: Optional[VideoInfo] = None,
+             error: Optional[str] = None):
+        """Record a state transition (completed, downloaded, failed) for a job."""
+        now = datetime.now().isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET state = ?, video_info = COALESCE(?, video_info), "
+                "error = COALESCE(?, error), updated_at = ? WHERE request_id = ?",
+                (state, video_info.model_dump_json() if video_info else None, error, now, request_id))
+            conn.execute("INSERT INTO job_events VALUES (?, ?, ?)", (request_id, state, now))
+        logger.debug(f"Journal: job {request_id} -> {state}")
+
+    def find_job(self, provider: str, model: str, prompt: str) -> Optional[JournalJob]:
+        """Most recent non-failed job for (provider, model, prompt), if any."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT request_id, provider, model, prompt, state, video_info, error, updated_at "
+                "FROM jobs WHERE provider = ? AND model = ? AND prompt = ? AND state != 'failed' "
+                "ORDER BY created_at DESC LIMIT 1",
+                (provider, model, prompt)).fetchone()
+        return self._to_job(row) if row else None
+
+    def jobs(self, state: Optional[str] = None) -> List[JournalJob]:
+        """All jobs, optionally filtered by state."""
+        query = ("SELECT request_id, provider, model, prompt, state, video_info, error, updated_at "
+                 "FROM jobs")
+        params: tuple = ()
+        if state:
+            query += " WHERE state = ?"
+            params = (state,)
+        with self._connect() as conn:
+            rows = conn.execute(query + " ORDER BY created_at", params).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def events(self, request_id: str) -> List[str]:
+        """State transitions recorded for a job, oldest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT state FROM job_events WHERE request_id = ? ORDER BY rowid",
+                (request_id,)).fetchall()
+        return [row[0] for row in rows]
+
+    def get_judgement(self, key: str) -> Optional[JudgeEval]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT result FROM judgements WHERE key = ?", (key,)).fetchone()
+        return JudgeEval.model_validate_json(row[0]) if row else None
+
+    def record_judgement(self, key: str, result: JudgeEval):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO judgements VALUES (?, ?, ?)",
+                (key, result.model_dump_json(), datetime.now().isoformat()))
+
+    @staticmethod
+    def _to_job(row) -> JournalJob:
+        request_id, provider, model, prompt, state, video_info, error, updated_at = row
+        return JournalJob(
+            request_id=request_id,
+            provider=provider,
+            model=model,
+            prompt=prompt,
+            state=state,
+            video_info=VideoInfo.model_validate_json(video_info) if video_info else None,
+            error=error,
+            updated_at=datetime.fromisoformat(updated_at),
+        )
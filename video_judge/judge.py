@@ -1,11 +1,33 @@
 from abc import abstractmethod, ABC
-from typing import List
+from typing import List, Optional
+from video_judge.cost import fit_payload
 from video_judge.input_builders import build_gemini_input_with_image_list, build_openai_input_with_image_list, build_claude_input_with_image_list
 from video_judge.models import JudgeEval
 
 
 class BaseJudge(ABC):
-    """Base class for video judges."""
+    """Base class for video judges.
+
+    Args:
+        max_input_tokens: Per-call input token budget; frames are downscaled or dropped to fit
+        max_cost_usd: Per-call input cost budget in dollars
+    """
+
+    provider: str
+    default_model: str
+
+    def __init__(self, max_input_tokens: Optional[int] = None, max_cost_usd: Optional[float] = None):
+        self.max_input_tokens = max_input_tokens
+        self.max_cost_usd = max_cost_usd
+
+    def _fit(self, images: List[bytes], user_prompts: List[str], system_prompt: str, kwargs: dict) -> tuple:
+        """Fit the payload to the budget and attach the token prediction for usage logging."""
+        model = kwargs.setdefault("model", self.default_model)
+        images, user_prompts, estimate = fit_payload(
+            self.provider, model, images, user_prompts, system_prompt,
+            max_input_tokens=self.max_input_tokens, max_cost_usd=self.max_cost_usd)
+        kwargs["predicted_input_tokens"] = estimate.image_tokens + estimate.text_tokens
+        return images, user_prompts
 
     @abstractmethod
     def evaluate(self, images: List[bytes], user_prompts: List[str], system_prompt: str, **kwargs) -> JudgeEval:
@@ -16,8 +38,12 @@ class BaseJudge(ABC):
 class GeminiJudge(BaseJudge):
     """Gemini-based judge implementation."""
 
+    provider = "gemini"
+    default_model = "gemini-2.5-pro"
+
     def evaluate(self, images: List[bytes], user_prompts: List[str], system_prompt: str, **kwargs) -> JudgeEval:
         """Evaluate images using Gemini API."""
+        images, user_prompts = self._fit(images, user_prompts, system_prompt, kwargs)
         response: JudgeEval = build_gemini_input_with_image_list(
             image_bytes_list=images,
             user_prompt_list=user_prompts,
@@ -31,7 +57,11 @@ class GeminiJudge(BaseJudge):
 class OpenAIJudge(BaseJudge):
     """OpenAI-API based LLM judge"""
 
+    provider = "openai"
+    default_model = "gpt-4o"
+
     def evaluate(self, images, user_prompts, system_prompt, **kwargs):
+        images, user_prompts = self._fit(images, user_prompts, system_prompt, kwargs)
         response: JudgeEval = build_openai_input_with_image_list(
             image_bytes_list=images, user_prompt_list=user_prompts, system_instruction=system_prompt, response_schema=JudgeEval, ** kwargs)
         return response
@@ -40,7 +70,11 @@ class OpenAIJudge(BaseJudge):
 class ClaudeJudge(BaseJudge):
     """Claude-API based LLM judge"""
 
+    provider = "claude"
+    default_model = "claude-sonnet-3-5"
+
     def evaluate(self, images, user_prompts, system_prompt, **kwargs):
+        images, user_prompts = self._fit(images, user_prompts, system_prompt, kwargs)
         response: JudgeEval = build_claude_input_with_image_list(
             image_bytes_list=images, user_prompt_list=user_prompts, system_instruction=system_prompt, response_schema=JudgeEval, ** kwargs)
         return response
@@ -0,0 +1,111 @@
+"""Local, vectorized technical-quality metrics for sampled frames.
+
+Cheap pixel statistics that catch obviously broken videos (blurry, blown
+out, flickering, heavily compressed) without a judge call. Everything is
+computed on a stacked (N, H, W) luminance array in one pass per metric.
+"""
+
+from typing import List, Optional
+
+import cv2
+import numpy as np
+
+from video_judge.models import TechnicalMetrics
+
+# Laplacian variance at/above which a frame counts as fully sharp
+SHARPNESS_FULL = 100.0
+# Luminance levels treated as crushed blacks / blown highlights
+CLIP_LOW, CLIP_HIGH = 5, 250
+# Fraction of clipped pixels that scores 0 for exposure
+CLIP_FRACTION_MAX = 0.5
+# Mean inter-frame luminance jump (0-1 scale) that scores 0 for flicker
+FLICKER_MAX = 0.2
+# Block-boundary / interior gradient ratio above 1 that scores 0 for blockiness
+BLOCKINESS_EXCESS_MAX = 1.0
+# Overall score below which the technical_quality judge call is skipped in "gate" mode
+GATE_FAIL_SCORE = 0.35
+
+
+def frames_to_array(images: List[bytes]) -> np.ndarray:
+    """Decode encoded frames into a stacked (N, H, W) float32 luminance array."""
+    decoded = [cv2.imdecode(np.frombuffer(img, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+               for img in images]
+    return np.stack(decoded).astype(np.float32)
+
+
+def laplacian_variance(gray: np.ndarray) -> np.ndarray:
+    """Per-frame variance of the 4-neighbour Laplacian (higher is sharper)."""
+    lap = (gray[:, :-2, 1:-1] + gray[:, 2:, 1:-1] + gray[:, 1:-1, :-2] + gray[:, 1:-1, 2:]
+           - 4 * gray[:, 1:-1, 1:-1])
+    return lap.var(axis=(1, 2))
+
+
+def clipped_fraction(gray: np.ndarray) -> np.ndarray:
+    """Per-frame fraction of pixels crushed to black or blown to white."""
+    return ((gray <= CLIP_LOW) | (gray >= CLIP_HIGH)).mean(axis=(1, 2))
+
+
+def luminance_flicker(gray: np.ndarray) -> float:
+    """Mean absolute jump in average luminance between consecutive frames (0-1 scale)."""
+    if len(gray) < 2:
+        return 0.0
+    return float(np.abs(np.diff(gray.mean(axis=(1, 2)))).mean() / 255.0)
+
+
+def blockiness(gray: np.ndarray, block: int = 8) -> np.ndarray:
+    """Per-frame ratio of horizontal gradients on block boundaries vs inside blocks.
+
+    Around 1.0 for clean frames; well above 1.0 when codec block edges show.
+    """
+    grad = np.abs(np.diff(gray, axis=2))
+    cols = np.arange(grad.shape[2])
+    on_boundary = (cols % block) == block - 1
+    boundary = grad[:, :, on_boundary].mean(axis=(1, 2))
+    interior = grad[:, :, ~on_boundary].mean(axis=(1, 2))
+    return boundary / np.maximum(interior, 1e-6)
+
+
+def compute_technical_metrics(gray: np.ndarray, frame_indices: Optional[List[int]] = None) -> TechnicalMetrics:
+    """Score a stack of luminance frames on sharpness, exposure, flicker and blockiness.
+
+    Args:
+        gray: (N, H, W) luminance array, e.g. from frames_to_array
+        frame_indices: Original video frame index per row, used to report offending frames
+
+    Returns:
+        TechnicalMetrics with raw statistics, a 0-1 score and human-readable issues
+    """
+    frame_indices = frame_indices if frame_indices is not None else list(range(len(gray)))
+    sharpness = laplacian_variance(gray)
+    clipped = clipped_fraction(gray)
+    flicker = luminance_flicker(gray)
+    blocks = blockiness(gray)
+
+    sub_scores = np.array([
+        np.clip(np.median(sharpness) / SHARPNESS_FULL, 0, 1),
+        1 - np.clip(clipped.mean() / CLIP_FRACTION_MAX, 0, 1),
+        1 - np.clip(flicker / FLICKER_MAX, 0, 1),
+        1 - np.clip((blocks.mean() - 1) / BLOCKINESS_EXCESS_MAX, 0, 1),
+    ])
+
+    issues = []
+    for name, mask in (
+        ("blurry", sharpness < SHARPNESS_FULL * 0.25),
+        ("clipped exposure", clipped > CLIP_FRACTION_MAX * 0.5),
+        ("compression blocking", blocks > 1 + BLOCKINESS_EXCESS_MAX * 0.5),
+    ):
+        flagged = [frame_indices[i] for i in np.flatnonzero(mask)]
+        if flagged:
+            issues.append(f"{name} in frames {flagged}")
+    if flicker > FLICKER_MAX * 0.5:
+        issues.append(f"luminance flicker ({flicker:.3f} mean jump)")
+
+    return TechnicalMetrics(
+        sharpness=sharpness.tolist(),
+        clipped_fraction=clipped.tolist(),
+        flicker=flicker,
+        blockiness=blocks.tolist(),
+        # Blend the average with the worst sub-score so one severe defect can't be averaged away
+        score=float(0.5 * sub_scores.mean() + 0.5 * sub_scores.min()),
+        issues=issues,
+    )
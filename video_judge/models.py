@@ -22,6 +22,30 @@ class VideoFrame(BaseModel):
     timestamp_s: float
 
 
+class FrameSampling(BaseModel):
+    num_frames: int = 8
+    strategy: Literal["uniform", "adaptive"] = "uniform"
+    max_image_tokens: Optional[int] = None  # cost cap; lowers num_frames to fit
+    token_provider: Literal["openai", "claude", "gemini"] = "claude"  # judge whose image pricing the cap counts in
+    dedup_similarity: Optional[float] = None  # drop frames at least this similar (0-1) to the last kept
+    max_width: Optional[int] = None  # downscale wider frames to this width
+
+
+class FramePacking(BaseModel):
+    columns: int = 3
+    rows: int = 3
+    tile_width: int = 512  # pixels per tile; height follows the frame aspect ratio
+    jpeg_quality: int = 90
+
+
+class ContactSheet(BaseModel):
+    image: bytes
+    columns: int
+    rows: int
+    frame_indices: List[int]  # row-major, one per filled cell
+    timestamps: List[float]
+
+
 class Evidence(BaseModel):
     frame: int
     timestamp: float
@@ -34,11 +58,47 @@ class JudgeEval(BaseModel):
     evidence: List[Evidence]
 
 
+class PayloadEstimate(BaseModel):
+    provider: str
+    model: str
+    image_tokens: int
+    text_tokens: int
+    total_tokens: int  # image + text, scaled by the calibration factor
+    cost_usd: float
+
+
+class TechnicalMetrics(BaseModel):
+    sharpness: List[float]  # Laplacian variance per frame
+    clipped_fraction: List[float]  # share of crushed/blown pixels per frame
+    flicker: float  # mean inter-frame luminance jump, 0-1
+    blockiness: List[float]  # block-boundary / interior gradient ratio per frame
+    score: float
+    issues: List[str]
+
+
+class TemporalAnalysis(BaseModel):
+    fps: float
+    analyzed_frames: int
+    frame_diff: List[float]  # mean absolute difference per consecutive pair
+    histogram_delta: List[float]  # luminance histogram L1 distance per pair
+    flow_magnitude: List[float]  # mean optical-flow magnitude per pair
+    warp_residual: List[float]  # error left after flow compensation per pair
+    scene_cuts: List[float]  # timestamps (s)
+    discontinuities: List[float]  # timestamps (s)
+    score: float
+
+    @property
+    def suspicious_timestamps(self) -> List[float]:
+        return sorted(self.scene_cuts + self.discontinuities)
+
+
 class Report(BaseModel):
     input: Dict[str, Any]
     scores: Dict[str, float]
     details: List[Dict]
     video_path: str
+    technical_metrics: Optional[TechnicalMetrics] = None
+    temporal_analysis: Optional[TemporalAnalysis] = None
 
 
 class ArenaRun(BaseModel):
@@ -46,22 +106,61 @@ class ArenaRun(BaseModel):
     report: Report
 
 
+class ArenaRunFailure(BaseModel):
+    model: str
+    error: str
+    error_type: str
+    run_id: Optional[str] = None
+
+
+class CircuitHealth(BaseModel):
+    state: Literal["closed", "open", "half_open"]
+    calls: int  # outcomes in the rolling window
+    failures: int  # errors and slow calls in the window
+    error_rate: float
+    mean_latency_s: Optional[float] = None
+    max_latency_s: Optional[float] = None
+    rejected: int = 0  # calls failed fast while open, since creation
+    trips: int = 0  # times the breaker opened, since creation
+
+
 class ArenaReport(BaseModel):
     prompt: str
     results: List[ArenaRun]
     winner: str
     rankings: List[str]
+    run_id: Optional[str] = None
+    failures: List[ArenaRunFailure] = []
+    health: Dict[str, CircuitHealth] = {}  # per provider / judge backend, when circuit breakers are enabled
 
 
-class ArenaRunFailure(BaseModel):
+class RankingStability(BaseModel):
+    prompts: List[str]  # one per fight
+    baseline_winners: List[str]  # per fight
+    winners: List[List[str]]  # per weight config, per fight
+    winner_agreement: List[float]  # per fight: share of configs with the baseline winner
+    pairwise_agreement: List[float]  # per fight: mean share of model pairs in baseline order
+
+
+class BatchItem(BaseModel):
+    video_path: str
+    prompt: str
+
+
+class ProgressEvent(BaseModel):
     model: str
-    error: str
-    error_type: str
+    stage: Literal["submitted", "generating", "downloaded", "criterion_judged"]
+    progress: Optional[float] = None  # percent complete, when the provider reports it
+    criterion: Optional[str] = None
+    score: Optional[float] = None
+    timestamp: datetime = Field(default_factory=datetime.now)
 
 
 class VideoGenModelConfig(BaseModel):
     provider: Literal["fal", "openai", "google"]
     model_id: str
+    # fal only: "background"/"skip" judge straight from the result URL and archive later or never
+    download: Literal["sync", "background", "stream", "skip"] = "sync"
 
 
 class PromptDecomposition(BaseModel):
@@ -70,3 +169,14 @@ class PromptDecomposition(BaseModel):
     locations: List[str]  # ["lavender field"]
     time_of_day: Optional[str]  # "sunset"
     style_attributes: List[str]  # ["cinematic", "epic scale"]
+
+
+class JournalJob(BaseModel):
+    request_id: str
+    provider: str
+    model: str
+    prompt: str
+    state: Literal["submitted", "completed", "downloaded", "failed"]
+    video_info: Optional[VideoInfo] = None
+    error: Optional[str] = None
+    updated_at: datetime
@@ -0,0 +1,303 @@
+"""Offline prompt decomposition from local rules.
+
+OfflineDecomposer fills a PromptDecomposition without a network call, so
+prompt suites can be decomposed instantly and for free (e.g. for quick
+local runs, or as a fallback when no LLM key is configured). It is a
+heuristic, not a parser:
+
+- Sentences are split into comma clauses; a clause made of style
+  vocabulary with no verb ("cinematic wide shot", "epic scale") is a style
+  attribute, as is a style head in "<style> of <subject>".
+- Time of day is the first time-of-day lexicon term in the prompt.
+- The noun phrase that opens a narrative clause is its subject: an entity,
+  or a location when its head noun is a place ("the ground", "the sky").
+- A verb is an -ing/-ed word following a noun phrase, a clause-initial
+  -ing word, or a lexicon motion verb; its action phrase keeps adverbs,
+  a short object and the head of a following prepositional phrase
+  ("running through forest").
+- Locations are prepositional phrases whose head noun is a place.
+
+examples/benchmark_offline_decomposer.py measures agreement with the LLM
+decomposers and the per-prompt latency of both.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+from video_judge.decomposer import BaseDecomposer
+from video_judge.models import PromptDecomposition
+
+# Multi-word terms first so "golden hour" wins over a bare "hour"
+TIME_OF_DAY = [
+    "golden hour", "blue hour", "early morning", "late afternoon", "late night",
+    "sunrise", "sunset", "dawn", "dusk", "twilight", "daybreak", "nightfall",
+    "midnight", "noon", "midday", "morning", "afternoon", "evening", "night", "daytime", "nighttime",
+]
+TIME_WORDS = set(" ".join(TIME_OF_DAY).split())
+
+STYLE_TERMS = {
+    "cinematic", "shot", "angle", "camera", "framing", "composition", "close-up", "closeup", "aerial",
+    "tracking", "dolly", "pan", "zoom", "lens", "bokeh", "depth", "focus", "lighting", "light", "lit",
+    "volumetric", "haze", "atmosphere", "mood", "tone", "aesthetic", "style", "setting", "blend",
+    "scale", "epic", "detail", "detailed", "textures", "realistic", "photorealistic", "hyperrealistic",
+    "motion", "slow-motion", "timelapse", "time-lapse", "film", "grain", "anime", "painterly", "vintage",
+    "noir", "4k", "8k", "hdr", "dramatic", "serene", "moody", "dreamlike", "surreal", "presence",
+    "fantasy", "sci-fi", "immersive", "mysterious", "tranquil", "peaceful", "powerful",
+}
+
+PLACES = {
+    "field", "fields", "forest", "woods", "jungle", "city", "town", "village", "street", "streets",
+    "ocean", "sea", "lake", "river", "beach", "shore", "coast", "island", "desert", "dunes", "dune",
+    "mountain", "mountains", "hill", "hills", "valley", "cliff", "canyon", "cave", "meadow", "garden",
+    "gardens", "park", "sky", "horizon", "ground", "floor", "surface", "space", "planet", "station",
+    "ruins", "room", "kitchen", "studio", "stage", "rooftop", "roof", "bridge", "road", "highway",
+    "alley", "harbor", "port", "reef", "glacier", "tundra", "swamp", "marsh", "plain", "plains",
+    "landscape", "skyline", "courtyard", "hall", "temple", "castle", "palace", "arena", "track",
+    "underwater", "air",
+}
+
+# Nouns that only locate the phrase after "of" ("the center of a vast field")
+RELATIONAL = {"center", "centre", "middle", "edge", "edges", "top", "side", "base", "heart", "foot", "surface"}
+
+PREPOSITIONS = {
+    "in", "on", "at", "above", "over", "across", "through", "under", "beneath", "below", "inside",
+    "along", "near", "overlooking", "orbiting", "into", "toward", "towards", "from", "by", "with",
+    "between", "past", "off", "around", "against", "among", "behind", "onto", "within", "to", "up",
+    "down", "like", "after", "before", "during", "of", "for", "than",
+}
+LOCATION_PREPOSITIONS = PREPOSITIONS - {"with", "by", "like", "of", "for", "than", "after", "before", "during"}
+
+DETERMINERS = {"a", "an", "the", "this", "that", "these", "those", "its", "his", "her", "their", "our", "my", "some"}
+PRONOUNS = {"it", "he", "she", "they", "we", "i", "you", "which", "who", "that", "there"}
+CONJUNCTIONS = {"and", "or", "but", "as", "while", "where", "when", "yet", "then", "before", "after"}
+CLAUSE_MARKERS = re.compile(r"\s+(?:as|while|where|when|and then|whereas)\s+", re.IGNORECASE)
+
+AUXILIARIES = {"is", "are", "was", "were", "be", "being", "been"}
+MOTION_VERBS = {
+    "stretch", "spill", "drift", "glide", "pulse", "move", "pour", "fade", "shift", "emit", "catch",
+    "rotate", "flow", "cast", "shimmer", "swirl", "sway", "rise", "fall", "fly", "run", "walk", "dance",
+    "jump", "spin", "float", "glow", "burn", "break", "crash", "roll", "turn", "look", "stand", "sit",
+    "hold", "reach", "wave", "follow", "chase", "explode", "launch", "emerge", "ripple", "hover",
+    "climb", "dive", "swim", "race", "sparkle", "flicker", "flutter", "collapse", "erupt", "orbit",
+    "circle", "land", "leap", "march", "pass", "sweep", "spread", "crawl", "stride", "soar", "dart",
+}
+# -ing / -ed words that are nouns or plain adjectives, never verbs
+NOT_VERBS = {
+    "building", "ring", "evening", "morning", "lighting", "setting", "framing", "shading", "rendering",
+    "ceiling", "thing", "king", "painting", "clothing",
+    "wing", "string", "spring", "nothing", "something", "everything", "red", "bed", "shed", "sled",
+    "speed", "seed", "weed", "feed", "breed", "hundred", "sacred", "naked", "wicked", "rugged",
+}
+DIRECTIONS = {"forward", "backward", "upward", "downward", "away", "back", "together", "apart", "across",
+              "around", "upwards", "downwards", "outward", "inward", "overhead", "aloft"}
+
+_WORD = re.compile(r"[A-Za-z0-9][A-Za-z0-9'\-]*")
+
+
+def _tokens(text: str) -> List[str]:
+    return _WORD.findall(text.lower().replace("’", "'"))
+
+
+def _verb_form(token: str) -> Optional[str]:
+    """Base form of a lexicon motion verb in third person ("drifts" -> "drift")."""
+    for base in (token, token[:-1], token[:-2]):
+        if base in MOTION_VERBS and (base == token or token in (base + "s", base + "es")):
+            return base
+    return None
+
+
+def _is_participle(token: str) -> bool:
+    return (token.endswith("ing") or token.endswith("ed")) and len(token) > 4 and token not in NOT_VERBS
+
+
+def _is_adverb(token: str) -> bool:
+    return (token.endswith("ly") and len(token) > 3 and token not in {"only", "family", "fly", "holy"}) \
+        or token in DIRECTIONS
+
+
+def _phrase(tokens: List[str]) -> str:
+    while tokens and tokens[0] in DETERMINERS | {"and", "or"}:
+        tokens = tokens[1:]
+    while tokens and tokens[-1] in {"and", "or"}:
+        tokens = tokens[:-1]
+    return " ".join(tokens)
+
+
+def _noun_phrase(tokens: List[str], start: int) -> Tuple[List[str], int]:
+    """Noun phrase beginning at start, and the index just past it.
+
+    -ing/-ed words directly after a determiner or "of" are adjectives
+    ("of blooming lavender"); after a noun they start the verb phrase.
+    """
+    phrase = []
+    i = start
+    while i < len(tokens):
+        token = tokens[i]
+        prev = tokens[i - 1] if i > start else None
+        if token in PREPOSITIONS and token != "of" or token in PRONOUNS or token in AUXILIARIES:
+            break
+        if token in CONJUNCTIONS and token != "and":
+            break
+        if phrase and prev not in DETERMINERS | {"of", "and"} and (
+                _is_participle(token) or _verb_form(token) or _is_adverb(token)):
+            break
+        if token == "and" and i + 1 < len(tokens) and (
+                _is_participle(tokens[i + 1]) or _verb_form(tokens[i + 1]) or _is_adverb(tokens[i + 1])):
+            break
+        if token == "of" and phrase and phrase[-1] in RELATIONAL:
+            phrase = []
+        elif not (token == "of" and not phrase):
+            phrase.append(token)
+        i += 1
+    while phrase and phrase[-1] in {"of", "and"}:
+        phrase.pop()
+    return phrase, i
+
+
+def _head_is_place(phrase: List[str]) -> bool:
+    words = [w for w in phrase if w not in {"and", "of"}]
+    return bool(words) and (words[-1] in PLACES or any(w in PLACES for w in words[-2:]))
+
+
+def _has_verb(tokens: List[str]) -> bool:
+    return any(
+        _verb_form(token) or token in AUXILIARIES
+        or _is_participle(token) and (
+            tokens[i - 1] not in DETERMINERS | CONJUNCTIONS | {"of", "but"} if i
+            else not _adjective_participle(tokens, 0))
+        for i, token in enumerate(tokens)
+    )
+
+
+def _is_style_clause(tokens: List[str]) -> bool:
+    """A comma clause made of style vocabulary with nothing happening in it."""
+    return any(token in STYLE_TERMS for token in tokens) and not _has_verb(tokens)
+
+
+def _adjective_participle(tokens: List[str], i: int) -> bool:
+    """Whether the participle at i modifies a following noun ("towering trees") rather than acting."""
+    phrase, end = _noun_phrase(tokens, i)
+    if len(phrase) < 2:
+        return False
+    return end == len(tokens) or tokens[end] in AUXILIARIES or bool(_verb_form(tokens[end])) \
+        or _is_participle(tokens[end]) or tokens[end] in PREPOSITIONS or tokens[end] in CONJUNCTIONS
+
+
+def _add_subject(subject: List[str], entities, locations, style, add):
+    subject = [w for w in subject if w not in PRONOUNS]
+    if "of" in subject:
+        head = subject[:subject.index("of")]
+        if _is_style_clause(head):
+            add(style, _phrase(head))
+            subject = subject[subject.index("of") + 1:]
+    if subject and not set(subject) <= TIME_WORDS:
+        add(locations if _head_is_place(subject) else entities, _phrase(subject))
+
+
+def _parse_clause(tokens: List[str], entities, actions, locations, style, add):
+    if not tokens:
+        return
+    i = 0
+    while i < len(tokens) and tokens[i] in CONJUNCTIONS | {"with"}:
+        i += 1
+
+    # Subject noun phrase (a clause opening with a verb has none)
+    if i < len(tokens) and tokens[i] not in PREPOSITIONS and not _is_adverb(tokens[i]) and (
+            not _is_participle(tokens[i]) or _adjective_participle(tokens, i)):
+        subject, i = _noun_phrase(tokens, i)
+        _add_subject(subject, entities, locations, style, add)
+
+    while i < len(tokens):
+        token = tokens[i]
+        if token in PREPOSITIONS:
+            phrase, end = _noun_phrase(tokens, i + 1)
+            if token in LOCATION_PREPOSITIONS and phrase and _head_is_place(phrase) \
+                    and not set(phrase) <= TIME_WORDS:
+                add(locations, _phrase(phrase))
+            i = max(end, i + 1)
+            continue
+        if token == "and" and i + 1 < len(tokens) and _is_participle(tokens[i + 1]) \
+                and _adjective_participle(tokens, i + 1):
+            phrase, i = _noun_phrase(tokens, i + 1)
+            _add_subject(phrase, entities, locations, style, add)
+            continue
+        verb_at = i + 1 if _is_adverb(token) and i + 1 < len(tokens) else i
+        verb = tokens[verb_at]
+        if _is_participle(verb) or _verb_form(verb) or (verb in AUXILIARIES and verb_at + 1 < len(tokens)
+                                                        and _is_participle(tokens[verb_at + 1])):
+            action, i = _verb_phrase(tokens, i, verb_at)
+            add(actions, action)
+            continue
+        i += 1
+
+
+def _verb_phrase(tokens: List[str], start: int, verb_at: int) -> Tuple[str, int]:
+    """Action phrase for the verb at verb_at, and the index to resume scanning from."""
+    words = tokens[start:verb_at + 1]
+    if words[-1] in AUXILIARIES and verb_at + 1 < len(tokens):
+        verb_at += 1
+        words = [words[-2]] if len(words) > 1 else []
+        words.append(tokens[verb_at])
+    i = verb_at + 1
+    while i < len(tokens) and _is_adverb(tokens[i]):
+        words.append(tokens[i])
+        i += 1
+    if i < len(tokens) and tokens[i] in PREPOSITIONS - {"of", "like"}:
+        # Keep the preposition and its head noun ("running through forest")
+        phrase, _ = _noun_phrase(tokens, i + 1)
+        if phrase:
+            words += [tokens[i], phrase[-1]]
+        return " ".join(words), i
+    if i < len(tokens) and tokens[i] not in PREPOSITIONS | CONJUNCTIONS | AUXILIARIES | PRONOUNS:
+        phrase, end = _noun_phrase(tokens, i)
+        obj = [w for w in phrase if w not in DETERMINERS][:4]
+        words += obj
+        i = end
+    return " ".join(words), i
+
+
+def heuristic_decomposition(prompt: str) -> PromptDecomposition:
+    """Decompose a prompt with local rules only (see module docstring)."""
+    entities: List[str] = []
+    actions: List[str] = []
+    locations: List[str] = []
+    style: List[str] = []
+
+    def add(items: List[str], phrase: str):
+        if phrase and phrase not in items:
+            items.append(phrase)
+
+    lowered = prompt.lower()
+    found = [(m.start(), term) for term in TIME_OF_DAY
+             for m in [re.search(rf"\b{re.escape(term)}\b", lowered)] if m]
+    time_of_day = min(found)[1] if found else None
+
+    for sentence in re.split(r"(?<=[.!?])\s+", prompt.strip()):
+        sentence = sentence.strip().rstrip(".!?")
+        for part in re.split(r"[,;]", sentence):
+            if _is_style_clause(_tokens(part)):
+                add(style, _phrase(_tokens(part)))
+                continue
+            for clause in CLAUSE_MARKERS.split(part):
+                _parse_clause(_tokens(clause), entities, actions, locations, style, add)
+
+    return PromptDecomposition(entities=entities, actions=actions, locations=locations,
+                               time_of_day=time_of_day, style_attributes=style)
+
+
+class OfflineDecomposer(BaseDecomposer):
+    """Decompose prompts locally with lexicon and phrase heuristics; no API calls.
+
+    Results are less precise than the LLM decomposers but take about a
+    millisecond, so no cache is consulted.
+    """
+    provider = "offline"
+    default_model = "heuristic"
+
+    def decompose(self, user_prompt: str, model: Optional[str] = None) -> PromptDecomposition:
+        return heuristic_decomposition(user_prompt)
+
+    def _call_api(
+        self, user_prompt: str, system_instruction: str, model: str
+    ) -> PromptDecomposition:
+        return heuristic_decomposition(user_prompt)
@@ -1,13 +1,49 @@
-from typing import List, Optional
+import asyncio
+import contextlib
+import functools
+import threading
+from concurrent.futures import Executor, Future
+from typing import Callable, Dict, List, Literal, Optional, Union
 from pathlib import Path
+from urllib.parse import urlparse
 from datetime import datetime
 from video_judge.utils.format import format_prompt
+from video_judge.templates import prompt_templates
 from video_judge.utils.calculate import calculate_overall_score
+from video_judge.config.constants import CRITERION_WEIGHTS
 from video_judge.config.logger import logger
+from video_judge.checkpoint import CheckpointStore
+from video_judge.circuit import CircuitBreakers
+from video_judge.journal import JobJournal, images_digest, judgement_key
 from video_judge.judge import BaseJudge
-from video_judge.models import JudgeEval, Report, VideoInfo, PromptDecomposition
-from video_judge.process import sample_frames
-from video_judge.video_gen import BaseVideoGenerator
+from video_judge.packing import packed_judge_input
+from video_judge.metrics import GATE_FAIL_SCORE, compute_technical_metrics, frames_to_array
+from video_judge.models import (
+    Evidence, FramePacking, FrameSampling, JudgeEval, Report, TechnicalMetrics, TemporalAnalysis, VideoInfo, VideoFrame,
+    PromptDecomposition
+)
+from video_judge.process import Decoder, sample_frame_views, sample_frames
+from video_judge.streaming import stream_frame_views
+from video_judge.temporal import GATE_BROKEN_SCORE, GATE_CLEAN_SCORE, analyze_video, format_temporal_hints
+from video_judge.video_gen import BaseVideoGenerator, GenerationCancelledError
+
+
+def judge_model(judge: BaseJudge) -> str:
+    """Identifier of the judge model, e.g. "openai/gpt-4o"."""
+    provider, model = getattr(judge, "provider", None), getattr(judge, "default_model", None)
+    if isinstance(provider, str) and isinstance(model, str):
+        return f"{provider}/{model}"
+    return type(judge).__name__
+
+
+def provenance(criterion: str, judge: BaseJudge, source: str = "judge") -> dict:
+    """Template hash and judge model behind a criterion result, for Report.details.
+
+    Locally scored ("prescreen") criteria depend on neither.
+    """
+    if source != "judge":
+        return {"template_hash": None, "judge_model": source}
+    return {"template_hash": prompt_templates.get(criterion).hash, "judge_model": judge_model(judge)}
 
 
 class VideoEvaluationOrchestrator:
@@ -15,13 +51,73 @@ class VideoEvaluationOrchestrator:
         self,
         video_gen_prompt: str,
         existing_video_path: Optional[str] = None,
-        prompt_decomposition: Optional[PromptDecomposition] = None,
+        prompt_decomposition: Optional[Union[PromptDecomposition, "Future[PromptDecomposition]"]] = None,
+        journal: Optional[JobJournal] = None,
+        run_id: Optional[str] = None,
+        checkpoints: Optional[CheckpointStore] = None,
+        cancel_event: Optional[threading.Event] = None,
+        progress_callback: Optional[Callable[..., None]] = None,
+        technical_prescreen: Optional[Literal["report", "gate", "replace"]] = None,
+        temporal_analysis: Optional[Literal["report", "hints", "gate"]] = None,
+        frame_sampling: Optional[FrameSampling] = None,
+        criterion_sampling: Optional[Dict[str, FrameSampling]] = None,
+        frame_packing: Optional[FramePacking] = None,
+        frame_decoder: Decoder = "opencv",
+        breakers: Optional[CircuitBreakers] = None,
     ):
+        """
+        Args:
+            video_gen_prompt: Prompt the video was (or will be) generated from
+            existing_video_path: Judge this file instead of generating a new video
+            prompt_decomposition: Optional checklist appended to the judge prompts. May be a
+                Future (e.g. decomposition running alongside generation); it is awaited
+                when the judge input is built, and judging proceeds without it if it failed.
+            journal: Reuse judge results already recorded for the same inputs
+            run_id / checkpoints: Persist and resume per-stage checkpoints
+            cancel_event: Checked before each judge call for cooperative cancellation
+            progress_callback: Called as progress_callback(stage, **fields)
+            technical_prescreen: Local pixel-statistics pass over the sampled frames.
+                "report" attaches the metrics to the Report, "gate" additionally skips
+                the technical_quality judge call for obviously broken videos, and
+                "replace" always scores technical_quality locally.
+            temporal_analysis: Local optical-flow pass over the whole clip. "report"
+                attaches the analysis to the Report, "hints" also passes flagged
+                timestamps to the temporal_consistency judge, and "gate" additionally
+                skips that judge call when the clip is clearly clean or clearly broken.
+            frame_sampling: How frames are sampled for the judges (count, resolution,
+                "uniform" or "adaptive" strategy, image-token cost cap). Defaults to 8
+                uniform frames.
+            criterion_sampling: Per-criterion overrides of frame_sampling, keyed by
+                criterion name (e.g. {"aesthetic_quality": FrameSampling(num_frames=3)}).
+                All specs are served from a single decode pass.
+            frame_packing: Send frames as labelled contact-sheet grids instead of one
+                image per frame; each sheet carries a caption mapping cells to frames
+            frame_decoder: "opencv" or "ffmpeg" (select/scale pipe, multithreaded)
+            breakers: Circuit breakers guarding generation (keyed by provider) and judge
+                calls (keyed by "judge:<judge model>"); calls to an open backend raise
+                CircuitOpenError instead of waiting for it to time out
+        """
         self.video_gen_prompt = video_gen_prompt
         self.input_data = {}
         self.existing_video_path = existing_video_path
         self.prompt_decomposition = prompt_decomposition
+        self.journal = journal
+        self.run_id = run_id
+        # Checkpointing needs both a store and a run id to key stages under
+        self.checkpoints = checkpoints if run_id else None
+        self.cancel_event = cancel_event
+        self.progress_callback = progress_callback
+        self.technical_prescreen = technical_prescreen
+        self.temporal_analysis = temporal_analysis
+        self.frame_sampling = frame_sampling
+        self.criterion_sampling = criterion_sampling or {}
+        self.frame_packing = frame_packing
+        self.frame_decoder = frame_decoder
+        self.breakers = breakers
+        self._views: Dict[str, List[VideoFrame]] = {}
+        self.frames: List[VideoFrame] = []
         self.saved_video_path = None
+        self.video_source: Optional[str] = None
 
     def _format_decomposition(self, decomposition: PromptDecomposition) -> str:
         """Format PromptDecomposition into checklist text."""
@@ -48,16 +144,53 @@ class VideoEvaluationOrchestrator:
 
         return "\n".join(lines)
 
-    def node(self, images: List[bytes], user_prompts: List[str], judge: BaseJudge, prompt_criterion: str):
-        system_prompt = format_prompt(f"./prompts/{prompt_criterion}.txt")
+    def node(self, images: List[bytes], user_prompts: List[str], judge: BaseJudge, prompt_criterion: str,
+             extra_prompts: Optional[List[str]] = None):
+        images, user_prompts = self._criterion_input(prompt_criterion, images, user_prompts)
+        if extra_prompts:
+            user_prompts = user_prompts + extra_prompts
+        result = self._evaluate_criterion(
+            images=images, user_prompts=user_prompts, judge=judge, prompt_criterion=prompt_criterion)
+        if self.progress_callback:
+            self.progress_callback("criterion_judged", criterion=prompt_criterion, score=result.score)
+        return result
+
+    def _evaluate_criterion(self, images: List[bytes], user_prompts: List[str], judge: BaseJudge,
+                            prompt_criterion: str) -> JudgeEval:
+        """Judge one criterion, reusing a checkpointed or journaled result when available."""
+        if self.cancel_event and self.cancel_event.is_set():
+            raise GenerationCancelledError(f"Evaluation cancelled before {prompt_criterion}")
+        if self.checkpoints:
+            checkpointed = self.checkpoints.load_criterion(self.run_id, prompt_criterion)
+            if checkpointed:
+                logger.info(f"Loaded {prompt_criterion} from checkpoint {self.run_id}")
+                return checkpointed
+        system_prompt = format_prompt(prompt_criterion)
+        key = None
+        if self.journal:
+            key = judgement_key(
+                self.saved_video_path or self.existing_video_path or "", prompt_criterion,
+                judge_model(judge), system_prompt, images_digest(images), *user_prompts)
+            cached = self.journal.get_judgement(key)
+            if cached:
+                logger.info(f"Reusing journaled {prompt_criterion} result")
+                return cached
         logger.info(f"Evaluating {prompt_criterion}")
-        return judge.evaluate(images=images, user_prompts=user_prompts, system_prompt=system_prompt)
+        with self._guard(f"judge:{judge_model(judge)}"):
+            result = judge.evaluate(images=images, user_prompts=user_prompts, system_prompt=system_prompt)
+        if key:
+            self.journal.record_judgement(key, result)
+        if self.checkpoints:
+            self.checkpoints.save_criterion(self.run_id, prompt_criterion, result)
+        return result
 
     def alignment_node(self, images: List[bytes], user_prompts: List[str], judge: BaseJudge) -> JudgeEval:
         return self.node(images=images, user_prompts=user_prompts, judge=judge, prompt_criterion="prompt_alignment")
 
-    def temporal_consistency_node(self, images: List[bytes], user_prompts: List[str], judge: BaseJudge):
-        return self.node(images=images, user_prompts=user_prompts, judge=judge, prompt_criterion="temporal_consistency")
+    def temporal_consistency_node(self, images: List[bytes], user_prompts: List[str], judge: BaseJudge,
+                                  extra_prompts: Optional[List[str]] = None):
+        return self.node(images=images, user_prompts=user_prompts, judge=judge, prompt_criterion="temporal_consistency",
+                         extra_prompts=extra_prompts)
 
     def aesthetic_quality_node(self, images: List[bytes], user_prompts: List[str], judge: BaseJudge) -> JudgeEval:
         return self.node(images=images, user_prompts=user_prompts, judge=judge, prompt_criterion="aesthetic_quality")
@@ -65,8 +198,118 @@ class VideoEvaluationOrchestrator:
     def technical_quality_node(self, images: List[bytes], user_prompts: List[str], judge: BaseJudge):
         return self.node(images=images, user_prompts=user_prompts, judge=judge, prompt_criterion="technical_quality")
 
-    def create_judge_input_from_generator(self, video_generator: BaseVideoGenerator) -> tuple:
-        video_info = video_generator.run_video_gen(self.video_gen_prompt)
+    def _guard(self, backend: str, neutral: tuple = ()):
+        """Circuit breaker guard for one backend call; a no-op without breakers."""
+        if not self.breakers:
+            return contextlib.nullcontext()
+        return self.breakers.get(backend).guard(neutral=neutral)
+
+    def _generate_video(self, video_generator: BaseVideoGenerator) -> VideoInfo:
+        if self.checkpoints:
+            video_info = self.checkpoints.load_video(self.run_id)
+            if video_info:
+                logger.info(f"Loaded video from checkpoint {self.run_id}")
+                return video_info
+        with self._guard(video_generator.provider, neutral=(GenerationCancelledError,)):
+            video_info = video_generator.run_video_gen(self.video_gen_prompt)
+        if self.checkpoints:
+            self.checkpoints.save_video(self.run_id, video_info)
+        return video_info
+
+    async def _agenerate_video(self, video_generator: BaseVideoGenerator) -> VideoInfo:
+        """_generate_video awaiting the generator's arun_video_gen."""
+        if self.checkpoints:
+            video_info = self.checkpoints.load_video(self.run_id)
+            if video_info:
+                logger.info(f"Loaded video from checkpoint {self.run_id}")
+                return video_info
+        with self._guard(video_generator.provider, neutral=(GenerationCancelledError,)):
+            video_info = await video_generator.arun_video_gen(self.video_gen_prompt)
+        if self.checkpoints:
+            self.checkpoints.save_video(self.run_id, video_info)
+        return video_info
+
+    def _sample_frames(self, video_path: str, stream_to: Optional[str] = None) -> List[VideoFrame]:
+        """Sample the default frames (and per-criterion views) from video_path.
+
+        With stream_to, video_path is a URL that is downloaded to stream_to while
+        its frames are decoded from the same byte stream.
+        """
+        if self.checkpoints:
+            frames = self.checkpoints.load_frames(self.run_id)
+            if frames:
+                logger.info(f"Loaded {len(frames)} frames from checkpoint {self.run_id}")
+                return frames
+        if stream_to:
+            views = stream_frame_views(
+                video_path, stream_to, {"_default": self.frame_sampling or FrameSampling(), **self.criterion_sampling})
+            frames = views.pop("_default")
+            self._views = views
+        elif self.criterion_sampling:
+            # One decode pass serves the default frames and every per-criterion view
+            views = sample_frame_views(
+                video_path, {"_default": self.frame_sampling or FrameSampling(), **self.criterion_sampling},
+                decoder=self.frame_decoder)
+            frames = views.pop("_default")
+            self._views = views
+        elif self.frame_sampling:
+            frames = sample_frames(video_path, **self.frame_sampling.model_dump(), decoder=self.frame_decoder)
+        else:
+            frames = sample_frames(video_path, decoder=self.frame_decoder)
+        if self.checkpoints:
+            self.checkpoints.save_frames(self.run_id, frames)
+        return frames
+
+    def _judge_input(self, frames: List[VideoFrame]) -> tuple:
+        """Images and prompts for the judges, packed into contact sheets if configured."""
+        if self.frame_packing:
+            images, frame_prompts = packed_judge_input(frames, self.frame_packing)
+        else:
+            images = [f.image for f in frames]
+            frame_prompts = [
+                f"Frame {f.idx} at {f.timestamp_s:.2f}s"
+                for f in frames
+            ]
+        return images, self._build_user_prompts(frame_prompts)
+
+    def _build_user_prompts(self, frame_prompts: List[str]) -> List[str]:
+        user_prompts = list(frame_prompts)
+        # Add generation prompt at end for llm
+        user_prompts.append(f"Original prompt: {self.video_gen_prompt}")
+
+        # Add decomposed criteria if provided
+        decomposition = self._resolve_decomposition()
+        if decomposition:
+            user_prompts.append(self._format_decomposition(decomposition))
+        return user_prompts
+
+    def _resolve_decomposition(self) -> Optional[PromptDecomposition]:
+        if isinstance(self.prompt_decomposition, Future):
+            try:
+                self.prompt_decomposition = self.prompt_decomposition.result()
+            except Exception as e:
+                logger.warning(f"Prompt decomposition failed, judging without it: {type(e).__name__}: {e}")
+                self.prompt_decomposition = None
+        return self.prompt_decomposition
+
+    def _video_source(self) -> Optional[str]:
+        """Local file or URL the decoder should read frames from."""
+        return self.video_source or self.saved_video_path or self.existing_video_path
+
+    def _criterion_input(self, criterion: str, images: List[bytes], user_prompts: List[str]) -> tuple:
+        """Images and prompts for one criterion, using its own view if it has a FrameSampling."""
+        video_path = self._video_source()
+        if criterion not in self.criterion_sampling or not video_path:
+            return images, user_prompts
+        if criterion not in self._views:
+            # Default frames came from a checkpoint (or were passed in directly)
+            self._views = sample_frame_views(video_path, self.criterion_sampling, decoder=self.frame_decoder)
+        return self._judge_input(self._views[criterion])
+
+    def create_judge_input_from_generator(self, video_generator: BaseVideoGenerator,
+                                          video_info: Optional[VideoInfo] = None) -> tuple:
+        """Generate a video (unless video_info was already generated) and sample its frames."""
+        video_info = video_info or self._generate_video(video_generator)
         video_id = Path(video_info.saved_path).stem
         video_prompt = self.video_gen_prompt
         video_path = video_info.saved_path
@@ -75,49 +318,139 @@ class VideoEvaluationOrchestrator:
             "video_id": video_id
             # add duration, num frames, fps etc later
         }
-        frames = sample_frames(video_path)
-        image_bytes_list = [img.image for img in frames]
-        user_prompts = [
-            f"Frame {f.idx} at {f.timestamp_s:.2f}s"
-            for f in frames
-        ]
-        # Add generation prompt at end for llm
-        user_prompts.append(f"Original prompt: {video_prompt}")
-
-        # Add decomposed criteria if provided
-        if self.prompt_decomposition:
-            user_prompts.append(self._format_decomposition(
-                self.prompt_decomposition))
         self.saved_video_path = video_path
+        streaming = (getattr(video_generator, "download", "sync") == "stream"
+                     and video_info.video_url and not Path(video_path).exists())
+        if streaming:
+            # Download and decode overlap; afterwards everything reads the local file
+            frames = self._sample_frames(video_info.video_url, stream_to=video_path)
+            if Path(video_path).exists():
+                video_generator.mark_downloaded(video_info)
+            else:
+                # Frames came from a checkpoint; later views read the URL
+                self.video_source = video_info.video_url
+        else:
+            if video_info.video_url and not Path(video_path).exists():
+                # Not downloaded (yet): decode straight from the URL with range reads
+                self.video_source = video_info.video_url
+            frames = self._sample_frames(self._video_source())
+        self.frames = frames
+        image_bytes_list, user_prompts = self._judge_input(frames)
 
         return (image_bytes_list, user_prompts)
 
     def create_judge_input_from_video(self):
-        video_id = Path(self.existing_video_path).stem
+        # existing_video_path may be an http(s) URL; the decoder then reads it with range requests
+        video_id = Path(urlparse(self.existing_video_path).path).stem
         video_prompt = self.video_gen_prompt
         self.input_data = {
             "prompt": video_prompt,
             "video_id": video_id
             # add duration, num frames, fps etc later
         }
-        frames = sample_frames(self.existing_video_path)
-        image_bytes_list = [img.image for img in frames]
-        user_prompts = [
-            f"Frame {f.idx} at {f.timestamp_s:.2f}s"
-            for f in frames
+        frames = self._sample_frames(self.existing_video_path)
+        self.frames = frames
+        image_bytes_list, user_prompts = self._judge_input(frames)
+        return (image_bytes_list, user_prompts)
+
+    def create_judge_input_from_frames(self, frames: List[VideoFrame],
+                                       views: Optional[Dict[str, List[VideoFrame]]] = None) -> tuple:
+        """Judge input from frames of existing_video_path that were sampled elsewhere.
+
+        Args:
+            frames: Default frames
+            views: Per-criterion frames for every criterion in criterion_sampling
+        """
+        self.input_data = {
+            "prompt": self.video_gen_prompt,
+            "video_id": Path(urlparse(self.existing_video_path).path).stem
+        }
+        self.frames = frames
+        self._views = dict(views or {})
+        return self._judge_input(frames)
+
+    def _frame_indices(self, count: int) -> List[int]:
+        if len(self.frames) == count:
+            return [f.idx for f in self.frames]
+        return list(range(count))
+
+    def _local_technical_eval(self, metrics: TechnicalMetrics, images: List[bytes]) -> JudgeEval:
+        """Express pre-screen metrics as a JudgeEval so they slot into the report unchanged."""
+        timestamps = {f.idx: f.timestamp_s for f in self.frames}
+        evidence = [
+            Evidence(
+                frame=idx,
+                timestamp=timestamps.get(idx, 0.0),
+                finding=(f"sharpness {sharp:.0f}, clipped {clipped:.0%}, "
+                         f"blockiness {blocks:.2f}"))
+            for idx, sharp, clipped, blocks in zip(
+                self._frame_indices(len(metrics.sharpness)), metrics.sharpness, metrics.clipped_fraction, metrics.blockiness)
         ]
-        # Add generation prompt at end for llm
-        user_prompts.append(f"Original prompt: {video_prompt}")
+        reason = "Scored by local pre-screen. " + (
+            "; ".join(metrics.issues) if metrics.issues else "No technical issues detected.")
+        return JudgeEval(score=metrics.score, reason=reason, evidence=evidence)
 
-        # Add decomposed criteria if provided
-        if self.prompt_decomposition:
-            user_prompts.append(self._format_decomposition(
-                self.prompt_decomposition))
-        return (image_bytes_list, user_prompts)
+    def _technical_quality(self, images: List[bytes], user_prompts: List[str], judge: BaseJudge,
+                           metrics: Optional[TechnicalMetrics]) -> tuple:
+        """Judge technical quality, or score it locally when the pre-screen mode allows.
+
+        Returns (JudgeEval, source) where source is "judge" or "prescreen".
+        """
+        local = metrics is not None and (
+            self.technical_prescreen == "replace"
+            or (self.technical_prescreen == "gate" and metrics.score < GATE_FAIL_SCORE))
+        if not local:
+            return self.technical_quality_node(images=images, user_prompts=user_prompts, judge=judge), "judge"
+        logger.info(f"Scoring technical_quality locally ({metrics.score:.2f})")
+        result = self._local_technical_eval(metrics, images)
+        if self.progress_callback:
+            self.progress_callback("criterion_judged", criterion="technical_quality", score=result.score)
+        return result, "prescreen"
+
+    def _local_temporal_eval(self, analysis: TemporalAnalysis) -> JudgeEval:
+        fps = analysis.fps if analysis.fps > 0 else 1.0
+        evidence = [
+            Evidence(frame=round(t * fps), timestamp=t,
+                     finding="scene cut" if t in analysis.scene_cuts else "unexplained discontinuity")
+            for t in analysis.suspicious_timestamps
+        ]
+        reason = (f"Scored by local motion analysis of {analysis.analyzed_frames} frames: "
+                  f"{len(analysis.scene_cuts)} scene cuts, "
+                  f"{len(analysis.discontinuities)} discontinuities.")
+        return JudgeEval(score=analysis.score, reason=reason, evidence=evidence)
+
+    def _temporal_consistency(self, images: List[bytes], user_prompts: List[str], judge: BaseJudge,
+                              analysis: Optional[TemporalAnalysis]) -> tuple:
+        """Judge temporal consistency, hinting or skipping the judge per the analysis mode.
+
+        Returns (JudgeEval, source) where source is "judge" or "prescreen".
+        """
+        if analysis is not None and self.temporal_analysis == "gate" and (
+                analysis.score >= GATE_CLEAN_SCORE or analysis.score <= GATE_BROKEN_SCORE):
+            logger.info(f"Scoring temporal_consistency locally ({analysis.score:.2f})")
+            result = self._local_temporal_eval(analysis)
+            if self.progress_callback:
+                self.progress_callback("criterion_judged", criterion="temporal_consistency", score=result.score)
+            return result, "prescreen"
+        hints = None
+        if analysis is not None and self.temporal_analysis in ("hints", "gate"):
+            hints = [format_temporal_hints(analysis)]
+        return self.temporal_consistency_node(
+            images=images, user_prompts=user_prompts, judge=judge, extra_prompts=hints), "judge"
 
     def run_nodes(self, images: List[bytes], user_prompts: List[str], judge: BaseJudge) -> Report:
         details = []
         scores = {}
+        technical_metrics = None
+        if self.technical_prescreen:
+            # Measure the raw frames, not contact sheets with burned-in labels
+            frame_images = [f.image for f in self.frames] or images
+            technical_metrics = compute_technical_metrics(
+                frames_to_array(frame_images), self._frame_indices(len(frame_images)))
+        temporal_analysis = None
+        video_path = self._video_source()
+        if self.temporal_analysis and video_path:
+            temporal_analysis = analyze_video(video_path)
         alignment_response = self.alignment_node(
             images=images, user_prompts=user_prompts, judge=judge)
         details.append(
@@ -131,14 +464,15 @@ class VideoEvaluationOrchestrator:
             }
         )
         scores["prompt_alignment"] = alignment_response.score
-        temporal_response = self.temporal_consistency_node(
-            images=images, user_prompts=user_prompts, judge=judge)
+        temporal_response, temporal_source = self._temporal_consistency(
+            images=images, user_prompts=user_prompts, judge=judge, analysis=temporal_analysis)
         scores["temporal_consistency"] = temporal_response.score
         details.append(
             {
                 "criteria": "temporal_consistency",
                 "score": temporal_response.score,
-                "reasoning": temporal_response.reason
+                "reasoning": temporal_response.reason,
+                "source": temporal_source
             }
         )
         aesthetic_quality_response = self.aesthetic_quality_node(
@@ -156,8 +490,8 @@ class VideoEvaluationOrchestrator:
 
         )
         scores["aesthetic_quality"] = aesthetic_quality_response.score
-        technical_quality_response = self.technical_quality_node(
-            images=images, user_prompts=user_prompts, judge=judge)
+        technical_quality_response, technical_source = self._technical_quality(
+            images=images, user_prompts=user_prompts, judge=judge, metrics=technical_metrics)
         scores["technical_quality"] = technical_quality_response.score
         details.append(
             {
@@ -166,16 +500,19 @@ class VideoEvaluationOrchestrator:
                 "reasoning": technical_quality_response.reason,
                 "evidence": [
                     e.model_dump() for e in technical_quality_response.evidence
-                ]
+                ],
+                "source": technical_source
             }
         )
+        for detail in details:
+            detail.update(provenance(detail["criteria"], judge, detail.get("source", "judge")))
         overall = calculate_overall_score(
-            scores=[scores["prompt_alignment"], scores["temporal_consistency"], scores["aesthetic_quality"], scores["technical_quality"]
-                    ], weights=[0.5, 0.3, 0.1, 0.1])
+            scores=[scores[criterion] for criterion in CRITERION_WEIGHTS], weights=list(CRITERION_WEIGHTS.values()))
         scores["overall"] = overall
         return Report(input=self.input_data, scores=scores,
                       # create_judge_input_from_video doesnt generate new video so use existing bc saved_video path will be None
-                      details=details, video_path=self.saved_video_path or self.existing_video_path)
+                      details=details, video_path=self.saved_video_path or self.existing_video_path,
+                      technical_metrics=technical_metrics, temporal_analysis=temporal_analysis)
 
     def run(self, judge: BaseJudge, video_generator: BaseVideoGenerator) -> Report:
         if self.existing_video_path:
@@ -188,3 +525,20 @@ class VideoEvaluationOrchestrator:
         report = self.run_nodes(
             images=images, user_prompts=user_prompts, judge=judge)
         return report
+
+    async def arun(self, judge: BaseJudge, video_generator: BaseVideoGenerator,
+                   executor: Optional[Executor] = None) -> Report:
+        """Coroutine version of run().
+
+        Generation awaits the generator's arun_video_gen, so no thread is held
+        while the provider works. Frame sampling and judging still block and run
+        on executor (the loop's default executor when None).
+        """
+        loop = asyncio.get_running_loop()
+        if self.existing_video_path:
+            return await loop.run_in_executor(executor, self.run, judge, video_generator)
+        video_info = await self._agenerate_video(video_generator)
+        images, user_prompts = await loop.run_in_executor(
+            executor, self.create_judge_input_from_generator, video_generator, video_info)
+        return await loop.run_in_executor(
+            executor, functools.partial(self.run_nodes, images=images, user_prompts=user_prompts, judge=judge))
@@ -0,0 +1,79 @@
+"""Contact-sheet packing of sampled frames for judge inputs.
+
+Providers bill per image and add fixed per-image overhead, so a few labelled
+grids are often cheaper than one image per frame at a similar total
+resolution. Each tile has its frame index and timestamp burned in, and each
+sheet is paired with a caption mapping grid cells back to frame indices so
+judges can keep citing individual frames in Evidence.
+"""
+
+import math
+from typing import List, Tuple
+
+import cv2
+import numpy as np
+
+from video_judge.models import ContactSheet, FramePacking, VideoFrame
+
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+
+def _burn_label(tile: np.ndarray, text: str):
+    """Draw text on a dark box in the tile's top-left corner (in place)."""
+    scale = max(0.4, tile.shape[1] / 640)
+    thickness = max(1, round(scale * 2))
+    (w, h), baseline = cv2.getTextSize(text, _FONT, scale, thickness)
+    pad = max(2, h // 3)
+    cv2.rectangle(tile, (0, 0), (w + 2 * pad, h + baseline + 2 * pad), (0, 0, 0), -1)
+    cv2.putText(tile, text, (pad, h + pad), _FONT, scale, (255, 255, 255), thickness, cv2.LINE_AA)
+
+
+def pack_contact_sheets(frames: List[VideoFrame], packing: FramePacking) -> List[ContactSheet]:
+    """Compose frames into labelled row-major grids of packing.columns x packing.rows tiles."""
+    if not frames:
+        return []
+    decoded = [cv2.imdecode(np.frombuffer(f.image, dtype=np.uint8), cv2.IMREAD_COLOR) for f in frames]
+    src_h, src_w = decoded[0].shape[:2]
+    tile_w = packing.tile_width
+    tile_h = max(1, round(src_h * tile_w / src_w))
+    per_sheet = packing.columns * packing.rows
+
+    sheets = []
+    for start in range(0, len(frames), per_sheet):
+        chunk = frames[start:start + per_sheet]
+        rows = math.ceil(len(chunk) / packing.columns)
+        columns = min(len(chunk), packing.columns)
+        canvas = np.zeros((rows * tile_h, columns * tile_w, 3), dtype=np.uint8)
+        for cell, (frame, image) in enumerate(zip(chunk, decoded[start:start + per_sheet])):
+            tile = cv2.resize(image, (tile_w, tile_h), interpolation=cv2.INTER_AREA)
+            _burn_label(tile, f"#{frame.idx} {frame.timestamp_s:.2f}s")
+            r, c = divmod(cell, packing.columns)
+            canvas[r * tile_h:(r + 1) * tile_h, c * tile_w:(c + 1) * tile_w] = tile
+        success, buffer = cv2.imencode(".jpg", canvas, [cv2.IMWRITE_JPEG_QUALITY, packing.jpeg_quality])
+        if not success:
+            raise ValueError("Failed to encode contact sheet")
+        sheets.append(ContactSheet(
+            image=buffer.tobytes(),
+            columns=columns,
+            rows=rows,
+            frame_indices=[f.idx for f in chunk],
+            timestamps=[f.timestamp_s for f in chunk],
+        ))
+    return sheets
+
+
+def sheet_caption(sheet: ContactSheet, number: int, total: int) -> str:
+    """Text sent alongside a sheet that maps each grid cell to its source frame."""
+    cells = "; ".join(
+        f"cell {i + 1} = Frame {idx} at {ts:.2f}s"
+        for i, (idx, ts) in enumerate(zip(sheet.frame_indices, sheet.timestamps)))
+    return (f"Contact sheet {number} of {total} ({sheet.columns}x{sheet.rows} grid, read left to right, "
+            f"top to bottom; each tile is labelled with its frame number and timestamp): {cells}. "
+            "Cite evidence by frame number, not cell.")
+
+
+def packed_judge_input(frames: List[VideoFrame], packing: FramePacking) -> Tuple[List[bytes], List[str]]:
+    """Images and paired caption prompts for a packed judge call."""
+    sheets = pack_contact_sheets(frames, packing)
+    return ([s.image for s in sheets],
+            [sheet_caption(s, i + 1, len(sheets)) for i, s in enumerate(sheets)])
@@ -1,44 +1,325 @@
+import shutil
+import subprocess
 import cv2
-from typing import List, Dict
+from typing import List, Dict, Literal, Optional, Tuple
 import numpy as np
-from video_judge.models import VideoFrame
+from video_judge.config.logger import logger
+from video_judge.cost import image_tokens
+from video_judge.models import FrameSampling, VideoFrame
+from video_judge.temporal import decode_low_res, histogram_deltas
+
+# Gaps up to this many frames are decoded through rather than seeked over
+SEEK_GAP_FRAMES = 30
+
+Decoder = Literal["opencv", "ffmpeg"]
 
 
 def get_video_metadata(video_path: str) -> dict:
-    """Get fps, duration, total_frames"""
+    """Get fps, duration, total_frames, width, height"""
     cap = cv2.VideoCapture(video_path)
     fps = cap.get(cv2.CAP_PROP_FPS)
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
     duration_s = total_frames / fps if fps > 0 else 0
     cap.release()
-    return {"fps": fps, "total_frames": total_frames, "duration_s": duration_s}
+    return {"fps": fps, "total_frames": total_frames, "duration_s": duration_s,
+            "width": width, "height": height}
 
 
-def sample_frames(video_path: str, num_frames: int = 8) -> List[VideoFrame]:
-    """Sample exactly num_frames uniformly, including first/last"""
-    meta = get_video_metadata(video_path)
-    fps, total = meta["fps"], meta["total_frames"]
+def uniform_indices(total: int, num_frames: int) -> List[int]:
+    """num_frames indices spread evenly, including first/last"""
     if num_frames >= 2:
         middle = np.linspace(1, total - 2, num_frames - 2, dtype=int).tolist()
-        indices = [0] + middle + [total - 1]
-    else:
-        indices = [0]
+        return [0] + middle + [total - 1]
+    return [0]
 
-    cap = cv2.VideoCapture(video_path)
-    frames = []
 
-    for idx in indices:
-        cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+def frame_informativeness(gray: np.ndarray) -> np.ndarray:
+    """Per-frame novelty vs the previous frame: histogram delta plus mean pixel change.
+
+    Both terms are normalized to their clip maximum; frame 0 scores 0.
+    """
+    scores = np.zeros(len(gray))
+    if len(gray) < 2:
+        return scores
+    hist = histogram_deltas(gray)
+    diff = np.abs(np.diff(gray.astype(np.float32), axis=0)).mean(axis=(1, 2))
+    scores[1:] = hist / max(hist.max(), 1e-6) + diff / max(diff.max(), 1e-6)
+    return scores
+
+
+def select_keyframes(scores: np.ndarray, num_frames: int) -> List[int]:
+    """Pick num_frames positions: first, last, then the highest-scoring frames.
+
+    Peaks are taken greedily with a minimum spacing so one burst of motion
+    can't absorb every slot; leftover slots fall back to uniform positions.
+    """
+    n = len(scores)
+    if num_frames >= n:
+        return list(range(n))
+    if num_frames < 2:
+        return [0]
+    chosen = {0, n - 1}
+    min_gap = max(1, n // (num_frames * 2))
+    for pos in np.argsort(-scores, kind="stable"):
+        if len(chosen) == num_frames:
+            break
+        if scores[pos] <= 0:
+            break
+        if all(abs(int(pos) - c) >= min_gap for c in chosen):
+            chosen.add(int(pos))
+    for pos in uniform_indices(n, num_frames):
+        if len(chosen) == num_frames:
+            break
+        chosen.add(pos)
+    # Uniform fill can collide with peaks; top up with any unused position
+    for pos in range(n):
+        if len(chosen) == num_frames:
+            break
+        chosen.add(pos)
+    return sorted(chosen)
+
+
+def adaptive_indices(video_path: str, total: int, num_frames: int,
+                     low_res: Optional[Tuple[np.ndarray, List[int]]] = None) -> List[int]:
+    """Content-adaptive indices from one low-resolution pass (scene cuts, motion peaks).
+
+    ``low_res`` is a precomputed (informativeness scores, frame indices) pair,
+    so several specs can share the same pass.
+    """
+    scores, low_res_indices = low_res if low_res is not None else low_res_informativeness(video_path)
+    if len(scores) <= num_frames:
+        return uniform_indices(total, num_frames)
+    picks = select_keyframes(scores, num_frames)
+    indices = [low_res_indices[p] for p in picks]
+    # The strided pass may stop short of the final frame; always keep the true last one
+    indices[-1] = total - 1
+    return indices
+
+
+def low_res_informativeness(video_path: str) -> Tuple[np.ndarray, List[int]]:
+    """Per-frame informativeness scores and their frame indices from a low-resolution pass."""
+    gray, _, low_res_indices = decode_low_res(video_path)
+    return frame_informativeness(gray), low_res_indices
+
+
+def dhash(gray: np.ndarray) -> np.ndarray:
+    """64-bit difference hashes for a stack of (N, 8, 9) luminance thumbnails, shape (N, 64) bool."""
+    return (gray[:, :, 1:] > gray[:, :, :-1]).reshape(len(gray), -1)
+
+
+def perceptual_hashes(images: List[bytes]) -> np.ndarray:
+    """dHash of each encoded frame: decode, shrink to 9x8 luminance, compare neighbours."""
+    thumbs = [cv2.resize(cv2.imdecode(np.frombuffer(img, dtype=np.uint8), cv2.IMREAD_GRAYSCALE),
+                         (9, 8), interpolation=cv2.INTER_AREA)
+              for img in images]
+    return dhash(np.stack(thumbs).astype(np.int16))
+
+
+def dedup_frames(frames: List[VideoFrame], similarity: float = 0.95) -> List[VideoFrame]:
+    """Drop frames that look almost identical to the previously kept frame.
+
+    Similarity is 1 - (hamming distance / 64) between dHashes. The first and
+    last frames are always kept; kept frames retain their original idx and
+    timestamp_s so judge evidence still points at the right frame.
+    """
+    if len(frames) < 3:
+        return frames
+    hashes = perceptual_hashes([f.image for f in frames])
+    max_distance = (1 - similarity) * hashes.shape[1]
+    kept = [0]
+    for i in range(1, len(frames)):
+        if np.count_nonzero(hashes[i] != hashes[kept[-1]]) > max_distance:
+            kept.append(i)
+        elif i == len(frames) - 1:
+            # Keep the true last frame in place of the near-identical one before it
+            if kept[-1] != 0:
+                kept.pop()
+            kept.append(i)
+    return [frames[i] for i in kept]
+
+
+def spec_frame_count(spec: FrameSampling, meta: dict) -> int:
+    """Frames a spec may use once its image-token cost cap is applied."""
+    width, height = meta["width"], meta["height"]
+    if spec.max_image_tokens is None or not (width and height):
+        return spec.num_frames
+    if spec.max_width and width > spec.max_width:
+        width, height = spec.max_width, round(height * spec.max_width / width)
+    per_frame = image_tokens(spec.token_provider, width, height)
+    return max(1, min(spec.num_frames, spec.max_image_tokens // per_frame))
+
+
+def _read_frames(video_path: str, indices: List[int]) -> Dict[int, np.ndarray]:
+    """Decode the given frames in one forward pass over the file.
+
+    Short gaps are skipped with grab() instead of a seek, since a seek
+    re-decodes from the previous keyframe anyway.
+    """
+    cap = cv2.VideoCapture(video_path)
+    frames = {}
+    pos = 0
+    for idx in sorted(set(indices)):
+        if idx < pos or idx - pos > SEEK_GAP_FRAMES:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+        else:
+            for _ in range(idx - pos):
+                cap.grab()
         ret, frame = cap.read()
+        pos = idx + 1
         if ret:
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            success, buffer = cv2.imencode('.png', frame_rgb)
-            if success:
-                frames.append(VideoFrame(
-                    idx=idx,
-                    timestamp_s=idx / fps,
-                    image=buffer.tobytes()
-                ))
-
+            frames[idx] = frame
     cap.release()
     return frames
+
+
+def _decode_size(meta: dict, specs: Dict[str, FrameSampling]) -> Tuple[int, int]:
+    """Largest output size any spec needs, so the decoder can scale once for all of them."""
+    width, height = meta["width"], meta["height"]
+    if all(spec.max_width for spec in specs.values()):
+        target = max(spec.max_width for spec in specs.values())
+        if target < width:
+            return target, max(1, round(height * target / width))
+    return width, height
+
+
+def _read_frames_ffmpeg(video_path: str, indices: List[int], size: Tuple[int, int],
+                        threads: int = 0) -> Dict[int, np.ndarray]:
+    """Decode the given frames with an ffmpeg select+scale pipeline.
+
+    ffmpeg (multithreaded, ``threads=0`` lets it pick) emits only the selected
+    frames, already scaled to ``size``, as BGR rawvideo. They are read straight
+    into one preallocated buffer and returned as views into it.
+    """
+    wanted = sorted(set(indices))
+    width, height = size
+    frame_bytes = width * height * 3
+    select = "+".join(f"eq(n\\,{idx})" for idx in wanted)
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-threads", str(threads), "-i", video_path,
+           "-map", "0:v:0", "-vf", f"select={select},scale={width}:{height}:flags=area",
+           "-fps_mode", "passthrough", "-f", "rawvideo", "-pix_fmt", "bgr24", "pipe:1"]
+    buffer = bytearray(frame_bytes * len(wanted))
+    view = memoryview(buffer)
+    filled = 0
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+        while filled < len(buffer):
+            n = proc.stdout.readinto(view[filled:])
+            if not n:
+                break
+            filled += n
+        proc.stdout.close()
+        stderr = proc.stderr.read()
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed decoding {video_path}: {stderr.decode(errors='replace').strip()}")
+    frames = np.frombuffer(buffer, dtype=np.uint8).reshape(len(wanted), height, width, 3)
+    # Frames the container over-reported (e.g. a short last GOP) are simply missing
+    return {idx: frames[i] for i, idx in enumerate(wanted[:filled // frame_bytes])}
+
+
+def _encode_view(decoded: Dict[int, np.ndarray], indices: List[int], fps: float,
+                 max_width: Optional[int]) -> List[VideoFrame]:
+    frames = []
+    for idx in indices:
+        if idx not in decoded:
+            continue
+        frame = decoded[idx]
+        if max_width and frame.shape[1] > max_width:
+            height = max(1, round(frame.shape[0] * max_width / frame.shape[1]))
+            frame = cv2.resize(frame, (max_width, height), interpolation=cv2.INTER_AREA)
+        # imencode expects BGR, which is what both decoders produce
+        success, buffer = cv2.imencode('.png', frame)
+        if success:
+            frames.append(VideoFrame(
+                idx=idx,
+                timestamp_s=idx / fps,
+                image=buffer.tobytes()
+            ))
+    return frames
+
+
+def sample_frame_views(video_path: str, specs: Dict[str, FrameSampling],
+                       decoder: Decoder = "opencv") -> Dict[str, List[VideoFrame]]:
+    """Sample several frame specs from a single decode pass.
+
+    ``video_path`` may also be an http(s) URL: OpenCV's FFmpeg backend then
+    fetches the moov atom and the GOPs around the target frames with range
+    requests instead of downloading the whole file. (Adaptive specs decode
+    every frame in their low-resolution pass, so they read the full file.)
+
+    Index sets are planned per spec (sharing one low-resolution pass if any
+    spec is adaptive), their union is decoded once, and each spec's view is
+    derived from it at the spec's resolution.
+
+    ``decoder="ffmpeg"`` decodes through an ffmpeg select/scale pipe instead
+    of cv2.VideoCapture, scaling in the decoder when every spec has a
+    max_width. It falls back to OpenCV when ffmpeg is not on PATH.
+
+    Returns:
+        Frames per spec name, in the same order as ``specs``
+    """
+    meta = get_video_metadata(video_path)
+    fps, total = meta["fps"], meta["total_frames"]
+    if total <= 0:
+        raise ValueError(f"Could not read any frames from {video_path}")
+    low_res = None
+    if any(spec.strategy == "adaptive" for spec in specs.values()):
+        low_res = low_res_informativeness(video_path)
+
+    plans = {}
+    for name, spec in specs.items():
+        num_frames = spec_frame_count(spec, meta)
+        if spec.strategy == "adaptive":
+            plans[name] = adaptive_indices(video_path, total, num_frames, low_res)
+        else:
+            plans[name] = uniform_indices(total, num_frames)
+
+    wanted = [idx for plan in plans.values() for idx in plan]
+    if decoder == "ffmpeg" and shutil.which("ffmpeg") is None:
+        logger.warning("ffmpeg not on PATH; decoding frames with OpenCV")
+        decoder = "opencv"
+    if decoder == "ffmpeg":
+        decoded = _read_frames_ffmpeg(video_path, wanted, _decode_size(meta, specs))
+    else:
+        decoded = _read_frames(video_path, wanted)
+    return derive_views(decoded, plans, specs, fps)
+
+
+def derive_views(decoded: Dict[int, np.ndarray], plans: Dict[str, List[int]],
+                 specs: Dict[str, FrameSampling], fps: float) -> Dict[str, List[VideoFrame]]:
+    """Encode each spec's planned frames from a shared pool of decoded BGR frames."""
+    views = {}
+    for name, spec in specs.items():
+        frames = _encode_view(decoded, plans[name], fps, spec.max_width)
+        if spec.dedup_similarity is not None:
+            deduped = dedup_frames(frames, spec.dedup_similarity)
+            if len(deduped) < len(frames):
+                logger.info(f"Dropped {len(frames) - len(deduped)} near-duplicate frames for {name}")
+            frames = deduped
+        views[name] = frames
+    return views
+
+
+def sample_frames(video_path: str, num_frames: int = 8,
+                  strategy: Literal["uniform", "adaptive"] = "uniform",
+                  max_image_tokens: Optional[int] = None,
+                  dedup_similarity: Optional[float] = None,
+                  max_width: Optional[int] = None,
+                  decoder: Decoder = "opencv") -> List[VideoFrame]:
+    """Sample num_frames frames, including first/last
+
+    Args:
+        video_path: Video to sample
+        num_frames: Frames to return
+        strategy: "uniform" spaces frames evenly; "adaptive" spends them on
+            scene cuts and motion peaks found in a low-resolution pass
+        max_image_tokens: Cost cap; num_frames is reduced until the estimated
+            image tokens for all frames fit
+        dedup_similarity: When set, drop frames whose perceptual hash is at
+            least this similar (0-1) to the previously kept frame
+        max_width: Downscale frames wider than this
+        decoder: "opencv" (cv2.VideoCapture) or "ffmpeg" (select/scale pipe)
+    """
+    spec = FrameSampling(num_frames=num_frames, strategy=strategy, max_image_tokens=max_image_tokens,
+                         dedup_similarity=dedup_similarity, max_width=max_width)
+    return sample_frame_views(video_path, {"frames": spec}, decoder=decoder)["frames"]
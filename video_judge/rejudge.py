@@ -0,0 +1,123 @@
+"""Incremental re-judging of stored reports.
+
+Each Report.details entry records the hash of the prompt template and the
+judge model that produced it. After a rubric edit or a judge switch, only
+the (video, criterion) pairs whose recorded provenance no longer matches are
+judged again; their results are merged back into the reports, and arena
+rankings are recomputed from the merged scores.
+
+Frames are sampled once per stale video, and that video's stale criteria
+are then judged in parallel on a shared judge pool.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from video_judge.config.constants import CRITERION_WEIGHTS
+from video_judge.config.logger import logger
+from video_judge.judge import BaseJudge
+from video_judge.models import ArenaReport, JudgeEval, Report
+from video_judge.orchestrator import VideoEvaluationOrchestrator, judge_model, provenance
+from video_judge.rescoring import RescoringEngine
+from video_judge.templates import prompt_templates
+from video_judge.utils.calculate import calculate_overall_score
+
+
+def stale_criteria(report: Report, judge: BaseJudge) -> List[str]:
+    """Judged criteria whose template or judge model differs from the current ones.
+
+    Entries without provenance (older reports) count as stale; locally scored
+    ("prescreen") entries never do.
+    """
+    current_model = judge_model(judge)
+    stale = []
+    for detail in report.details:
+        if detail.get("source", "judge") != "judge":
+            continue
+        criterion = detail["criteria"]
+        if (detail.get("template_hash") != prompt_templates.get(criterion).hash
+                or detail.get("judge_model") != current_model):
+            stale.append(criterion)
+    return stale
+
+
+def merge_results(report: Report, results: Dict[str, JudgeEval], judge: BaseJudge) -> Report:
+    """Copy of a report with the given criteria replaced and the overall score recomputed."""
+    details = []
+    for detail in report.details:
+        criterion = detail["criteria"]
+        if criterion in results:
+            result = results[criterion]
+            detail = {
+                **detail,
+                "score": result.score,
+                "reasoning": result.reason,
+                "evidence": [e.model_dump() for e in result.evidence],
+                "source": "judge",
+                **provenance(criterion, judge),
+            }
+        details.append(detail)
+    scores = {**report.scores, **{c: r.score for c, r in results.items()}}
+    scores["overall"] = calculate_overall_score(
+        scores=[scores[criterion] for criterion in CRITERION_WEIGHTS], weights=list(CRITERION_WEIGHTS.values()))
+    return report.model_copy(update={"details": details, "scores": scores})
+
+
+class Rejudger:
+    """Re-judges only the stale criteria of stored reports.
+
+    Args:
+        judge: Judge whose model and current templates define what is stale
+        max_workers: Videos prepared at once, and judge calls in flight
+        orchestrator_options: Extra keyword arguments for each VideoEvaluationOrchestrator
+            (frame_sampling, criterion_sampling, ...); use the ones the reports were made with
+    """
+
+    def __init__(self, judge: BaseJudge, max_workers: int = 8,
+                 orchestrator_options: Optional[Dict[str, Any]] = None):
+        self.judge = judge
+        self.max_workers = max_workers
+        self.orchestrator_options = orchestrator_options or {}
+
+    def _rejudge_one(self, report: Report, criteria: List[str], judge_pool: ThreadPoolExecutor) -> Report:
+        orchestrator = VideoEvaluationOrchestrator(
+            video_gen_prompt=report.input.get("prompt", ""), existing_video_path=report.video_path,
+            **self.orchestrator_options)
+        images, user_prompts = orchestrator.create_judge_input_from_video()
+        futures = {
+            criterion: judge_pool.submit(orchestrator.node, images=images, user_prompts=user_prompts,
+                                         judge=self.judge, prompt_criterion=criterion)
+            for criterion in criteria
+        }
+        return merge_results(report, {c: f.result() for c, f in futures.items()}, self.judge)
+
+    def rejudge_reports(self, reports: List[Report]) -> List[Report]:
+        """Reports with their stale criteria re-judged; a video that fails keeps its old report."""
+        stale = [stale_criteria(report, self.judge) for report in reports]
+        pairs = sum(len(criteria) for criteria in stale)
+        logger.info(f"Re-judging {pairs} stale criteria across "
+                    f"{sum(1 for criteria in stale if criteria)} of {len(reports)} videos")
+        updated = list(reports)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as video_pool, \
+                ThreadPoolExecutor(max_workers=self.max_workers) as judge_pool:
+            futures = {
+                i: video_pool.submit(self._rejudge_one, report, criteria, judge_pool)
+                for i, (report, criteria) in enumerate(zip(reports, stale)) if criteria
+            }
+            for i, future in futures.items():
+                try:
+                    updated[i] = future.result()
+                except Exception as e:
+                    logger.error(f"Re-judging {reports[i].video_path} failed: {type(e).__name__}: {e}")
+        return updated
+
+    def rejudge_arena_reports(self, arena_reports: List[ArenaReport]) -> List[ArenaReport]:
+        """Arena reports with stale criteria re-judged and every fight re-ranked."""
+        runs = [run for arena_report in arena_reports for run in arena_report.results]
+        updated = iter(self.rejudge_reports([run.report for run in runs]))
+        merged = [
+            arena_report.model_copy(update={"results": [
+                run.model_copy(update={"report": next(updated)}) for run in arena_report.results]})
+            for arena_report in arena_reports
+        ]
+        return RescoringEngine(merged).rescore() if merged else merged
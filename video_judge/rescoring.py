@@ -0,0 +1,158 @@
+"""Re-score stored arena reports under new criterion weights.
+
+Every fight's per-criterion scores are loaded once into a padded
+(fights, models, criteria) NumPy array, so re-weighting is a single matrix
+product and ranking is one argsort, with no judge calls. Sweeping many
+weight vectors evaluates them all at once and reports how stable each
+fight's winner and pairwise order are.
+"""
+
+import glob
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from video_judge.config.constants import CRITERION_WEIGHTS
+from video_judge.models import ArenaReport, RankingStability
+
+CRITERIA = tuple(CRITERION_WEIGHTS)
+
+Weights = Union[Dict[str, float], Sequence[float]]
+
+
+def load_arena_reports(paths: Union[str, Sequence[str]]) -> List[ArenaReport]:
+    """Read ArenaReport JSON files, given as a list of paths or a glob pattern."""
+    if isinstance(paths, str):
+        paths = sorted(glob.glob(paths))
+    reports = []
+    for path in paths:
+        with open(path) as f:
+            reports.append(ArenaReport.model_validate_json(f.read()))
+    return reports
+
+
+def weight_matrix(weights: Sequence[Weights]) -> np.ndarray:
+    """(configs, criteria) array from weight dicts or vectors in CRITERIA order.
+
+    Raises:
+        ValueError: If a vector has the wrong length or does not sum to 1
+    """
+    rows = []
+    for w in weights:
+        row = [w.get(c, 0.0) for c in CRITERIA] if isinstance(w, dict) else list(w)
+        if len(row) != len(CRITERIA):
+            raise ValueError(f"Weights ({len(row)}) must match criteria ({len(CRITERIA)})")
+        rows.append(row)
+    matrix = np.asarray(rows, dtype=float).reshape(-1, len(CRITERIA))
+    sums = matrix.sum(axis=1)
+    if not np.allclose(sums, 1.0, atol=1e-6):
+        raise ValueError(f"Weights must sum to 1.0, got {sums[~np.isclose(sums, 1.0, atol=1e-6)][0]}")
+    return matrix
+
+
+def dirichlet_weights(n: int, around: Optional[Weights] = None, concentration: float = 50.0,
+                      seed: Optional[int] = None) -> np.ndarray:
+    """n random weight vectors centred on ``around`` (default CRITERION_WEIGHTS).
+
+    Higher concentration keeps the samples closer to the centre.
+    """
+    centre = weight_matrix([around if around is not None else CRITERION_WEIGHTS])[0]
+    # Dirichlet needs positive parameters; a zero weight stays near zero
+    return np.random.default_rng(seed).dirichlet(np.maximum(centre, 1e-3) * concentration, size=n)
+
+
+class RescoringEngine:
+    """Criterion scores of many ArenaReports, re-rankable under arbitrary weights.
+
+    Args:
+        reports: Stored fights; every run must have a score for each criterion
+
+    Raises:
+        ValueError: If there are no reports or a run is missing a criterion score
+    """
+
+    def __init__(self, reports: List[ArenaReport]):
+        if not reports:
+            raise ValueError("No arena reports to rescore")
+        self.reports = reports
+        max_models = max(len(r.results) for r in reports)
+        self.models = np.full((len(reports), max_models), "", dtype=object)
+        self.scores = np.zeros((len(reports), max_models, len(CRITERIA)))
+        self.mask = np.zeros((len(reports), max_models), dtype=bool)
+        for f, report in enumerate(reports):
+            for m, run in enumerate(report.results):
+                missing = [c for c in CRITERIA if c not in run.report.scores]
+                if missing:
+                    raise ValueError(f"Run {run.model} in fight {f} has no score for {missing}")
+                self.models[f, m] = run.model
+                self.scores[f, m] = [run.report.scores[c] for c in CRITERIA]
+                self.mask[f, m] = True
+
+    def overall(self, weights: Weights = CRITERION_WEIGHTS) -> np.ndarray:
+        """(fights, models) overall scores; padding slots are -inf."""
+        return self._overall(weight_matrix([weights]))[0]
+
+    def _overall(self, matrix: np.ndarray) -> np.ndarray:
+        overall = np.einsum("fmc,kc->kfm", self.scores, matrix)
+        return np.where(self.mask, overall, -np.inf)
+
+    def _order(self, overall: np.ndarray) -> np.ndarray:
+        # Stable sort keeps the stored order for ties, like sorted() in the arena
+        return np.argsort(-overall, axis=-1, kind="stable")
+
+    def rankings(self, weights: Weights = CRITERION_WEIGHTS) -> List[List[str]]:
+        """Model names per fight, best first."""
+        order = self._order(self.overall(weights))
+        ranked = np.take_along_axis(self.models, order, axis=-1)
+        return [list(ranked[f, :self.mask[f].sum()]) for f in range(len(self.reports))]
+
+    def winners(self, weights: Weights = CRITERION_WEIGHTS) -> List[str]:
+        return [ranking[0] if ranking else "" for ranking in self.rankings(weights)]
+
+    def rescore(self, weights: Weights = CRITERION_WEIGHTS) -> List[ArenaReport]:
+        """Copies of the stored reports with new overall scores, rankings and winners."""
+        overall = self.overall(weights)
+        order = self._order(overall)
+        rescored = []
+        for f, report in enumerate(self.reports):
+            results = []
+            for m in order[f, :self.mask[f].sum()]:
+                run = report.results[m]
+                scores = {**run.report.scores, "overall": float(overall[f, m])}
+                results.append(run.model_copy(update={"report": run.report.model_copy(update={"scores": scores})}))
+            rankings = [run.model for run in results]
+            rescored.append(report.model_copy(update={
+                "results": results, "rankings": rankings, "winner": rankings[0] if rankings else report.winner}))
+        return rescored
+
+    def sweep(self, weights: Sequence[Weights], baseline: Weights = CRITERION_WEIGHTS) -> RankingStability:
+        """Rank every fight under each weight vector and compare with the baseline.
+
+        Returns:
+            Per-fight share of configs that keep the baseline winner, and share of
+            model pairs (averaged over configs) ordered as in the baseline
+        """
+        matrix = weight_matrix(weights)
+        overall = self._overall(matrix)
+        base = self._overall(weight_matrix([baseline]))[0]
+        order = self._order(overall)
+        winner_slots = order[..., 0]
+        base_winner = self._order(base)[:, 0]
+
+        pairs = self.mask[:, :, None] & self.mask[:, None, :]
+        upper = np.triu(np.ones(pairs.shape[1:], dtype=bool), k=1)
+        pairs &= upper
+        with np.errstate(invalid="ignore"):
+            base_sign = np.sign(base[:, :, None] - base[:, None, :])
+            sign = np.sign(overall[:, :, :, None] - overall[:, :, None, :])
+        concordant = ((sign == base_sign) & pairs).sum(axis=(2, 3))
+        n_pairs = np.maximum(pairs.sum(axis=(1, 2)), 1)
+
+        fights = np.arange(len(self.reports))
+        return RankingStability(
+            prompts=[r.prompt for r in self.reports],
+            baseline_winners=self.models[fights, base_winner].tolist(),
+            winners=self.models[fights[None, :], winner_slots].tolist(),
+            winner_agreement=(winner_slots == base_winner).mean(axis=0).tolist() if len(matrix) else [],
+            pairwise_agreement=(concordant / n_pairs).mean(axis=0).tolist() if len(matrix) else [],
+        )
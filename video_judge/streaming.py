@@ -0,0 +1,208 @@
+"""Overlapped download-and-decode of generated videos.
+
+Feeds the HTTP download stream into an ffmpeg rawvideo pipe as bytes
+arrive, keeping the sampled frames on the fly and writing the archival copy
+in the same pass. This takes the serial download -> open -> decode latency
+off the critical path of each arena run.
+
+Decoding from a pipe needs the moov atom before the media data (a
+"faststart" mp4). For other files, adaptive specs, or when ffmpeg is not on
+PATH, the stream is still written to disk in one pass and the frames are
+then sampled from the finished file.
+"""
+
+import contextlib
+import os
+import shutil
+import struct
+import subprocess
+import threading
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import requests
+
+from video_judge.config.logger import logger
+from video_judge.models import FrameSampling, VideoFrame
+from video_judge.process import derive_views, sample_frame_views, spec_frame_count, uniform_indices
+
+CHUNK_SIZE = 1 << 16
+_CONTAINERS = {b"moov", b"trak", b"mdia", b"minf", b"stbl"}
+
+
+def _boxes(data: bytes, start: int = 0, end: Optional[int] = None) -> Iterator[tuple]:
+    """Yield (type, payload_start, box_end) for the ISO-BMFF boxes in data[start:end]."""
+    end = len(data) if end is None else end
+    pos = start
+    while pos + 8 <= end:
+        size, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        header = 8
+        if size == 1:
+            size = struct.unpack(">Q", data[pos + 8:pos + 16])[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header:
+            return
+        yield kind, pos + header, pos + size
+        pos += size
+
+
+def parse_moov(moov: bytes) -> Optional[dict]:
+    """fps, total_frames, width and height of the first video track in a moov payload."""
+    def walk(start, end, track):
+        for kind, payload, box_end in _boxes(moov, start, end):
+            if kind in _CONTAINERS:
+                if kind == b"trak":
+                    found = walk(payload, box_end, {})
+                    if found:
+                        return found
+                else:
+                    found = walk(payload, box_end, track)
+                    if found:
+                        return found
+            elif kind == b"tkhd":
+                # Width and height are the last two 16.16 fixed-point fields
+                w, h = struct.unpack(">II", moov[box_end - 8:box_end])
+                track["width"], track["height"] = w >> 16, h >> 16
+            elif kind == b"mdhd":
+                if moov[payload] == 1:
+                    track["timescale"], track["duration"] = struct.unpack(">IQ", moov[payload + 20:payload + 32])
+                else:
+                    track["timescale"], track["duration"] = struct.unpack(">II", moov[payload + 12:payload + 20])
+            elif kind == b"hdlr":
+                track["handler"] = moov[payload + 8:payload + 12]
+            elif kind == b"stsz":
+                track["total_frames"] = struct.unpack(">I", moov[payload + 8:payload + 12])[0]
+        if track.get("handler") == b"vide" and "total_frames" in track and track.get("duration"):
+            seconds = track["duration"] / track["timescale"]
+            return {"fps": track["total_frames"] / seconds, "total_frames": track["total_frames"],
+                    "width": track["width"], "height": track["height"], "duration_s": seconds}
+        return None
+
+    return walk(0, len(moov), {})
+
+
+class _MoovSniffer:
+    """Inspects the first bytes of an mp4 stream to find a leading moov atom."""
+
+    def __init__(self):
+        self.head = b""
+        self.meta: Optional[dict] = None
+        self.done = False
+
+    def feed(self, chunk: bytes):
+        if self.done:
+            return
+        self.head += chunk
+        for kind, payload, box_end in _boxes(self.head):
+            if kind == b"mdat":
+                self.done = True  # media before moov: not decodable from a pipe
+                return
+            if kind == b"moov":
+                if box_end <= len(self.head):
+                    self.meta = parse_moov(self.head[payload:box_end])
+                    self.done = True
+                return
+
+
+class _FramePipe:
+    """ffmpeg process decoding mp4 bytes from stdin into BGR rawvideo, keeping selected frames."""
+
+    def __init__(self, meta: dict, keep: List[int]):
+        self.frame_bytes = meta["width"] * meta["height"] * 3
+        self.shape = (meta["height"], meta["width"], 3)
+        self.keep = set(keep)
+        self.frames: Dict[int, np.ndarray] = {}
+        self.proc = subprocess.Popen(
+            ["ffmpeg", "-hide_banner", "-loglevel", "error", "-i", "pipe:0",
+             "-map", "0:v:0", "-fps_mode", "passthrough",
+             # Pin the output size to the moov dimensions so raw frames can be sliced by byte count
+             "-vf", f"scale={meta['width']}:{meta['height']}",
+             "-f", "rawvideo", "-pix_fmt", "bgr24", "pipe:1"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        self.reader = threading.Thread(target=self._read, daemon=True)
+        self.reader.start()
+
+    def _read(self):
+        idx = 0
+        while True:
+            raw = self.proc.stdout.read(self.frame_bytes)
+            if len(raw) < self.frame_bytes:
+                return
+            if idx in self.keep:
+                self.frames[idx] = np.frombuffer(raw, dtype=np.uint8).reshape(self.shape)
+            idx += 1
+
+    def write(self, chunk: bytes) -> bool:
+        try:
+            self.proc.stdin.write(chunk)
+            return True
+        except (BrokenPipeError, OSError):
+            return False
+
+    def finish(self) -> Dict[int, np.ndarray]:
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        self.reader.join()
+        self.proc.wait()
+        return self.frames
+
+
+def stream_frame_views(video_url: str, output_path: str,
+                       specs: Dict[str, FrameSampling]) -> Dict[str, List[VideoFrame]]:
+    """Download video_url to output_path while sampling every spec from the same byte stream.
+
+    Returns:
+        Frames per spec name, like process.sample_frame_views
+    """
+    streamable = shutil.which("ffmpeg") is not None and all(
+        spec.strategy == "uniform" for spec in specs.values())
+    sniffer = _MoovSniffer()
+    pipe: Optional[_FramePipe] = None
+    plans: Dict[str, List[int]] = {}
+    pending: List[bytes] = []
+    tmp_path = output_path + ".part"
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+
+    try:
+        with requests.get(video_url, stream=True, timeout=30) as response, open(tmp_path, "wb") as archive:
+            response.raise_for_status()
+            for chunk in response.iter_content(CHUNK_SIZE):
+                archive.write(chunk)
+                if not streamable:
+                    continue
+                if pipe is None:
+                    sniffer.feed(chunk)
+                    pending.append(chunk)
+                    if not sniffer.done:
+                        continue
+                    if sniffer.meta is None:
+                        logger.info(f"{video_url} is not faststart; sampling after download")
+                        streamable = False
+                        continue
+                    plans = {name: uniform_indices(sniffer.meta["total_frames"], spec_frame_count(spec, sniffer.meta))
+                             for name, spec in specs.items()}
+                    pipe = _FramePipe(sniffer.meta, [idx for plan in plans.values() for idx in plan])
+                    chunk = b"".join(pending)
+                if not pipe.write(chunk):
+                    streamable = False
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        # Failed mid-stream: stop the decoder and drop the partial download
+        if pipe is not None:
+            pipe.proc.kill()
+            pipe.finish()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    logger.info(f"Video downloaded to: {output_path}")
+
+    if pipe is None or not streamable:
+        if pipe is not None:
+            pipe.finish()
+        return sample_frame_views(output_path, specs)
+
+    return derive_views(pipe.finish(), plans, specs, sniffer.meta["fps"])
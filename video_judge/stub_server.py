@@ -0,0 +1,463 @@
+"""Local stand-in for the provider HTTP APIs video-judge talks to.
+
+Serves the subset of endpoints we call so the real SDK clients (connection
+pooling, serialization, retries) can be exercised end to end without
+network access or spend:
+
+- OpenAI Responses:        POST /v1/responses
+- OpenAI videos:           POST /v1/videos, GET /v1/videos/{id}, GET /v1/videos/{id}/content
+- Anthropic Messages:      POST /v1/messages
+- Gemini generateContent:  POST /{version}/models/{model}:generateContent
+- fal queue:               POST /{app}, GET /{owner}/{alias}/requests/{id}[/status]
+
+Structured-output requests are answered with a placeholder instance of the
+JSON schema sent in the request, so ``response_schema`` parsing works for
+any Pydantic model.
+
+Completion webhooks: a fal submit carrying ``?fal_webhook=<url>`` (and, when
+``openai_webhook_url`` is set, every OpenAI video job) completes
+``webhook_delay_s`` after submission rather than after a number of polls,
+and the server then POSTs the provider's callback payload to the URL.
+
+Usage:
+    with StubProviderServer(latency_s=0.05, rate_limit_rate=0.1) as server:
+        set_base_url(server.url)
+        ...
+        set_base_url(None)
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import urllib.request
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from video_judge.config.logger import logger
+
+_GEMINI_PATH = re.compile(r"^/[^/]+/models/(?P<model>[^:]+):generateContent$")
+_OPENAI_VIDEO_PATH = re.compile(r"^/v1/videos/(?P<id>[^/]+)(?P<content>/content)?$")
+_FAL_REQUEST_PATH = re.compile(r"^/(?P<app>.+)/requests/(?P<id>[^/]+)(?P<suffix>/status|/cancel)?$")
+
+
+def fake_from_schema(schema: Dict[str, Any], defs: Optional[Dict[str, Any]] = None) -> Any:
+    """Build a minimal value that validates against a JSON schema.
+
+    Handles the OpenAPI-flavoured schemas Gemini sends (upper-case types)
+    as well as standard JSON schema with ``$ref``/``$defs``.
+    """
+    defs = defs if defs is not None else schema.get("$defs", schema.get("definitions", {}))
+    if "$ref" in schema:
+        return fake_from_schema(defs[schema["$ref"].split("/")[-1]], defs)
+    for key in ("anyOf", "oneOf"):
+        if key in schema:
+            options = [s for s in schema[key] if str(s.get("type", "")).lower() != "null"]
+            return fake_from_schema(options[0] if options else {}, defs)
+    schema_type = str(schema.get("type", "object")).lower()
+    if schema_type == "object":
+        return {name: fake_from_schema(prop, defs)
+                for name, prop in schema.get("properties", {}).items()}
+    if schema_type == "array":
+        return [fake_from_schema(schema.get("items", {}), defs)]
+    if schema_type == "number":
+        return 0.5
+    if schema_type == "integer":
+        return 0
+    if schema_type == "boolean":
+        return True
+    return "stub"
+
+
+def _find_schema(body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Locate the structured-output schema in an OpenAI, Anthropic or Gemini request body."""
+    candidates = [
+        body.get("text", {}).get("format", {}).get("schema"),
+        body.get("output_format", {}).get("schema") if isinstance(body.get("output_format"), dict) else None,
+        body.get("output_config", {}).get("format", {}).get("schema"),
+        body.get("generationConfig", {}).get("responseJsonSchema"),
+        body.get("generationConfig", {}).get("responseSchema"),
+    ]
+    return next((c for c in candidates if c), None)
+
+
+def _default_video_bytes() -> bytes:
+    """Encode a short synthetic mp4 so downloaded videos can be decoded."""
+    import os
+    import tempfile
+    import cv2
+    import numpy as np
+
+    fd, path = tempfile.mkstemp(suffix=".mp4")
+    os.close(fd)
+    try:
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), 24, (64, 64))
+        for i in range(48):
+            frame = np.full((64, 64, 3), (i * 5) % 255, dtype=np.uint8)
+            writer.write(frame)
+        writer.release()
+        with open(path, "rb") as f:
+            return f.read()
+    finally:
+        os.unlink(path)
+
+
+class StubProviderServer:
+    """Threaded local HTTP server emulating provider APIs.
+
+    Args:
+        host: Interface to bind (default loopback)
+        port: Port to bind, 0 picks a free port
+        latency_s: Fixed delay added to every response
+        jitter_s: Extra uniformly-random delay in [0, jitter_s]
+        error_rate: Probability of answering with HTTP 500
+        rate_limit_rate: Probability of answering with HTTP 429
+        polls_until_complete: Status polls before a video job reports completion
+        video_bytes: Payload served for generated videos (synthetic mp4 by default)
+        seed: Seed for the fault-injection RNG, for reproducible runs
+        webhook_delay_s: Time from submission to completion (and callback) for webhook jobs
+        openai_webhook_url: Project-level endpoint to send OpenAI video.completed events to
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_s: float = 0.0,
+        jitter_s: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        polls_until_complete: int = 1,
+        video_bytes: Optional[bytes] = None,
+        seed: Optional[int] = None,
+        webhook_delay_s: float = 0.2,
+        openai_webhook_url: Optional[str] = None,
+    ):
+        self.latency_s = latency_s
+        self.jitter_s = jitter_s
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.polls_until_complete = polls_until_complete
+        self._video_bytes = video_bytes
+        self.webhook_delay_s = webhook_delay_s
+        self.openai_webhook_url = openai_webhook_url
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self.request_counts: Dict[str, int] = {}
+        self.faults_served: Dict[int, int] = {429: 0, 500: 0}
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def video_bytes(self) -> bytes:
+        if self._video_bytes is None:
+            self._video_bytes = _default_video_bytes()
+        return self._video_bytes
+
+    def start(self) -> "StubProviderServer":
+        # Encode the default clip up front: OpenCV serializes FFmpeg opens, so encoding it
+        # lazily inside a handler would deadlock against a client decoding from this server
+        _ = self.video_bytes
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Stub provider server listening on {self.url}")
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "StubProviderServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _count(self, endpoint: str):
+        with self._lock:
+            self.request_counts[endpoint] = self.request_counts.get(endpoint, 0) + 1
+
+    def _inject_fault(self) -> Optional[int]:
+        with self._lock:
+            delay = self.latency_s + self._rng.uniform(0, self.jitter_s)
+            roll = self._rng.random()
+        if delay:
+            time.sleep(delay)
+        if roll < self.rate_limit_rate:
+            status = 429
+        elif roll < self.rate_limit_rate + self.error_rate:
+            status = 500
+        else:
+            return None
+        with self._lock:
+            self.faults_served[status] += 1
+        return status
+
+    def _poll_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job["polls"] += 1
+                # Webhook jobs complete on their timer, not by being polled
+                job["done"] = job["done"] or (not job.get("webhook") and job["polls"] >= self.polls_until_complete)
+            return dict(job) if job is not None else None
+
+    def _new_job(self, **fields) -> Dict[str, Any]:
+        job = {"id": uuid.uuid4().hex, "polls": 0, "done": self.polls_until_complete <= 0, **fields}
+        with self._lock:
+            self._jobs[job["id"]] = job
+        return job
+
+    def _schedule_webhook(self, job: Dict[str, Any], url: str, payload: Dict[str, Any]):
+        """Complete the job after webhook_delay_s and POST payload to url."""
+        job["webhook"] = url
+
+        def fire():
+            with self._lock:
+                self._jobs[job["id"]]["done"] = True
+            request = urllib.request.Request(
+                url, data=json.dumps(payload).encode(), headers={"Content-Type": "application/json"})
+            try:
+                urllib.request.urlopen(request, timeout=5).close()
+            except Exception as e:
+                logger.warning(f"Stub webhook to {url} failed: {type(e).__name__}: {e}")
+                return
+            self._count("webhooks.sent")
+
+        timer = threading.Timer(self.webhook_delay_s, fire)
+        timer.daemon = True
+        timer.start()
+
+    def _fal_result(self, job_id: str) -> Dict[str, Any]:
+        return {
+            "video": {
+                "url": f"{self.url}/files/{job_id}.mp4",
+                "file_size": len(self.video_bytes),
+            },
+            "seed": 42,
+        }
+
+    # Response builders --------------------------------------------------
+
+    def _structured_text(self, body: Dict[str, Any]) -> str:
+        schema = _find_schema(body)
+        return json.dumps(fake_from_schema(schema)) if schema else "stub response"
+
+    def _openai_response(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        text = self._structured_text(body)
+        return {
+            "id": f"resp_{uuid.uuid4().hex}",
+            "object": "response",
+            "created_at": int(time.time()),
+            "model": body.get("model", "stub"),
+            "status": "completed",
+            "parallel_tool_calls": False,
+            "tool_choice": "auto",
+            "tools": [],
+            "output": [{
+                "type": "message",
+                "id": f"msg_{uuid.uuid4().hex}",
+                "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }],
+            "usage": {
+                "input_tokens": 0, "output_tokens": 0, "total_tokens": 0,
+                "input_tokens_details": {"cached_tokens": 0},
+                "output_tokens_details": {"reasoning_tokens": 0},
+            },
+        }
+
+    def _anthropic_message(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": f"msg_{uuid.uuid4().hex}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "stub"),
+            "content": [{"type": "text", "text": self._structured_text(body)}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": 0, "output_tokens": 0},
+        }
+
+    def _gemini_response(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "candidates": [{
+                "content": {"role": "model", "parts": [{"text": self._structured_text(body)}]},
+                "finishReason": "STOP",
+                "index": 0,
+            }],
+            "usageMetadata": {"promptTokenCount": 0, "candidatesTokenCount": 0, "totalTokenCount": 0},
+        }
+
+    def _openai_video(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": job["id"],
+            "object": "video",
+            "model": job["model"],
+            "created_at": job["created_at"],
+            "status": "completed" if job["done"] else "in_progress",
+            "progress": 100 if job["done"] else 50,
+        }
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                logger.debug(f"stub_server: {format % args}")
+
+            def _read_json(self) -> Dict[str, Any]:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                return json.loads(raw) if raw else {}
+
+            def _send(self, status: int, payload: Any = None, content_type: str = "application/json"):
+                data = payload if isinstance(payload, bytes) else json.dumps(payload or {}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                if status == 429:
+                    self.send_header("Retry-After", "0")
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _send_file(self, data: bytes, head: bool = False):
+                """Serve video bytes, honouring single-range "Range: bytes=a-b" requests."""
+                match = re.match(r"bytes=(\d*)-(\d*)$", self.headers.get("Range") or "")
+                start, end = 0, len(data) - 1
+                if match and (match.group(1) or match.group(2)):
+                    server._count("files.range")
+                    if match.group(1):
+                        start = int(match.group(1))
+                        end = min(int(match.group(2)), end) if match.group(2) else end
+                    else:
+                        start = max(0, len(data) - int(match.group(2)))
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+                else:
+                    self.send_response(200)
+                self.send_header("Content-Type", "video/mp4")
+                self.send_header("Accept-Ranges", "bytes")
+                self.send_header("Content-Length", str(end - start + 1))
+                self.end_headers()
+                if head:
+                    return
+                try:
+                    self.wfile.write(data[start:end + 1])
+                except (BrokenPipeError, ConnectionResetError):
+                    # Decoders drop open-ended range reads once they have what they need
+                    pass
+
+            def do_HEAD(self):
+                if self.path.split("?")[0].startswith("/files/"):
+                    self._send_file(server.video_bytes, head=True)
+                else:
+                    self._send(404, {"error": {"message": f"unknown path {self.path}"}})
+
+            def _fault(self) -> bool:
+                status = server._inject_fault()
+                if status is None:
+                    return False
+                message = "rate limited" if status == 429 else "injected server error"
+                self._send(status, {"error": {"message": message, "type": "stub_error"}})
+                return True
+
+            def do_POST(self):
+                path = self.path.split("?")[0]
+                body = self._read_json()
+                if self._fault():
+                    return
+                gemini = _GEMINI_PATH.match(path)
+                if path == "/v1/responses":
+                    server._count("openai.responses")
+                    self._send(200, server._openai_response(body))
+                elif path == "/v1/messages":
+                    server._count("anthropic.messages")
+                    self._send(200, server._anthropic_message(body))
+                elif gemini:
+                    server._count("gemini.generate_content")
+                    self._send(200, server._gemini_response(body))
+                elif path == "/v1/videos":
+                    server._count("openai.videos.create")
+                    job = server._new_job(model=body.get("model", "stub"), created_at=int(time.time()))
+                    if server.openai_webhook_url:
+                        server._schedule_webhook(job, server.openai_webhook_url, {
+                            "object": "event", "type": "video.completed", "data": {"id": job["id"]}})
+                    self._send(200, server._openai_video(job))
+                else:
+                    server._count("fal.submit")
+                    app = path.strip("/")
+                    owner_alias = "/".join(app.split("/")[:2])
+                    job = server._new_job(app=owner_alias)
+                    webhook = parse_qs(urlparse(self.path).query).get("fal_webhook")
+                    if webhook:
+                        server._schedule_webhook(job, webhook[0], {
+                            "request_id": job["id"], "status": "OK", "payload": server._fal_result(job["id"])})
+                    base = f"{server.url}/{owner_alias}/requests/{job['id']}"
+                    self._send(200, {
+                        "request_id": job["id"],
+                        "response_url": base,
+                        "status_url": f"{base}/status",
+                        "cancel_url": f"{base}/cancel",
+                    })
+
+            def do_PUT(self):
+                match = _FAL_REQUEST_PATH.match(self.path.split("?")[0])
+                if match and match.group("suffix") == "/cancel":
+                    server._count("fal.cancel")
+                    self._send(202, {"status": "CANCELLATION_REQUESTED"})
+                else:
+                    self._send(404, {"error": {"message": f"unknown path {self.path}"}})
+
+            def do_GET(self):
+                path = self.path.split("?")[0]
+                if path.startswith("/files/"):
+                    server._count("files")
+                    self._send_file(server.video_bytes)
+                    return
+                if self._fault():
+                    return
+                video = _OPENAI_VIDEO_PATH.match(path)
+                fal = _FAL_REQUEST_PATH.match(path)
+                if video:
+                    if video.group("content"):
+                        server._count("openai.videos.content")
+                        self._send(200, server.video_bytes, content_type="video/mp4")
+                        return
+                    server._count("openai.videos.retrieve")
+                    job = server._poll_job(video.group("id"))
+                    if job is None:
+                        self._send(404, {"error": {"message": "video not found"}})
+                    else:
+                        self._send(200, server._openai_video(job))
+                elif fal and fal.group("suffix") == "/status":
+                    server._count("fal.status")
+                    job = server._poll_job(fal.group("id"))
+                    if job is None:
+                        self._send(404, {"detail": "request not found"})
+                    elif job["done"]:
+                        self._send(200, {"status": "COMPLETED", "logs": [], "metrics": {}})
+                    else:
+                        self._send(200, {"status": "IN_PROGRESS", "logs": []})
+                elif fal:
+                    server._count("fal.result")
+                    self._send(200, server._fal_result(fal.group("id")))
+                else:
+                    self._send(404, {"error": {"message": f"unknown path {self.path}"}})
+
+        return Handler
@@ -0,0 +1,112 @@
+"""Prompt template registry.
+
+Templates are read once and kept in memory; each lookup only stats the file
+and reloads it when its mtime changes, so edits are picked up without a
+restart. The ``{{var}}`` placeholders are split out at load time, so
+rendering is a single join. Every template carries a content hash that
+caches and reports can record to tell which prompt text produced a result.
+
+Template names resolve to ``<name>.txt`` under PROMPTS_DIR, the ``prompts``
+directory shipped inside the package (override with VIDEO_JUDGE_PROMPTS_DIR),
+so lookups don't depend on the working directory or a source checkout.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Union
+
+from video_judge.config.logger import logger
+
+PROMPTS_DIR = Path(os.environ.get("VIDEO_JUDGE_PROMPTS_DIR",
+                                  Path(__file__).resolve().parent / "prompts"))
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+
+class PromptTemplate:
+    """One loaded template with its placeholders precompiled.
+
+    Args:
+        name: Template name (or path it was loaded from)
+        text: Raw template text
+        mtime_ns: Modification time of the file the text came from
+    """
+
+    def __init__(self, name: str, text: str, mtime_ns: int = 0):
+        self.name = name
+        self.text = text
+        self.mtime_ns = mtime_ns
+        self.hash = hashlib.sha256(text.encode()).hexdigest()[:16]
+        # Even positions are literal text, odd positions placeholder names
+        self._parts = _PLACEHOLDER.split(text)
+
+    @property
+    def variables(self) -> List[str]:
+        return self._parts[1::2]
+
+    def render(self, **kwargs) -> str:
+        """Substitute {{key}} placeholders; unknown placeholders are left as they are."""
+        if len(self._parts) == 1:
+            return self.text
+        parts = list(self._parts)
+        for i in range(1, len(parts), 2):
+            key = parts[i]
+            parts[i] = str(kwargs[key]) if key in kwargs else f"{{{{{key}}}}}"
+        return "".join(parts)
+
+
+class TemplateRegistry:
+    """Cache of prompt templates keyed by name, reloaded when the file's mtime changes.
+
+    Args:
+        root: Directory holding <name>.txt templates
+    """
+
+    def __init__(self, root: Union[str, Path] = PROMPTS_DIR):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._templates: Dict[str, PromptTemplate] = {}
+
+    def path(self, name: str) -> Path:
+        """File a template name (or an explicit .txt path) refers to."""
+        if name.endswith(".txt") or os.sep in name or "/" in name:
+            return Path(name)
+        return self.root / f"{name}.txt"
+
+    def get(self, name: str) -> PromptTemplate:
+        """The current version of a template, reading the file only if it changed."""
+        path = self.path(name)
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Prompt template {name!r} not found at {path}; set VIDEO_JUDGE_PROMPTS_DIR to the "
+                f"directory holding the <name>.txt templates") from None
+        cached = self._templates.get(name)
+        if cached and cached.mtime_ns == mtime_ns:
+            return cached
+        with self._lock:
+            cached = self._templates.get(name)
+            if cached and cached.mtime_ns == mtime_ns:
+                return cached
+            template = PromptTemplate(name, path.read_text(), mtime_ns)
+            if cached:
+                logger.info(f"Reloaded prompt template {name} ({cached.hash} -> {template.hash})")
+            self._templates[name] = template
+            return template
+
+    def render(self, name: str, **kwargs) -> str:
+        return self.get(name).render(**kwargs)
+
+    def hashes(self) -> Dict[str, str]:
+        """Content hash of every template loaded so far."""
+        return {name: template.hash for name, template in self._templates.items()}
+
+    def clear(self):
+        with self._lock:
+            self._templates.clear()
+
+
+prompt_templates = TemplateRegistry()
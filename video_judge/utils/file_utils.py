@@ -1,10 +1,14 @@
+import contextlib
 import io
+import os
 import subprocess
 import tempfile
 import shutil
+from pathlib import Path
 from video_judge.ai_api_client import google_client
 from video_judge.config.logger import logger
 import requests
+import httpx
 import glob
 import random
 from google.genai import types
@@ -86,6 +90,46 @@ def get_video(video_url: str) -> bytes:
     return response.content
 
 
+async def aget_video(video_url: str) -> bytes:
+    """Fetch video content from a URL without blocking the event loop."""
+    async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
+        response = await client.get(video_url)
+    response.raise_for_status()
+    return response.content
+
+
+def atomic_write(path: Path, data: bytes):
+    """Write via a temp file so a crash never leaves a half-written file at path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def is_remote(video_path: str) -> bool:
+    """Whether a video path is an http(s) URL the decoder should read with range requests."""
+    return video_path.startswith(("http://", "https://"))
+
+
+def archive_video(video_url: str, output_path: str, chunk_size: int = 1 << 20) -> str:
+    """Stream a video URL to disk, only exposing output_path once the file is complete."""
+    tmp_path = output_path + ".part"
+    try:
+        with requests.get(video_url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            with open(tmp_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size):
+                    f.write(chunk)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    logger.info(f"Video archived to: {output_path}")
+    return output_path
+
+
 def download_video(video_content: bytes, output_path: str) -> str:
 
     with open(output_path, 'wb') as f:
@@ -1,10 +1,11 @@
-def format_prompt(template_path: str, **kwargs) -> str:
-    """Replace {{variable}} placeholders in template with kwargs"""
-    with open(template_path, "r") as f:
-        template = f.read()
+from video_judge.templates import prompt_templates
 
-    # Replace all {{key}} with values from kwargs
-    for key, value in kwargs.items():
-        template = template.replace(f"{{{{{key}}}}}", str(value))
 
-    return template
+def format_prompt(template: str, **kwargs) -> str:
+    """Replace {{variable}} placeholders in template with kwargs
+
+    Args:
+        template: Template name under the prompts directory (e.g. "decompose"),
+            or a path to a .txt template file
+    """
+    return prompt_templates.render(template, **kwargs)
@@ -1,77 +1,415 @@
+import asyncio
+import threading
 import time
 import uuid
 from google.genai import types
 from datetime import datetime
-from typing import Optional
-import fal_client
+from pathlib import Path
+from concurrent.futures import Future
+from typing import Callable, Literal, Optional, Tuple
 from fal_client.client import Completed
 from dotenv import load_dotenv
-from video_judge.utils.file_utils import download_video, get_video
-from video_judge.ai_api_client import openai_client
+from video_judge.utils.file_utils import aget_video, archive_video, download_video, get_video
 from video_judge.config.logger import logger
+from video_judge.journal import JobJournal
 from video_judge.models import VideoInfo
-from video_judge.ai_api_client import openai_client, google_client
+from video_judge.webhooks import WebhookReceiver
+from video_judge.ai_api_client import (
+    fal_api_client,
+    fal_async_client,
+    google_async_client,
+    google_client,
+    openai_async_client,
+    openai_client,
+)
 from abc import ABC, abstractmethod
 load_dotenv()
 
 
+def _default_download_path() -> str:
+    unique_id = uuid.uuid4().hex[:8]
+    return f"./output/videos/generated_video_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{unique_id}.mp4"
+
+
+class GenerationCancelledError(TimeoutError):
+    """Raised inside a generator's polling loop once cancel() has been called."""
+
+
 class BaseVideoGenerator(ABC):
-    def __init__(self, model: str):
+    provider: str
+    # With a webhook registered, polling only runs this often as a fallback
+    webhook_fallback_s: float = 30.0
+
+    def __init__(self, model: str, journal: Optional[JobJournal] = None,
+                 webhooks: Optional[WebhookReceiver] = None):
         self.model = model
+        self.journal = journal
+        self.webhooks = webhooks
+        self._webhook: Optional[Future] = None
+        self._webhook_key: Optional[str] = None
         self._request_id = None
+        # Set by cancel(); polling waits on it so a cancelled thread wakes immediately
+        self.cancel_event = threading.Event()
+        # Optional hook called as progress_callback(stage, **fields), e.g. by VideoGenArena.stream
+        self.progress_callback: Optional[Callable[..., None]] = None
+
+    def _emit(self, stage: str, **fields):
+        if self.progress_callback:
+            self.progress_callback(stage, **fields)
+
+    def cancel(self):
+        """Cooperatively cancel this generator.
+
+        Wakes the polling loop (which then raises GenerationCancelledError) and
+        asks the provider to cancel the job where its API supports it.
+        """
+        self.cancel_event.set()
+        if self._journal_request_id() is None:
+            return
+        try:
+            self._cancel_provider_job()
+        except Exception as e:
+            logger.warning(
+                f"{self.__class__.__name__}: provider-side cancel failed: {type(e).__name__}: {e}")
+
+    def _cancel_provider_job(self):
+        """Cancel the current provider job; no-op for providers without a cancel API."""
+        logger.info(
+            f"{self.__class__.__name__}: provider has no cancel API, job {self._journal_request_id()} left running")
+
+    def _register_webhook(self, key: Optional[str] = None) -> Optional[str]:
+        """Expect a completion callback for the job being submitted.
+
+        Without a key a fresh token is used and the callback URL to hand the
+        provider is returned; with a key (a provider job id delivered to a
+        shared endpoint) nothing needs to be passed along. No-op without a receiver.
+        """
+        if not self.webhooks:
+            return None
+        self._discard_webhook()
+        key = key or self.webhooks.new_token()
+        self._webhook_key = key
+        self._webhook = self.webhooks.expect(key)
+        return self.webhooks.callback_url(key)
+
+    def _discard_webhook(self):
+        """Stop expecting the current job's callback once its result is consumed or the job ended."""
+        if self.webhooks and self._webhook_key:
+            self.webhooks.discard(self._webhook_key)
+        self._webhook_key = None
+        self._webhook = None
+
+    def _pending_webhook(self) -> Optional[Future]:
+        return self._webhook if self._webhook is not None and not self._webhook.done() else None
+
+    def _wait(self, seconds: float):
+        """Sleep between polls, raising as soon as the generator is cancelled.
+
+        While a webhook is pending, sleeps up to webhook_fallback_s instead and
+        returns as soon as the callback arrives.
+        """
+        webhook = self._pending_webhook()
+        if webhook is None:
+            if self.cancel_event.wait(seconds):
+                raise GenerationCancelledError(
+                    f"{self.__class__.__name__}: video generation for {self.model} was cancelled")
+            return
+        deadline = time.monotonic() + max(seconds, self.webhook_fallback_s)
+        while not webhook.done():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if self.cancel_event.wait(min(remaining, 0.1)):
+                raise GenerationCancelledError(
+                    f"{self.__class__.__name__}: video generation for {self.model} was cancelled")
+
+    async def _async_wait(self, seconds: float):
+        """Async _wait: sleeps on the event loop, checking for cancel() (and the webhook) every 100ms."""
+        webhook = self._pending_webhook()
+        if webhook is not None:
+            seconds = max(seconds, self.webhook_fallback_s)
+        deadline = time.monotonic() + seconds
+        while not self.cancel_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or (webhook is not None and webhook.done()):
+                return
+            await asyncio.sleep(min(remaining, 0.1))
+        raise GenerationCancelledError(
+            f"{self.__class__.__name__}: video generation for {self.model} was cancelled")
 
     @abstractmethod
     def run_video_gen(self, prompt: str, download_path: Optional[str] = None):
         pass
 
+    async def arun_video_gen(self, prompt: str, download_path: Optional[str] = None) -> VideoInfo:
+        """Coroutine version of run_video_gen.
+
+        Generators with an async provider client override this so that waiting
+        on the provider holds no thread; the default runs run_video_gen on one.
+        """
+        return await asyncio.to_thread(self.run_video_gen, prompt, download_path)
+
+    def _journal_request_id(self) -> Optional[str]:
+        """Provider id of the current job, as stored in the journal."""
+        return self._request_id
+
+    def _attach(self, request_id: str):
+        """Point the generator at an existing provider job instead of submitting."""
+        self._request_id = request_id
+
+    def _resume(self, prompt: str) -> Tuple[Optional[VideoInfo], bool]:
+        """The stored VideoInfo of a downloaded journaled job, and whether a job was found.
+
+        A journaled job that isn't downloaded (or whose file is gone) is re-attached.
+        """
+        if self.cancel_event.is_set():
+            raise GenerationCancelledError(
+                f"{self.__class__.__name__}: cancelled before submitting {self.model}")
+        job = self.journal.find_job(
+            self.provider, self.model, prompt) if self.journal else None
+        if job and job.state == "downloaded" and job.video_info and Path(job.video_info.saved_path).exists():
+            logger.info(
+                f"Reusing journaled video for {self.model}: {job.video_info.saved_path}")
+            self._emit("downloaded")
+            return job.video_info, True
+        if job:
+            logger.info(
+                f"Re-attaching to {self.provider} job {job.request_id} ({job.state})")
+            self._attach(job.request_id)
+            return None, True
+        return None, False
+
+    def _record_submission(self, prompt: str):
+        if self.journal:
+            self.journal.record_submission(
+                self.provider, self.model, prompt, self._journal_request_id())
+        self._emit("submitted")
+
+    def _resume_or_submit(self, prompt: str) -> Optional[VideoInfo]:
+        """Reuse a journaled job for this prompt, or submit a new one.
+
+        Returns the stored VideoInfo when the job was already downloaded and the
+        file still exists; otherwise re-attaches to (or submits) a job and returns None.
+        """
+        cached, found = self._resume(prompt)
+        if not found:
+            self.submit_request(prompt)
+            self._record_submission(prompt)
+        return cached
+
+    async def _aresume_or_submit(self, prompt: str) -> Optional[VideoInfo]:
+        """_resume_or_submit using the generator's async submit_request."""
+        cached, found = self._resume(prompt)
+        if not found:
+            await self.asubmit_request(prompt)
+            self._record_submission(prompt)
+        return cached
+
+    def _journal_mark(self, state: str, **kwargs):
+        if self.journal and self._journal_request_id():
+            self.journal.mark(self._journal_request_id(), state, **kwargs)
+
+    def mark_downloaded(self, info: VideoInfo):
+        """Record that info.saved_path now holds the complete video, e.g. after a streamed download."""
+        self._journal_mark("downloaded", video_info=info)
+        self._emit("downloaded")
+
+    @staticmethod
+    def _content_result(video_content: bytes) -> dict:
+        """get_result() payload for providers that return the video bytes themselves."""
+        return {
+            "video": {
+                "content": video_content,
+                "file_size": len(video_content),
+            },
+            "seed": None
+        }
+
+    def _save_content(self, prompt: str, result: dict, download_path: str) -> VideoInfo:
+        """Write the video bytes returned by get_result() and journal the download."""
+        logger.info("Video generation completed")
+        local_path = download_video(result["video"]["content"], download_path)
+        info = VideoInfo(
+            saved_path=local_path,
+            metadata={
+                "generated_at": datetime.now(),
+                "prompt": prompt,
+                "file_size": result["video"]["file_size"],
+            }
+        )
+        self.mark_downloaded(info)
+        return info
+
 
 class FalVideoGenerator(BaseVideoGenerator):
-    def __init__(self, model: Optional[str] = "fal-ai/bytedance/seedance/v1/pro/fast/text-to-video"):
-        super().__init__(model)
+    provider = "fal"
+
+    def __init__(self, model: Optional[str] = "fal-ai/bytedance/seedance/v1/pro/fast/text-to-video",
+                 journal: Optional[JobJournal] = None,
+                 download: Literal["sync", "background", "stream", "skip"] = "sync",
+                 webhooks: Optional[WebhookReceiver] = None):
+        """
+        Args:
+            download: "sync" downloads before returning. "background" returns as soon as
+                the result URL is known (judges sample it with range reads) and archives
+                the file on a background thread; "stream" leaves the download to the
+                orchestrator, which decodes frames while the bytes arrive; "skip" never
+                downloads.
+            webhooks: Receiver to register a per-request callback URL with; the result
+                is taken from the callback and status polling drops to a fallback
+        """
+        super().__init__(model, journal, webhooks)
         self._request_id = None
+        self.download = download
+        self.archive_thread: Optional[threading.Thread] = None
 
     def submit_request(self, prompt: str):
-        handler = fal_client.submit(
+        handler = fal_api_client.client.submit(
             self.model,
             arguments={
                 "prompt": prompt
             },
+            webhook_url=self._register_webhook(),
         )
         request_id = handler.request_id
         self._request_id = request_id
 
+    async def asubmit_request(self, prompt: str):
+        handler = await fal_async_client.client.submit(
+            self.model, arguments={"prompt": prompt}, webhook_url=self._register_webhook())
+        self._request_id = handler.request_id
+
+    def _cancel_provider_job(self):
+        fal_api_client.client.cancel(self.model, self._request_id)
+        logger.info(f"Cancelled fal request {self._request_id}")
+
     def fetch_status(self) -> str:
-        status = fal_client.status(
+        status = fal_api_client.client.status(
             self.model, self._request_id, with_logs=True)
         return status
 
+    def _webhook_result(self) -> Optional[dict]:
+        """The request's result from a delivered fal webhook, if any; raises if fal reported an error."""
+        if self._webhook is None or not self._webhook.done():
+            return None
+        callback = self._webhook.result()
+        if callback.get("status") == "ERROR":
+            self._journal_mark("failed", error=str(callback.get("error")))
+            raise RuntimeError(
+                f"{self.__class__.__name__}: Video generation failed with error {callback.get('error')}")
+        if callback.get("payload") is None:
+            # Payload too large to deliver (payload_error): fall back to fetching the result
+            return None
+        self._journal_mark("completed")
+        return callback["payload"]
+
     def get_result(self, timeout: int = 600):
-        start_time = time.time()
-        while True:
-            if time.time() - start_time > timeout:
-                raise TimeoutError(
-                    f"{self.__class__.__name__}: Video generation failed after {timeout} seconds")
-            status = self.fetch_status()
-            logger.info(f"Current status: {status}")
-            if isinstance(status, Completed):
-                result = fal_client.result(
-                    self.model, self._request_id)
-                return result
-            time.sleep(1)
+        try:
+            start_time = time.time()
+            while True:
+                if time.time() - start_time > timeout:
+                    raise TimeoutError(
+                        f"{self.__class__.__name__}: Video generation failed after {timeout} seconds")
+                result = self._webhook_result()
+                if result is not None:
+                    return result
+                status = self.fetch_status()
+                logger.info(f"Current status: {status}")
+                self._emit("generating")
+                if isinstance(status, Completed):
+                    self._journal_mark("completed")
+                    result = fal_api_client.client.result(
+                        self.model, self._request_id)
+                    return result
+                self._wait(1)
+        finally:
+            self._discard_webhook()
+
+    async def _next_event(self, events, deadline: float, timeout: int):
+        """Next status from the event stream, or None if the webhook arrived first.
+
+        Checks for cancel(), the webhook and the deadline every 100ms while the
+        stream waits out its interval. Waking on the webhook closes the stream.
+        """
+        webhook = self._pending_webhook()
+        pending = asyncio.ensure_future(events.__anext__())
+        try:
+            while not pending.done():
+                if self.cancel_event.is_set():
+                    raise GenerationCancelledError(
+                        f"{self.__class__.__name__}: video generation for {self.model} was cancelled")
+                if time.time() > deadline:
+                    raise TimeoutError(
+                        f"{self.__class__.__name__}: Video generation failed after {timeout} seconds")
+                if webhook is not None and webhook.done():
+                    return None
+                await asyncio.wait({pending}, timeout=0.1)
+            return pending.result()
+        finally:
+            if not pending.done():
+                pending.cancel()
+
+    async def aget_result(self, timeout: int = 600):
+        """Async get_result, following the request's status event stream.
+
+        While a webhook is pending the stream only polls every webhook_fallback_s,
+        and the callback ends the wait as soon as it arrives.
+        """
+        try:
+            deadline = time.time() + timeout
+            handle = fal_async_client.client.get_handle(self.model, self._request_id)
+            events = None
+            while True:
+                result = self._webhook_result()
+                if result is not None:
+                    return result
+                if events is None:
+                    interval = self.webhook_fallback_s if self._pending_webhook() else 1
+                    events = handle.iter_events(with_logs=True, interval=interval)
+                status = await self._next_event(events, deadline, timeout)
+                if status is None:
+                    # Woken by the webhook; if it carried no payload, resume the stream at the normal interval
+                    events = None
+                    continue
+                logger.info(f"Current status: {status}")
+                self._emit("generating")
+                if isinstance(status, Completed):
+                    self._journal_mark("completed")
+                    return await fal_async_client.client.result(self.model, self._request_id)
+        finally:
+            self._discard_webhook()
 
     def run_video_gen(self, prompt: str, download_path: Optional[str] = None) -> VideoInfo:
-        if download_path is None:
-            unique_id = uuid.uuid4().hex[:8]
-            download_path = f"./output/videos/generated_video_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{unique_id}.mp4"
-        self.submit_request(prompt)
+        download_path = download_path or _default_download_path()
+        cached = self._resume_or_submit(prompt)
+        if cached:
+            return cached
         result = self.get_result()
+        video_content = get_video(result["video"]["url"]) if self.download == "sync" else None
+        return self._finish(prompt, result, download_path, video_content)
+
+    async def arun_video_gen(self, prompt: str, download_path: Optional[str] = None) -> VideoInfo:
+        download_path = download_path or _default_download_path()
+        cached = await self._aresume_or_submit(prompt)
+        if cached:
+            return cached
+        result = await self.aget_result()
+        video_content = await aget_video(result["video"]["url"]) if self.download == "sync" else None
+        return self._finish(prompt, result, download_path, video_content)
+
+    def _finish(self, prompt: str, result: dict, download_path: str,
+                video_content: Optional[bytes]) -> VideoInfo:
+        """Build and journal the VideoInfo for a finished request; video_content is set in "sync" mode."""
         logger.info("Video generation completed")
         video_url = result["video"]["url"]
         file_size = result["video"]["file_size"]
         generated_at = datetime.now()
         seed = result.get("seed", "")
-        video_content = get_video(video_url)
-        local_path = download_video(video_content, download_path)
+        if self.download == "sync":
+            local_path = download_video(video_content, download_path)
+        else:
+            # saved_path is where the archive will land; sampling reads video_url until it exists
+            local_path = download_path
         if seed == "":  # some return empty string instead of omitting the field when seed is not provided, handle both cases
             logger.warning("No seed returned from video generation API")
             seed = None
@@ -85,75 +423,130 @@ class FalVideoGenerator(BaseVideoGenerator):
                 "seed": seed}
 
         )
+        if self.download == "sync":
+            self._journal_mark("downloaded", video_info=info)
+            self._emit("downloaded")
+        else:
+            self._journal_mark("completed", video_info=info)
+        if self.download == "background":
+            self.archive_thread = threading.Thread(target=self._archive, args=(info,), daemon=True)
+            self.archive_thread.start()
         return info
 
+    def _archive(self, info: VideoInfo):
+        try:
+            archive_video(info.video_url, info.saved_path)
+        except Exception as e:
+            logger.warning(f"Archiving {info.video_url} failed: {type(e).__name__}: {e}")
+            return
+        self.mark_downloaded(info)
+
 
 class OpenAIVideoGenerator(BaseVideoGenerator):
-    def __init__(self, model: str = "sora-2"):
-        super().__init__(model)
+    provider = "openai"
+
+    def __init__(self, model: str = "sora-2", journal: Optional[JobJournal] = None,
+                 webhooks: Optional[WebhookReceiver] = None):
+        """
+        Args:
+            webhooks: Receiver whose /webhooks/openai route is configured as the project's
+                webhook endpoint; video.completed events cut polling to a fallback
+        """
+        super().__init__(model, journal, webhooks)
         self._request_id = None
 
     def submit_request(self, prompt: str):
         video_request = openai_client.client.videos.create(
             model=self.model, prompt=prompt)
         self._request_id = video_request.id
+        self._register_webhook(self._request_id)
+
+    async def asubmit_request(self, prompt: str):
+        video_request = await openai_async_client.client.videos.create(model=self.model, prompt=prompt)
+        self._request_id = video_request.id
+        self._register_webhook(self._request_id)
+
+    def _cancel_provider_job(self):
+        # The videos API has no cancel endpoint; deleting the job is the closest equivalent
+        openai_client.client.videos.delete(self._request_id)
+        logger.info(f"Deleted OpenAI video job {self._request_id}")
 
     def fetch_status(self):
         response = openai_client.client.videos.retrieve(self._request_id)
         return response
 
+    def _check_job(self, job) -> bool:
+        """Log a polled job and report whether it completed; raises if it failed."""
+        logger.info(
+            f"Current status: {job.status}, progress: {job.progress}")
+        self._emit("generating", progress=job.progress)
+        if job.status == "completed":
+            self._journal_mark("completed")
+            return True
+        if job.status == "failed":
+            self._journal_mark("failed", error=str(job.error))
+            raise RuntimeError(
+                f"{self.__class__.__name__}: Video generation failed with error {job.error}")
+        return False
+
     def get_result(self, timeout: int = 900):
-        start_time = time.time()
-        while True:
-            if time.time() - start_time > timeout:
-                raise TimeoutError(
-                    f"{self.__class__.__name__}: Video generation failed after {timeout} seconds")
-            job = self.fetch_status()
-            logger.info(
-                f"Current status: {job.status}, progress: {job.progress}")
-            if job.status == "completed":
-                content = openai_client.client.videos.download_content(
-                    self._request_id)
-                video_content = content.read()
-                return {
-                    "video": {
-                        "content": video_content,
-                        "file_size": len(video_content),
-                    },
-                    "seed": None
-                }
-            elif job.status == "failed":
-                raise RuntimeError(
-                    f"{self.__class__.__name__}: Video generation failed with error {job.error}")
-            time.sleep(5)
+        try:
+            start_time = time.time()
+            while True:
+                if time.time() - start_time > timeout:
+                    raise TimeoutError(
+                        f"{self.__class__.__name__}: Video generation failed after {timeout} seconds")
+                if self._check_job(self.fetch_status()):
+                    content = openai_client.client.videos.download_content(
+                        self._request_id)
+                    return self._content_result(content.read())
+                self._wait(5)
+        finally:
+            self._discard_webhook()
+
+    async def aget_result(self, timeout: int = 900):
+        """Async get_result; the videos API has no status stream, so this polls."""
+        try:
+            start_time = time.time()
+            while True:
+                if time.time() - start_time > timeout:
+                    raise TimeoutError(
+                        f"{self.__class__.__name__}: Video generation failed after {timeout} seconds")
+                if self._check_job(await openai_async_client.client.videos.retrieve(self._request_id)):
+                    content = await openai_async_client.client.videos.download_content(self._request_id)
+                    return self._content_result(content.read())
+                await self._async_wait(5)
+        finally:
+            self._discard_webhook()
 
     def run_video_gen(self, prompt: str, download_path: Optional[str] = None) -> VideoInfo:
-        if download_path is None:
-            unique_id = uuid.uuid4().hex[:8]
-            download_path = f"./output/videos/generated_video_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{unique_id}.mp4"
+        download_path = download_path or _default_download_path()
+        cached = self._resume_or_submit(prompt)
+        if cached:
+            return cached
+        return self._save_content(prompt, self.get_result(), download_path)
 
-        self.submit_request(prompt)
-        result = self.get_result()
-        logger.info("Video generation completed")
-
-        video_content = result["video"]["content"]
-        local_path = download_video(video_content, download_path)
-
-        return VideoInfo(
-            saved_path=local_path,
-            metadata={
-                "generated_at": datetime.now(),
-                "prompt": prompt,
-                "file_size": result["video"]["file_size"],
-            }
-        )
+    async def arun_video_gen(self, prompt: str, download_path: Optional[str] = None) -> VideoInfo:
+        download_path = download_path or _default_download_path()
+        cached = await self._aresume_or_submit(prompt)
+        if cached:
+            return cached
+        return self._save_content(prompt, await self.aget_result(), download_path)
 
 
 class GoogleVideoGenerator(BaseVideoGenerator):
-    def __init__(self, model: str = "veo-3.1-fast-generate-preview"):
-        super().__init__(model)
+    provider = "google"
+
+    def __init__(self, model: str = "veo-3.1-fast-generate-preview", journal: Optional[JobJournal] = None):
+        super().__init__(model, journal)
         self._operation = None
 
+    def _journal_request_id(self) -> Optional[str]:
+        return self._operation.name if self._operation else None
+
+    def _attach(self, request_id: str):
+        self._operation = types.GenerateVideosOperation(name=request_id)
+
     def submit_request(self, prompt: str):
         operation = google_client.client.models.generate_videos(
             model=self.model,
@@ -161,10 +554,31 @@ class GoogleVideoGenerator(BaseVideoGenerator):
         )
         self._operation = operation
 
+    async def asubmit_request(self, prompt: str):
+        self._operation = await google_async_client.client.models.generate_videos(model=self.model, prompt=prompt)
+
     def fetch_status(self) -> types.GenerateVideosOperation:
         operation = google_client.client.operations.get(self._operation)
         self._operation = operation
 
+    async def afetch_status(self) -> types.GenerateVideosOperation:
+        self._operation = await google_async_client.client.operations.get(self._operation)
+        return self._operation
+
+    def _check_operation(self) -> Optional[types.Video]:
+        """Log the polled operation and return its video once done; raises if it failed."""
+        logger.info(
+            f"Completion status:{self._operation.done is not None}")
+        self._emit("generating")
+        if self._operation.done:
+            self._journal_mark("completed")
+            return self._operation.response.generated_videos[0].video
+        elif self._operation.error:
+            self._journal_mark("failed", error=str(self._operation.error))
+            raise RuntimeError(
+                f"{self.__class__.__name__}: Video generation failed with error {self._operation.error}")
+        return None
+
     def get_result(self, timeout: int = 900):
         start_time = time.time()
         while True:
@@ -172,43 +586,39 @@ class GoogleVideoGenerator(BaseVideoGenerator):
                 raise TimeoutError(
                     f"{self.__class__.__name__}: Video generation failed after {timeout} seconds")
 
-            time.sleep(5)
+            self._wait(5)
 
             self.fetch_status()
-            logger.info(
-                f"Completion status:{self._operation.done is not None}")
-            if self._operation.done:
-                video = self._operation.response.generated_videos[0]
+            video = self._check_operation()
+            if video:
                 video_bytes = google_client.client.files.download(
-                    file=video.video)
-                return {
-                    "video": {
-                        "content": video_bytes,
-                        "file_size": len(video_bytes),
-                    },
-                    "seed": None
-                }
-            elif self._operation.error:
-                raise RuntimeError(
-                    f"{self.__class__.__name__}: Video generation failed with error {self._operation.error}")
-
-    def run_video_gen(self, prompt: str, download_path: Optional[str] = None) -> VideoInfo:
-        if download_path is None:
-            unique_id = uuid.uuid4().hex[:8]
-            download_path = f"./output/videos/generated_video_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{unique_id}.mp4"
+                    file=video)
+                return self._content_result(video_bytes)
 
-        self.submit_request(prompt)
-        result = self.get_result()
-        logger.info("Video generation completed")
+    async def aget_result(self, timeout: int = 900):
+        """Async get_result; long-running operations have no status stream, so this polls."""
+        start_time = time.time()
+        while True:
+            if time.time() - start_time > timeout:
+                raise TimeoutError(
+                    f"{self.__class__.__name__}: Video generation failed after {timeout} seconds")
+            await self._async_wait(5)
+            await self.afetch_status()
+            video = self._check_operation()
+            if video:
+                video_bytes = await google_async_client.client.files.download(file=video)
+                return self._content_result(video_bytes)
 
-        video_content = result["video"]["content"]
-        local_path = download_video(video_content, download_path)
+    def run_video_gen(self, prompt: str, download_path: Optional[str] = None) -> VideoInfo:
+        download_path = download_path or _default_download_path()
+        cached = self._resume_or_submit(prompt)
+        if cached:
+            return cached
+        return self._save_content(prompt, self.get_result(), download_path)
 
-        return VideoInfo(
-            saved_path=local_path,
-            metadata={
-                "generated_at": datetime.now(),
-                "prompt": prompt,
-                "file_size": result["video"]["file_size"],
-            }
-        )
+    async def arun_video_gen(self, prompt: str, download_path: Optional[str] = None) -> VideoInfo:
+        download_path = download_path or _default_download_path()
+        cached = await self._aresume_or_submit(prompt)
+        if cached:
+            return cached
+        return self._save_content(prompt, await self.aget_result(), download_path)
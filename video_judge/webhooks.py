@@ -0,0 +1,163 @@
+"""Local HTTP receiver for provider completion webhooks.
+
+Instead of polling a job every few seconds, a generator registers a callback
+URL when it submits, then waits on a future that resolves as soon as the
+provider calls back. Polling continues at a much longer fallback interval,
+so a lost or undeliverable webhook only delays a result.
+
+Routes:
+
+- POST /webhooks/{token}: fal-style callback to a per-job URL. The token is
+  random and unguessable, so the payload (which carries the result) is
+  trusted.
+- POST /webhooks/openai: OpenAI's project-level webhook endpoint
+  (``video.completed`` / ``video.failed`` events), keyed by ``data.id``.
+  Events are only used as a wake-up; the job status is then re-read
+  from the API.
+
+Providers must be able to reach the receiver: pass ``public_url`` (or set
+VIDEO_JUDGE_WEBHOOK_URL) to the tunnel or ingress that forwards to it.
+
+Usage:
+    with WebhookReceiver(public_url="https://my-tunnel.example") as webhooks:
+        arena = VideoGenArena(model_configs=configs, judge=judge, webhooks=webhooks)
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+from video_judge.config.logger import logger
+
+OPENAI_ROUTE = "openai"
+
+
+class WebhookReceiver:
+    """Threaded HTTP server resolving one future per expected callback.
+
+    Args:
+        host: Interface to bind (default loopback)
+        port: Port to bind, 0 picks a free port
+        public_url: URL providers should call (defaults to VIDEO_JUDGE_WEBHOOK_URL, then the bound address)
+        early_ttl_s: How long a callback nobody expects yet is kept for a later expect()
+        max_early: Most such callbacks kept at once; the oldest are dropped first
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, public_url: Optional[str] = None,
+                 early_ttl_s: float = 300.0, max_early: int = 256):
+        self.public_url = (public_url or os.getenv("VIDEO_JUDGE_WEBHOOK_URL") or "").rstrip("/") or None
+        self._lock = threading.Lock()
+        self.early_ttl_s = early_ttl_s
+        self.max_early = max_early
+        self._futures: Dict[str, Future] = {}
+        self._early: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.received = 0  # callbacks accepted, expected or not
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "WebhookReceiver":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Webhook receiver listening on {self.url}")
+        return self
+
+    def stop(self):
+        if self._thread:
+            self._httpd.shutdown()
+            self._thread.join()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "WebhookReceiver":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def new_token(self) -> str:
+        """A fresh per-job token for callback_url()."""
+        return uuid.uuid4().hex
+
+    def callback_url(self, key: str) -> str:
+        return f"{self.public_url or self.url}/webhooks/{key}"
+
+    def expect(self, key: str) -> Future:
+        """Future resolved with the JSON body of the callback for key.
+
+        A callback that arrived shortly before expect() (within early_ttl_s) is
+        kept, so the future is already resolved in that case. Call discard()
+        once the job is over.
+        """
+        with self._lock:
+            if key not in self._futures:
+                self._futures[key] = Future()
+                early = self._early.pop(key, None)
+                if early is not None and time.monotonic() - early[0] <= self.early_ttl_s:
+                    self._futures[key].set_result(early[1])
+            return self._futures[key]
+
+    def discard(self, key: str):
+        with self._lock:
+            self._futures.pop(key, None)
+            self._early.pop(key, None)
+
+    def _prune_early(self):
+        cutoff = time.monotonic() - self.early_ttl_s
+        while self._early and (next(iter(self._early.values()))[0] < cutoff or len(self._early) > self.max_early):
+            self._early.popitem(last=False)
+
+    def _resolve(self, key: str, payload: Any):
+        with self._lock:
+            self.received += 1
+            future = self._futures.get(key)
+            if future is None:
+                # Unexpected (or not yet expected) callback: keep it briefly, within a size cap
+                self._early[key] = (time.monotonic(), payload)
+                self._early.move_to_end(key)
+                self._prune_early()
+                return
+        if not future.done():
+            future.set_result(payload)
+
+    def _make_handler(self):
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                logger.debug(f"webhooks: {format % args}")
+
+            def _send(self, status: int):
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                parts = self.path.split("?")[0].strip("/").split("/")
+                if len(parts) != 2 or parts[0] != "webhooks":
+                    self._send(404)
+                    return
+                try:
+                    payload = json.loads(raw or b"{}")
+                    key = payload["data"]["id"] if parts[1] == OPENAI_ROUTE else parts[1]
+                except (ValueError, KeyError, TypeError):
+                    self._send(400)
+                    return
+                receiver._resolve(key, payload)
+                self._send(200)
+
+        return Handler